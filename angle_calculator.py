@@ -2,15 +2,15 @@
 Angle Calculation Utility
 Mathematical functions for angle calculation and smoothing
 """
-import numpy as np
-from collections import deque
+from angle_engine import scalar_angle
+from filters import MovingAverage
 
 class AngleCalculator:
     """Utility class for angle calculations with smoothing"""
     
     def __init__(self, window_size=5):
         self.window_size = window_size
-        self.angle_history = deque(maxlen=window_size)
+        self.angle_filter = MovingAverage(window_size)
     
     @staticmethod
     def calculate_angle(a, b, c):
@@ -22,35 +22,22 @@ class AngleCalculator:
             a, b, c: Points with x, y, z attributes
             
         Returns:
-            float: Angle in degrees
+            float: Angle in degrees (NaN if A or C coincides with B)
         """
-        # Convert to vectors
-        ba = np.array([a.x - b.x, a.y - b.y])
-        bc = np.array([c.x - b.x, c.y - b.y])
-        
-        # Calculate cosine of angle
-        cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc))
-        
-        # Ensure value is within valid range for arccos
-        cosine_angle = np.clip(cosine_angle, -1.0, 1.0)
-        
-        # Calculate angle in radians and convert to degrees
-        angle = np.degrees(np.arccos(cosine_angle))
-        
-        return angle
+        # Plain float math: per-call NumPy arrays cost more than the angle itself
+        return scalar_angle(a.x, a.y, b.x, b.y, c.x, c.y)
     
     def add_angle(self, angle):
         """Add new angle to history for smoothing"""
-        self.angle_history.append(angle)
-        return self.get_smoothed_angle()
+        return self.angle_filter.update(angle)
     
     def get_smoothed_angle(self):
         """Get smoothed angle using moving average"""
-        if len(self.angle_history) == 0:
+        if self.angle_filter.value is None:
             return 0
         
-        return np.mean(self.angle_history)
+        return self.angle_filter.value
     
     def reset(self):
         """Reset angle history"""
-        self.angle_history.clear()
\ No newline at end of file
+        self.angle_filter.reset()
\ No newline at end of file
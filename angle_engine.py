@@ -0,0 +1,154 @@
+"""
+Angle Engine
+Joint angles from landmark arrays: vectorized per exercise, or one at a time
+"""
+import math
+
+import numpy as np
+from exercises import EXERCISE_ALIASES, EXERCISE_ANGLES
+from pose_landmarks import VISIBILITY, X, Y
+
+MIN_VISIBILITY = 0.3
+
+# Landmark spaces an exercise can measure in (EXERCISE_ANGLES "angle_space")
+IMAGE_SPACE = "image"  # normalized image x, y: depends on camera placement
+WORLD_SPACE = "world"  # metric x, y, z from pose_world_landmarks
+
+
+def scalar_angle(ax, ay, bx, by, cx, cy):
+    """
+    Angle ABC in degrees, with B as the vertex, using only the math module
+
+    For single angles this avoids building NumPy arrays, which costs more
+    than the arithmetic itself.
+
+    Returns:
+        float: Angle in [0, 180], or NaN if A or C coincides with B
+    """
+    bax, bay = ax - bx, ay - by
+    bcx, bcy = cx - bx, cy - by
+    if (bax == 0.0 and bay == 0.0) or (bcx == 0.0 and bcy == 0.0):
+        return math.nan
+    # atan2 of |cross| and dot equals acos of the normalized dot, without clipping
+    return math.degrees(math.atan2(abs(bax * bcy - bay * bcx), bax * bcx + bay * bcy))
+
+
+def scalar_angle_3d(a, b, c):
+    """
+    Angle ABC in degrees between 3D points given as (x, y, z) sequences
+
+    Returns:
+        float: Angle in [0, 180], or NaN if A or C coincides with B
+    """
+    bax, bay, baz = a[0] - b[0], a[1] - b[1], a[2] - b[2]
+    bcx, bcy, bcz = c[0] - b[0], c[1] - b[1], c[2] - b[2]
+    cross = math.sqrt((bay * bcz - baz * bcy) ** 2 + (baz * bcx - bax * bcz) ** 2
+                      + (bax * bcy - bay * bcx) ** 2)
+    dot = bax * bcx + bay * bcy + baz * bcz
+    if cross == 0.0 and dot == 0.0:
+        return math.nan
+    return math.degrees(math.atan2(cross, dot))
+
+
+def joint_angles(landmarks, triplets, min_visibility=MIN_VISIBILITY, dims=2):
+    """
+    Angles for many joint triplets in one vectorized pass
+
+    Args:
+        landmarks (np.ndarray): (33, 4) landmarks, or (..., 33, 4) for many frames
+        triplets (np.ndarray): (N, 3) int landmark indices (A, B vertex, C)
+        min_visibility (float): Angles with any point below this are NaN
+        dims (int): 2 for x, y (image landmarks) or 3 for x, y, z (world landmarks)
+
+    Returns:
+        np.ndarray: (..., N) angles in degrees, NaN where unmeasurable
+    """
+    points = landmarks[..., triplets, :]  # (..., N, 3, 4)
+
+    # BA and BC in one subtraction: points A and C minus vertex B
+    vectors = points[..., ::2, X:X + dims] - points[..., 1:2, X:X + dims]
+    ba = vectors[..., 0, :]
+    bc = vectors[..., 1, :]
+    if dims == 2:
+        cross = ba[..., X] * bc[..., Y] - ba[..., Y] * bc[..., X]
+    else:
+        cross = np.linalg.norm(np.cross(ba, bc), axis=-1)
+    dot = (ba * bc).sum(axis=-1)
+    angles = np.degrees(np.arctan2(np.abs(cross), dot))
+
+    # |cross|^2 + dot^2 = |BA|^2 |BC|^2, so both are zero only for a zero-length side
+    invalid = (points[..., VISIBILITY].min(axis=-1) < min_visibility) | ((cross == 0) & (dot == 0))
+    angles[invalid] = np.nan
+    return angles
+
+
+class AngleTable:
+    """Precompiled joint triplets for one exercise
+
+    Every entry of the exercise's "landmarks" mapping ("left", "right",
+    and any extra named rules) becomes one row of an index table, so all
+    of an exercise's angles come out of a single joint_angles() call.
+    Exercises with "angle_space": "world" are measured in 3D on world
+    landmarks; see select_landmarks() for choosing the input array.
+    """
+
+    def __init__(self, names, triplets, space=IMAGE_SPACE):
+        if space not in (IMAGE_SPACE, WORLD_SPACE):
+            raise ValueError(f"Unknown angle space: {space}")
+        self.names = tuple(names)
+        self.triplets = np.asarray(triplets, dtype=np.intp).reshape(-1, 3)
+        self.positions = {name: i for i, name in enumerate(self.names)}
+        self.space = space
+
+    @classmethod
+    def from_rules(cls, rules):
+        """Table for an EXERCISE_ANGLES entry"""
+        landmarks = rules["landmarks"]
+        return cls(landmarks.keys(), [landmarks[name] for name in landmarks],
+                   rules.get("angle_space", IMAGE_SPACE))
+
+    def select_landmarks(self, landmarks, world_landmarks):
+        """
+        Input array and dimensions for this table
+
+        World-space tables fall back to 2D image angles when no world
+        landmarks are available (older MediaPipe, or recorded traces).
+
+        Returns:
+            tuple: (landmarks to measure, dims for joint_angles)
+        """
+        if self.space == WORLD_SPACE and world_landmarks is not None:
+            return world_landmarks, 3
+        return landmarks, 2
+
+    def compute(self, landmarks, min_visibility=MIN_VISIBILITY, world_landmarks=None):
+        """(..., N) angles in table order; see joint_angles()"""
+        landmarks, dims = self.select_landmarks(landmarks, world_landmarks)
+        return joint_angles(landmarks, self.triplets, min_visibility, dims)
+
+    def angle(self, landmarks, name, min_visibility=MIN_VISIBILITY, world_landmarks=None):
+        """
+        One named angle through the scalar path
+
+        Returns:
+            float: Angle in degrees, or None when it cannot be measured
+        """
+        landmarks, dims = self.select_landmarks(landmarks, world_landmarks)
+        a, b, c = (landmarks[i].tolist() for i in self.triplets[self.positions[name]])
+        if a[VISIBILITY] < min_visibility or b[VISIBILITY] < min_visibility \
+                or c[VISIBILITY] < min_visibility:
+            return None
+        if dims == 3:
+            angle = scalar_angle_3d(a, b, c)
+        else:
+            angle = scalar_angle(a[X], a[Y], b[X], b[Y], c[X], c[Y])
+        return None if math.isnan(angle) else angle
+
+
+# Compiled once at import; exercises are static configuration
+ANGLE_TABLES = {name: AngleTable.from_rules(rules) for name, rules in EXERCISE_ANGLES.items()}
+
+
+def get_angle_table(exercise_name):
+    """Precompiled AngleTable for an exercise or UI alias, or None if it is unknown"""
+    return ANGLE_TABLES.get(EXERCISE_ALIASES.get(exercise_name, exercise_name))
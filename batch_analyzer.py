@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+FitPose Batch Analyzer
+Re-scores recorded workout videos offline across a process pool
+
+Usage:
+    python batch_analyzer.py --exercise "Chest Press" --output-dir results videos/*.mp4
+
+For every video this writes <name>.angles.csv (per-frame angles) and
+<name>.reps.json (rep boundaries, per-rep tempo and a summary), plus
+<name>.fptrace landmark traces with --save-traces. <name> is the video's
+file name, or its path below the videos' common directory (separators
+replaced by "__") when several videos share a file name. All timing uses
+the video's own frame timestamps, never wall-clock time.
+"""
+import argparse
+import csv
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import config
+import cv2
+from camera_manager import CameraManager, VideoFileSource
+from exercises import validate_angle
+from landmark_trace import TraceRecorder
+from pose_estimator import PoseEstimator
+from posture_monitor import PostureMonitor
+
+CSV_COLUMNS = ["frame", "timestamp", "left_angle", "right_angle", "angle", "in_target",
+               "posture_correct", "reps"]
+
+
+def _round(value, digits=2):
+    return "" if value is None else round(float(value), digits)
+
+
+def output_names(paths):
+    """
+    Unique output file stem per video
+
+    Videos keep their file name without extension; videos sharing one are
+    named by their path below the common directory instead.
+
+    Args:
+        paths (list): Distinct video paths
+
+    Returns:
+        dict: Output stem per path
+
+    Raises:
+        ValueError: If two paths still map to the same stem
+    """
+    stems = {path: os.path.splitext(os.path.basename(path))[0] for path in paths}
+    counts = {}
+    for stem in stems.values():
+        counts[stem] = counts.get(stem, 0) + 1
+
+    clashing = [path for path, stem in stems.items() if counts[stem] > 1]
+    if clashing:
+        root = os.path.commonpath([os.path.abspath(path) for path in clashing])
+        for path in clashing:
+            relative = os.path.splitext(os.path.relpath(os.path.abspath(path), root))[0]
+            stems[path] = relative.replace(os.sep, "__")
+
+    seen = {}
+    for path, stem in stems.items():
+        if stem in seen:
+            raise ValueError(f"{seen[stem]} and {path} would write the same output files")
+        seen[stem] = path
+    return stems
+
+
+def analyze_video(path, exercise, output_dir, save_trace=False, name=None):
+    """
+    Run pose and the exercise rules over every frame of one video
+
+    Runs inside a pool worker, so MediaPipe is loaded in-process and
+    OpenCV is kept to one thread to avoid oversubscribing the cores.
+
+    Args:
+        name (str): Output file stem; defaults to the video's file name
+
+    Returns:
+        dict: Per-video summary (also written to <name>.reps.json)
+    """
+    cv2.setNumThreads(1)
+
+    if name is None:
+        name = os.path.splitext(os.path.basename(path))[0]
+    angles_path = os.path.join(output_dir, f"{name}.angles.csv")
+    reps_path = os.path.join(output_dir, f"{name}.reps.json")
+
+    reps = []
+    tempo = []
+    first_angle_time = [None]
+
+    def on_event(event):
+        if event["event"] == "rep":
+            start = reps[-1]["end"] if reps else first_angle_time[0]
+            reps.append({"rep": event["reps"], "start": start,
+                         "top": event["top"], "end": event["timestamp"]})
+        elif event["event"] == "tempo":
+            tempo.append({key: value for key, value in event.items()
+                          if key not in ("event", "exercise", "timestamp")})
+
+    # Same landmark and angle smoothing as the live and headless paths, so
+    # re-scored sessions reproduce their reps and tempo; pool workers are
+    # daemonic and cannot start a pose worker process of their own
+    monitor = PostureMonitor(exercise, smoothing_window=config.ANGLE_SMOOTHING_WINDOW,
+                             on_event=on_event)
+    estimator = PoseEstimator.from_config(use_worker=False)
+    camera = CameraManager(VideoFileSource(path), paced=False)
+    if not camera.open():
+        return {"video": path, "error": "Cannot open video"}
+
+    recorder = None
+    if save_trace:
+        recorder = TraceRecorder(os.path.join(output_dir, f"{name}.fptrace"),
+                                 metadata={"exercise": exercise, "source": path})
+
+    estimator.start()
+    started = time.monotonic()
+    frames = 0
+    duration = 0.0
+
+    try:
+        with open(angles_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_COLUMNS)
+
+            while True:
+                frame = camera.read()
+                if frame is None:
+                    break
+
+                landmarks = estimator.estimate(frame.image, frame.timestamp)
+                angle = monitor.process_landmarks(landmarks, frame.timestamp,
+                                                  estimator.world_landmarks)
+                if recorder:
+                    recorder.append(frame.timestamp, landmarks)
+                if angle is not None and first_angle_time[0] is None:
+                    first_angle_time[0] = round(frame.timestamp, 3)
+
+                in_target = ""
+                if angle is not None:
+                    in_target = int(validate_angle(exercise, angle)[0])
+
+                left_angle, right_angle = monitor.side_angles
+                writer.writerow([frames, round(frame.timestamp, 3), _round(left_angle),
+                                 _round(right_angle), _round(angle), in_target,
+                                 int(monitor.posture_correct), monitor.rep_count])
+                frames += 1
+                duration = frame.timestamp
+    finally:
+        camera.stop()
+        estimator.stop()
+        if recorder:
+            recorder.close()
+
+    elapsed = time.monotonic() - started
+    summary = {
+        "video": path,
+        "exercise": exercise,
+        "frames": frames,
+        "video_seconds": round(duration, 3),
+        "processing_seconds": round(elapsed, 3),
+        "realtime_factor": round(duration / elapsed, 2) if elapsed > 0 else 0.0,
+        "reps": reps,
+        "tempo": tempo,
+    }
+    with open(reps_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+
+def analyze_videos(paths, exercise, output_dir, workers=None, save_traces=False):
+    """
+    Analyze many videos in parallel, one video per worker process
+
+    Yields:
+        dict: Each video's summary as it finishes
+    """
+    # The same video listed twice is analyzed once
+    paths = list(dict.fromkeys(os.path.normpath(path) for path in paths))
+    names = output_names(paths)
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    # Spawned workers start clean instead of inheriting MediaPipe state
+    context = mp.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {pool.submit(analyze_video, path, exercise, output_dir, save_traces,
+                               names[path]): path
+                   for path in paths}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                yield {"video": futures[future], "error": str(e)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FitPose offline batch analyzer")
+    parser.add_argument("videos", nargs="+", help="Video files to analyze")
+    parser.add_argument("--exercise", default="Chest Press",
+                        help="Exercise performed in the videos (default: Chest Press)")
+    parser.add_argument("--output-dir", default="analysis",
+                        help="Directory for the per-video CSV and JSON files")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--save-traces", action="store_true",
+                        help="Also record each video's landmarks as a .fptrace for replay")
+    args = parser.parse_args(argv)
+
+    if not PoseEstimator().available:
+        print("✗ MediaPipe is required for batch analysis", file=sys.stderr)
+        return 1
+
+    try:
+        output_names(list(dict.fromkeys(os.path.normpath(path) for path in args.videos)))
+    except ValueError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+
+    started = time.monotonic()
+    failures = 0
+    for summary in analyze_videos(args.videos, args.exercise, args.output_dir, args.workers,
+                                  args.save_traces):
+        if "error" in summary:
+            failures += 1
+            print(f"✗ {summary['video']}: {summary['error']}")
+        else:
+            print(f"✓ {summary['video']}: {summary['frames']} frames, "
+                  f"{len(summary['reps'])} reps, {summary['realtime_factor']}x real time")
+
+    print(f"✓ Analyzed {len(args.videos)} videos in {time.monotonic() - started:.1f}s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Angle engine micro-benchmark
+
+Compares the previous per-angle NumPy implementation (two short arrays,
+dot, two norms and arccos per call) with angle_engine's scalar path, its
+per-frame vectorized table, and a whole recording at once.
+
+Usage:
+    python benchmarks/bench_angles.py [--calls 20000] [--frames 10000]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from angle_engine import ANGLE_TABLES, AngleTable, get_angle_table
+
+
+def legacy_angle(a, b, c):
+    """The implementation previously in AngleCalculator and PostureMonitor"""
+    ba = np.array([a[0] - b[0], a[1] - b[1]])
+    bc = np.array([c[0] - b[0], c[1] - b[1]])
+    cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc))
+    cosine_angle = np.clip(cosine_angle, -1.0, 1.0)
+    return np.degrees(np.arccos(cosine_angle))
+
+
+def report(name, seconds, calls, unit="frame"):
+    print(f"{name:<34} {seconds / calls * 1e6:9.2f} us/{unit}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Angle engine benchmark")
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--frames", type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    landmarks = rng.random((33, 4)).astype(np.float32)
+    landmarks[:, 3] = 0.9
+    recording = rng.random((args.frames, 33, 4)).astype(np.float32)
+    recording[..., 3] = 0.9
+
+    table = get_angle_table("Chest Press")
+    left, right = table.triplets
+    all_triplets = np.concatenate([t.triplets for t in ANGLE_TABLES.values()])
+    all_table = AngleTable([str(i) for i in range(len(all_triplets))], all_triplets)
+
+    print(f"Chest Press (2 angles) per frame, {args.calls} calls")
+    report("legacy numpy, one call per side",
+           timeit.timeit(lambda: (legacy_angle(*landmarks[left]), legacy_angle(*landmarks[right])),
+                         number=args.calls), args.calls)
+    report("scalar math path, one per side",
+           timeit.timeit(lambda: (table.angle(landmarks, "left"), table.angle(landmarks, "right")),
+                         number=args.calls), args.calls)
+    report("vectorized table",
+           timeit.timeit(lambda: table.compute(landmarks), number=args.calls), args.calls)
+
+    print(f"All exercises ({len(all_triplets)} angles) per frame")
+    report("legacy numpy, one call per angle",
+           timeit.timeit(lambda: [legacy_angle(*landmarks[t]) for t in all_triplets],
+                         number=args.calls // 10), args.calls // 10)
+    report("vectorized table",
+           timeit.timeit(lambda: all_table.compute(landmarks), number=args.calls), args.calls)
+
+    print(f"Chest Press over a {args.frames}-frame recording")
+    report("vectorized table, whole recording",
+           timeit.timeit(lambda: table.compute(recording), number=10), 10 * args.frames)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Angle filter benchmark: per-sample cost, residual noise and lag
+
+A synthetic rep signal (an angle swinging between 90 and 170 degrees)
+with Gaussian measurement noise is fed through each filter at 30 fps.
+Reported per filter:
+
+    us/sample   update() cost
+    noise       RMS deviation from the clean signal after removing lag
+    lag         delay (ms) that best aligns the output with the clean signal
+
+The previous list-based moving average (append + pop(0) + sum/len) and
+the deque + np.mean of AngleCalculator are included for reference.
+
+Finally the whole-skeleton LandmarkOneEuro bank is timed against 99
+scalar OneEuroFilter instances doing the same work.
+
+Usage:
+    python benchmarks/bench_filters.py [--seconds 60] [--noise 3] [--rep-seconds 2]
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from filters import LandmarkOneEuro, OneEuroFilter, create_filter
+
+FPS = 30.0
+
+FILTERS = {
+    "moving_average(8)": {"type": "moving_average", "window": 8},
+    "ema(0.3)": {"type": "ema", "alpha": 0.3},
+    "one_euro": {"type": "one_euro"},
+    "kalman": {"type": "kalman"},
+}
+
+
+class ListAverage:
+    """The PostureMonitor smoothing this module replaced"""
+
+    def __init__(self, window=8):
+        self.buffer = []
+        self.window = window
+
+    def update(self, value, timestamp=None):
+        self.buffer.append(value)
+        if len(self.buffer) > self.window:
+            self.buffer.pop(0)
+        return sum(self.buffer) / len(self.buffer)
+
+
+class DequeMean:
+    """The AngleCalculator smoothing this module replaced"""
+
+    def __init__(self, window=8):
+        self.history = deque(maxlen=window)
+
+    def update(self, value, timestamp=None):
+        self.history.append(value)
+        return np.mean(self.history)
+
+
+def make_signal(seconds, noise, rep_seconds, seed=0):
+    timestamps = np.arange(int(seconds * FPS)) / FPS
+    clean = 130 - 40 * np.cos(2 * np.pi * timestamps / rep_seconds)
+    noisy = clean + np.random.default_rng(seed).normal(0, noise, clean.shape)
+    return timestamps, clean, noisy
+
+
+def measure(filt, timestamps, clean, noisy):
+    samples = noisy.tolist()
+    times = timestamps.tolist()
+    update = filt.update
+
+    started = time.perf_counter()
+    output = [update(v, t) for v, t in zip(samples, times)]
+    cost = (time.perf_counter() - started) / len(samples)
+
+    # Lag: the shift (in frames) that minimizes the error against the clean signal
+    output = np.asarray(output, dtype=np.float64)
+    warmup = int(FPS)
+    best_shift, best_rms = 0, float("inf")
+    for shift in range(0, int(FPS / 2)):
+        error = output[warmup + shift:] - clean[warmup:len(clean) - shift]
+        rms = float(np.sqrt(np.mean(error ** 2)))
+        if rms < best_rms:
+            best_shift, best_rms = shift, rms
+    return cost, best_rms, best_shift / FPS
+
+
+def measure_landmarks(frames=300, seed=0):
+    """us/frame for the landmark filter bank and for 99 scalar filters"""
+    rng = np.random.default_rng(seed)
+    sequence = rng.random((frames, 33, 4)).astype(np.float32)
+    timestamps = (np.arange(frames) / FPS).tolist()
+
+    bank = LandmarkOneEuro()
+    started = time.perf_counter()
+    for landmarks, t in zip(sequence, timestamps):
+        bank.update(landmarks, t)
+    vectorized = (time.perf_counter() - started) / frames
+
+    scalars = [OneEuroFilter(beta=bank.beta) for _ in range(33 * 3)]
+    started = time.perf_counter()
+    for landmarks, t in zip(sequence, timestamps):
+        smoothed = landmarks.copy()
+        values = landmarks[:, :3].ravel().tolist()
+        smoothed[:, :3] = np.reshape([f.update(v, t) for f, v in zip(scalars, values)], (33, 3))
+    scalar = (time.perf_counter() - started) / frames
+    return vectorized, scalar
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Angle filter benchmark")
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--noise", type=float, default=3.0, help="Noise std dev in degrees")
+    parser.add_argument("--rep-seconds", type=float, default=2.0, help="Seconds per rep")
+    args = parser.parse_args(argv)
+
+    timestamps, clean, noisy = make_signal(args.seconds, args.noise, args.rep_seconds)
+    raw_rms = float(np.sqrt(np.mean((noisy - clean) ** 2)))
+    print(f"{len(clean)} samples at {FPS:.0f} fps, raw noise {raw_rms:.2f} deg RMS")
+    print(f"{'filter':<22} {'us/sample':>10} {'noise':>8} {'lag ms':>8}")
+
+    candidates = [("list pop(0) avg(8)", ListAverage()), ("deque np.mean(8)", DequeMean())]
+    candidates += [(name, create_filter(spec)) for name, spec in FILTERS.items()]
+    for name, filt in candidates:
+        cost, rms, lag = measure(filt, timestamps, clean, noisy)
+        print(f"{name:<22} {cost * 1e6:10.2f} {rms:8.2f} {lag * 1000:8.0f}")
+
+    vectorized, scalar = measure_landmarks()
+    print("33 landmarks x (x, y, z) per frame")
+    print(f"{'LandmarkOneEuro':<22} {vectorized * 1e6:10.2f} us/frame")
+    print(f"{'99 x OneEuroFilter':<22} {scalar * 1e6:10.2f} us/frame")
+
+
+if __name__ == "__main__":
+    main()
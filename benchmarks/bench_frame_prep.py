@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Frame preparation micro-benchmark
+
+Compares the old per-frame path (flip, BGR->RGB for inference, BGR->RGB
+again for display, resize - each allocating a new array) with
+FramePreparer plus FrameDisplay-style resize_into on preallocated buffers.
+
+Usage:
+    python benchmarks/bench_frame_prep.py [--frames 500] [--display 960x720]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+import numpy as np
+from frame_prep import FramePreparer, resize_into
+
+
+def old_path(frame, display_size):
+    frame = cv2.flip(frame, 1)
+    rgb_for_pose = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    rgb_for_display = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    return rgb_for_pose, cv2.resize(rgb_for_display, display_size)
+
+
+def make_new_path(display_size):
+    preparer = FramePreparer()
+    display = np.empty((display_size[1], display_size[0], 3), np.uint8)
+
+    def new_path(frame, _display_size):
+        rgb = preparer.prepare(frame)
+        return rgb, resize_into(rgb, display)
+
+    return new_path
+
+
+def measure(name, path, frames, display_size, count):
+    # Warm up so one-time buffer allocation is not counted per frame
+    for frame in frames[:4]:
+        path(frame, display_size)
+
+    started = time.perf_counter()
+    for i in range(count):
+        path(frames[i % len(frames)], display_size)
+    elapsed = time.perf_counter() - started
+
+    # Allocation is measured separately; tracemalloc slows everything down
+    tracemalloc.start()
+    allocated = 0
+    for i in range(count):
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        path(frames[i % len(frames)], display_size)
+        allocated += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+
+    print(f"{name:<10} {elapsed / count * 1e6:8.1f} us/frame  "
+          f"{allocated / count / 1024:10.1f} KiB allocated/frame")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Frame preparation benchmark")
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--display", default="960x720", help="Display size WxH")
+    args = parser.parse_args(argv)
+
+    display_size = tuple(int(v) for v in args.display.split("x"))
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, (480, 640, 3), dtype=np.uint8) for _ in range(8)]
+
+    print(f"640x480 capture -> {display_size[0]}x{display_size[1]} display, {args.frames} frames")
+    measure("old", old_path, frames, display_size, args.frames)
+    measure("prepared", make_new_path(display_size), frames, display_size, args.frames)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Landmark conversion micro-benchmark
+
+Compares reading MediaPipe landmarks through attribute access wherever
+they are needed (as the angle and drawing code once did) with converting
+each frame once into a (33, 4) float32 array. Uses MediaPipe's protobuf
+messages when installed, an equivalent message built with protobuf
+alone otherwise, and plain objects as a last resort.
+
+Usage:
+    python benchmarks/bench_landmark_conversion.py [--calls 20000]
+"""
+import argparse
+import os
+import sys
+import timeit
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from pose_landmarks import NUM_LANDMARKS, landmarks_to_array
+
+SIDES = ((11, 13, 15), (12, 14, 16))
+CONNECTIONS = ((11, 13), (13, 15), (12, 14), (14, 16))
+JOINTS = (11, 12, 13, 14, 15, 16)
+
+
+class _Landmark:
+    __slots__ = ("x", "y", "z", "visibility")
+
+    def __init__(self, x, y, z, visibility):
+        self.x, self.y, self.z, self.visibility = x, y, z, visibility
+
+
+def _landmark_list_class():
+    """NormalizedLandmarkList from MediaPipe, or the same proto2 schema built here"""
+    try:
+        from mediapipe.framework.formats import landmark_pb2
+        return landmark_pb2.NormalizedLandmarkList, "MediaPipe protobuf"
+    except ImportError:
+        pass
+
+    from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+    field = descriptor_pb2.FieldDescriptorProto
+    proto = descriptor_pb2.FileDescriptorProto(name="bench_landmark.proto", package="bench")
+    landmark = proto.message_type.add(name="NormalizedLandmark")
+    for number, name in enumerate(("x", "y", "z", "visibility"), 1):
+        landmark.field.add(name=name, number=number, type=field.TYPE_FLOAT,
+                           label=field.LABEL_OPTIONAL)
+    landmark_list = proto.message_type.add(name="NormalizedLandmarkList")
+    landmark_list.field.add(name="landmark", number=1, type=field.TYPE_MESSAGE,
+                            type_name=".bench.NormalizedLandmark", label=field.LABEL_REPEATED)
+
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(proto)
+    descriptor = pool.FindMessageTypeByName("bench.NormalizedLandmarkList")
+    return message_factory.GetMessageClass(descriptor), "protobuf"
+
+
+def make_landmarks():
+    """A 33-landmark list as protobuf when possible, plain objects otherwise"""
+    rng = np.random.default_rng(0)
+    values = rng.random((NUM_LANDMARKS, 4)).astype(np.float32).tolist()
+    try:
+        message_class, kind = _landmark_list_class()
+    except ImportError:
+        return SimpleNamespace(landmark=[_Landmark(*v) for v in values]), "plain objects"
+
+    message = message_class()
+    for x, y, z, visibility in values:
+        message.landmark.add(x=x, y=y, z=z, visibility=visibility)
+    return message, kind
+
+
+def attribute_access(pose_landmarks, w=640, h=480):
+    """Per-frame field reads of the old angle and joint-drawing code"""
+    landmark = pose_landmarks.landmark
+    for a, b, c in SIDES:
+        if min(landmark[a].visibility, landmark[b].visibility, landmark[c].visibility) >= 0.3:
+            (landmark[a].x - landmark[b].x, landmark[a].y - landmark[b].y,
+             landmark[c].x - landmark[b].x, landmark[c].y - landmark[b].y)
+    for start, end in CONNECTIONS:
+        (int(landmark[start].x * w), int(landmark[start].y * h),
+         int(landmark[end].x * w), int(landmark[end].y * h))
+    for idx in JOINTS:
+        (int(landmark[idx].x * w), int(landmark[idx].y * h))
+
+
+def tuple_array(pose_landmarks):
+    """The previous conversion: a list of tuples handed to np.array"""
+    return np.array([(lm.x, lm.y, lm.z, lm.visibility) for lm in pose_landmarks.landmark],
+                    dtype=np.float32)
+
+
+def report(name, seconds, calls):
+    print(f"{name:<36} {seconds / calls * 1e6:8.2f} us/frame")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Landmark conversion benchmark")
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    pose_landmarks, kind = make_landmarks()
+    assert np.array_equal(landmarks_to_array(pose_landmarks), tuple_array(pose_landmarks))
+
+    print(f"{NUM_LANDMARKS} landmarks as {kind}, {args.calls} frames")
+    report("attribute access at every use", timeit.timeit(
+        lambda: attribute_access(pose_landmarks), number=args.calls), args.calls)
+    report("np.array of tuples", timeit.timeit(
+        lambda: tuple_array(pose_landmarks), number=args.calls), args.calls)
+    report("landmarks_to_array", timeit.timeit(
+        lambda: landmarks_to_array(pose_landmarks), number=args.calls), args.calls)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Rep engine throughput: simulated sessions per second for every machine
+
+Each session is a noisy angle trace of `--reps` reps sampled at 30 fps:
+the joint travels from the exercise's return angle to the middle of its
+target range, holds there, and travels back. The engine must count every
+rep (the exit status is 1 otherwise); throughput is reported per machine
+and for the full RepEngine.update loop.
+
+Usage:
+    python benchmarks/bench_rep_engine.py [--sessions 200] [--reps 10] [--noise 2]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from exercises import REP_PROGRAMS, RepEngine
+
+FPS = 30.0
+
+
+def make_session(program, reps, noise, rng, move_seconds=1.0, hold_seconds=1.2):
+    """Angles and timestamps for `reps` reps of one exercise"""
+    return_progress, _, target_start, target_end, _ = program.edges
+    middle = (target_start + target_end) / 2
+
+    move = np.linspace(return_progress - 5, middle, int(move_seconds * FPS))
+    hold = np.full(int(hold_seconds * FPS), middle)
+    rep = np.concatenate([move, hold, move[::-1]])
+    angles = program.sign * np.tile(rep, reps) + rng.normal(0, noise, rep.size * reps)
+    timestamps = np.arange(angles.size) / FPS
+    return angles.tolist(), timestamps.tolist()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rep engine benchmark")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--reps", type=int, default=10)
+    parser.add_argument("--noise", type=float, default=2.0, help="Angle noise std dev in degrees")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    print(f"{args.sessions} sessions x {args.reps} reps per machine")
+    print(f"{'exercise':<24} {'reps':>6} {'sessions/s':>11} {'us/sample':>10}")
+
+    total_samples = total_seconds = 0.0
+    missed = []
+    for name, program in REP_PROGRAMS.items():
+        angles, timestamps = make_session(program, args.reps, args.noise, rng)
+
+        counted = None
+        started = time.perf_counter()
+        for _ in range(args.sessions):
+            engine = RepEngine(program)
+            reps = engine.run(angles, timestamps)
+            counted = reps if counted is None else min(counted, reps)
+        elapsed = time.perf_counter() - started
+
+        samples = args.sessions * len(angles)
+        total_samples += samples
+        total_seconds += elapsed
+        flag = ""
+        if counted != args.reps:
+            missed.append(name)
+            flag = "  <- missed reps"
+        print(f"{name:<24} {counted:>6} {args.sessions / elapsed:11.0f} "
+              f"{elapsed / samples * 1e6:10.2f}{flag}")
+
+    print(f"{'all machines':<24} {'':>6} {'':>11} {total_seconds / total_samples * 1e6:10.2f}")
+
+    if missed:
+        print(f"✗ Missed reps: {', '.join(missed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
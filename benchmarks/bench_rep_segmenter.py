@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Rep segmentation cost: live per-sample update vs. offline whole trace
+
+A long synthetic session (reps with holds and measurement noise, smoothed
+by a short moving average as in the live monitor) is segmented by
+RepSegmenter one sample at a time and by segment_reps in one call. Both
+must produce the same rep records.
+
+Usage:
+    python benchmarks/bench_rep_segmenter.py [--minutes 60] [--noise 1.5]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from exercises import get_rep_program
+from filters import MovingAverage
+from rep_segmenter import RepSegmenter, segment_reps
+
+FPS = 30.0
+
+
+def make_session(minutes, noise, seed=0):
+    """Chest Press angles: 1 s press, 0.7 s hold, 1.3 s return, 0.5 s rest"""
+    rep = np.concatenate([np.linspace(110, 168, int(FPS)), np.full(int(0.7 * FPS), 168),
+                          np.linspace(168, 110, int(1.3 * FPS)), np.full(int(0.5 * FPS), 110)])
+    count = int(minutes * 60 * FPS / len(rep))
+    raw = np.tile(rep, count) + np.random.default_rng(seed).normal(0, noise, len(rep) * count)
+    smoother = MovingAverage(4)
+    angles = np.array([smoother.update(value) for value in raw.tolist()])
+    return angles, np.arange(len(angles)) / FPS, count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rep segmenter benchmark")
+    parser.add_argument("--minutes", type=float, default=60.0)
+    parser.add_argument("--noise", type=float, default=1.5, help="Angle noise std dev in degrees")
+    args = parser.parse_args(argv)
+
+    program = get_rep_program("Chest Press")
+    angles, timestamps, count = make_session(args.minutes, args.noise)
+    print(f"{len(angles)} samples, {count} reps")
+
+    segmenter = RepSegmenter(program)
+    update = segmenter.update
+    started = time.perf_counter()
+    live = [record for angle, t in zip(angles.tolist(), timestamps.tolist())
+            if (record := update(angle, t)) is not None]
+    live_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    offline = segment_reps(angles, timestamps, program)
+    offline_seconds = time.perf_counter() - started
+
+    assert live == offline, "live and offline segmentation disagree"
+    tempo = np.array([(r.concentric, r.hold, r.eccentric) for r in offline])
+    print(f"{len(offline)} reps, mean concentric/hold/eccentric "
+          f"{tempo[:, 0].mean():.2f}/{tempo[:, 1].mean():.2f}/{tempo[:, 2].mean():.2f} s")
+    print(f"live     {live_seconds / len(angles) * 1e6:8.2f} us/sample")
+    print(f"offline  {offline_seconds * 1e3:8.1f} ms total, "
+          f"{offline_seconds / len(angles) * 1e6:.3f} us/sample")
+
+
+if __name__ == "__main__":
+    main()
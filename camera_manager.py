@@ -3,69 +3,323 @@ Camera Manager
 Handles camera initialization, capture, and release
 """
 import cv2
+import os
 import threading
 import time
+from collections import namedtuple
+from frame_pacer import FramePacer
+
+# A captured frame handed out by reference. The image lives in a pooled
+# buffer and stays valid until the pool wraps around; copy it to keep it.
+# Timestamps are wall-clock seconds for live devices and media time for
+# recordings, so hold timers behave the same however fast a clip is read.
+CapturedFrame = namedtuple("CapturedFrame", ["seq", "timestamp", "image"])
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+class DeviceSource:
+    """Live camera device"""
+
+    live = True
+
+    def __init__(self, device_id=0, width=640, height=480, fps=30):
+        self.device_id = device_id
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.cap = None
+
+    def open(self):
+        """Open the device; returns True on success"""
+        self.cap = cv2.VideoCapture(self.device_id)
+
+        # Optimize for Raspberry Pi
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        self.cap.set(cv2.CAP_PROP_FPS, self.fps)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Reduce latency
+
+        return self.cap.isOpened()
+
+    def read(self, out=None):
+        """Read the next frame, decoding into `out` when its shape matches"""
+        return self.cap.read(out)
+
+    def timestamp(self):
+        """Capture time of the frame just read"""
+        return time.time()
+
+    def is_opened(self):
+        return self.cap is not None and self.cap.isOpened()
+
+    def release(self):
+        if self.cap:
+            self.cap.release()
+            self.cap = None
+
+
+class VideoFileSource:
+    """Recorded video clip, optionally looping for benchmarks"""
+
+    live = False
+
+    def __init__(self, path, loop=False):
+        self.path = path
+        self.loop = loop
+        self.cap = None
+        self.fps = 30
+        self.loop_offset = 0.0
+        self.last_timestamp = 0.0
+        self.frames_read = 0
+
+    def open(self):
+        """Open the file; returns True on success"""
+        self.cap = cv2.VideoCapture(self.path)
+        if not self.cap.isOpened():
+            return False
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or self.fps
+        return True
+
+    def read(self, out=None):
+        """Read the next frame, rewinding at the end when looping"""
+        ret, image = self.cap.read(out)
+        if not ret and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self.loop_offset = self.last_timestamp + 1.0 / self.fps
+            self.frames_read = 0
+            ret, image = self.cap.read(out)
+        if ret:
+            self.frames_read += 1
+        return ret, image
+
+    def timestamp(self):
+        """Media time of the frame just read, continuing across loops"""
+        position = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+        if position <= 0 and self.frames_read > 1:
+            # Container without timestamps: fall back to the frame count
+            position = (self.frames_read - 1) / self.fps
+        self.last_timestamp = self.loop_offset + position
+        return self.last_timestamp
+
+    def is_opened(self):
+        return self.cap is not None and self.cap.isOpened()
+
+    def release(self):
+        if self.cap:
+            self.cap.release()
+            self.cap = None
+
+
+class ImageDirectorySource:
+    """Directory of still images played back in file-name order"""
+
+    live = False
+
+    def __init__(self, path, loop=False, fps=30):
+        self.path = path
+        self.loop = loop
+        self.fps = fps
+        self.files = []
+        self.index = 0
+        self.frames_read = 0
+
+    def open(self):
+        """Index the directory; returns True if it holds any images"""
+        self.files = sorted(
+            os.path.join(self.path, name) for name in os.listdir(self.path)
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        self.index = 0
+        return len(self.files) > 0
+
+    def read(self, out=None):
+        """Load the next image, copying into `out` when its shape matches"""
+        if self.index >= len(self.files):
+            if not self.loop or not self.files:
+                return False, None
+            self.index = 0
+
+        image = cv2.imread(self.files[self.index])
+        self.index += 1
+        self.frames_read += 1
+        if image is None:
+            return False, None
+
+        if out is not None and out.shape == image.shape and out.dtype == image.dtype:
+            out[...] = image
+            return True, out
+        return True, image
+
+    def timestamp(self):
+        """Playback time of the image just read at the configured rate"""
+        return (self.frames_read - 1) / self.fps
+
+    def is_opened(self):
+        return len(self.files) > 0
+
+    def release(self):
+        self.files = []
+
+
+def create_source(source, loop=False, width=640, height=480, fps=30):
+    """
+    Build a frame source from a config value
+
+    Args:
+        source: Device index (int or digit string), video file path,
+            or a directory of images
+        loop (bool): Restart recorded sources when they run out
+
+    Returns:
+        A source object with open/read/release methods
+    """
+    if isinstance(source, int) or (isinstance(source, str) and source.isdigit()):
+        return DeviceSource(int(source), width, height, fps)
+    if os.path.isdir(source):
+        return ImageDirectorySource(source, loop=loop, fps=fps)
+    return VideoFileSource(source, loop=loop)
+
+
+class FrameBufferPool:
+    """Small ring of reusable frame buffers so capture does not allocate"""
+
+    def __init__(self, size=4):
+        self.buffers = [None] * size
+        self.index = 0
+
+    def next_buffer(self):
+        """Buffer to decode the next frame into (None until first use)"""
+        return self.buffers[self.index]
+
+    def commit(self, image):
+        """Keep the array the source returned and advance the ring"""
+        self.buffers[self.index] = image
+        self.index = (self.index + 1) % len(self.buffers)
+
 
 class CameraManager:
     """Manages camera operations in a separate thread"""
-    
-    def __init__(self, camera_id=0):
-        self.camera_id = camera_id
-        self.cap = None
+
+    def __init__(self, source=0, loop=False, pool_size=4, width=640, height=480, fps=30,
+                 paced=True):
+        if isinstance(source, (int, str)):
+            source = create_source(source, loop=loop, width=width, height=height, fps=fps)
+        self.source = source
+        self.fps = fps
+        self.paced = paced
+        self.pacer = None
+        self.pool = FrameBufferPool(pool_size)
         self.frame = None
+        self.seq = 0
         self.running = False
+        self.opened = False
+        self.thread = None
         self.lock = threading.Lock()
         self.callback = None
-        
-    def start(self, callback=None):
-        """Start camera capture thread"""
+        self.on_error = None
+
+    def open(self):
+        """Open the frame source; returns True on success"""
+        if not self.opened:
+            self.opened = self.source.open()
+        return self.opened
+
+    def start(self, callback=None, on_error=None):
+        """
+        Start camera capture thread
+
+        Args:
+            callback: Called with every CapturedFrame from the capture thread
+            on_error: Called with a message if a live source stops delivering
+        """
+        if not self.open():
+            raise RuntimeError("Cannot open camera source")
+
         self.running = True
         self.callback = callback
+        self.on_error = on_error
+
+        # Live devices are paced by their own blocking read, so their pacer
+        # only measures the rate. Recordings are paced at their own frame
+        # rate; unpaced recordings run as fast as they decode.
+        self.pacer = None
+        if self.source.live:
+            self.pacer = FramePacer(self.fps)
+        elif self.paced:
+            self.pacer = FramePacer(self.source.fps)
         self.thread = threading.Thread(target=self._capture_loop, daemon=True)
         self.thread.start()
-    
+
     def _capture_loop(self):
         """Main capture loop running in separate thread"""
-        self.cap = cv2.VideoCapture(self.camera_id)
-        
-        # Optimize for Raspberry Pi
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-        self.cap.set(cv2.CAP_PROP_FPS, 30)
-        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Reduce latency
-        
-        while self.running and self.cap.isOpened():
-            ret, frame = self.cap.read()
-            
-            if ret:
-                with self.lock:
-                    self.frame = frame
-                
-                # Call callback if provided
-                if self.callback:
-                    self.callback(frame)
-            
-            # Small delay to prevent CPU overuse
-            time.sleep(0.01)
-    
+        while self.running:
+            frame = self.read()
+
+            if frame is None:
+                if self.source.live and self.on_error:
+                    self.on_error("Cannot read from camera")
+                break
+
+            # Call callback if provided
+            if self.callback:
+                self.callback(frame)
+
+            if self.source.live:
+                self.pacer.tick()
+            elif self.pacer:
+                self.pacer.wait()
+
+        self.running = False
+
+    def read(self):
+        """
+        Read one frame into the buffer pool
+
+        Used by the capture thread, or directly (without start()) when a
+        caller must see every frame of a recording rather than the latest.
+
+        Returns:
+            CapturedFrame: The new frame, or None when the source is exhausted
+        """
+        ret, image = self.source.read(self.pool.next_buffer())
+        if not ret:
+            return None
+
+        self.pool.commit(image)
+        self.seq += 1
+        frame = CapturedFrame(self.seq, self.source.timestamp(), image)
+
+        with self.lock:
+            self.frame = frame
+        return frame
+
+    def effective_fps(self):
+        """Measured capture rate (0 until a few frames have been paced)"""
+        return self.pacer.effective_fps() if self.pacer else 0.0
+
+    def missed_deadlines(self):
+        """Frames that arrived too late to hold a recording's rate (always 0 for live devices)"""
+        return self.pacer.missed_deadlines if self.pacer else 0
+
     def get_frame(self):
-        """Get the latest frame"""
+        """Get the latest CapturedFrame by reference (None before the first)"""
         with self.lock:
-            return self.frame.copy() if self.frame is not None else None
-    
+            return self.frame
+
     def stop(self):
         """Stop camera and release resources"""
         self.running = False
-        
-        if self.thread.is_alive():
+
+        if self.thread and self.thread.is_alive() and self.thread is not threading.current_thread():
             self.thread.join(timeout=1)
-        
-        if self.cap:
-            self.cap.release()
-        
+
+        self.source.release()
+        self.opened = False
+
         with self.lock:
             self.frame = None
-    
+
     def is_opened(self):
         """Check if camera is opened"""
-        return self.cap is not None and self.cap.isOpened()
\ No newline at end of file
+        return self.opened and self.source.is_opened()
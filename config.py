@@ -43,4 +43,42 @@ EXERCISES = [
     "Leg Curl",
     "Biceps Curl",
     "Triceps Pushdown"
-]
\ No newline at end of file
+]
+
+# Camera pipeline settings
+CAMERA_SOURCE = 0  # Device index, path to a video file, or a directory of images
+CAMERA_LOOP = True  # Restart recorded sources at the end (handy for benchmarks)
+CAPTURE_POOL_SIZE = 4  # Reusable capture buffers; frames stay valid for this many captures
+FRAME_PREP_POOL_SIZE = 4  # Mirrored RGB buffers shared by inference, recording and display
+CAMERA_WIDTH = 640
+CAMERA_HEIGHT = 480
+CAMERA_FPS = 30  # Rate requested from live devices; their blocking reads pace capture
+DISPLAY_FPS = 30  # Render stage rate; capture and inference run as fast as they can
+UI_REFRESH_HZ = 15  # Cap on angle/status/rep panel updates
+
+# Pose inference settings
+POSE_INFERENCE_STRIDE = 1  # Run MediaPipe every Nth frame; frames between are estimated
+POSE_MAX_ESTIMATE_GAP = 0.5  # Seconds an old pose may be extrapolated before it counts as lost
+POSE_WORKER_PROCESS = True  # Run MediaPipe in a separate process fed through shared memory
+POSE_ROI_ENABLED = False  # Crop inference input to the region around the previous pose
+POSE_ROI_MARGIN = 0.25  # Fraction of the pose box added on each side of the crop
+POSE_ROI_MAX_SIDE = 480  # Downscale larger crops before inference (None keeps full size)
+
+# Landmark and angle smoothing
+LANDMARK_SMOOTHING = True  # One Euro filter on every landmark before angles and drawing
+LANDMARK_MIN_CUTOFF = 1.0  # Hz; lower holds a still pose steadier
+LANDMARK_BETA = 5.0  # Cutoff increase per unit/s of landmark speed; higher follows faster
+ANGLE_SMOOTHING_WINDOW = 4  # Angle moving average; short because landmarks are already smoothed
+
+# Latency compensation (live camera only)
+LANDMARK_PREDICTION = True  # Extrapolate landmarks by the measured capture-to-display latency
+PREDICTION_HISTORY = 4  # Frames used to estimate each landmark's velocity
+PREDICTION_MAX_HORIZON = 0.15  # Seconds; never look further ahead than this
+PREDICTION_MAX_RATIO = 1.0  # Max extrapolated distance, relative to the travel over the history
+PREDICTION_MIN_VISIBILITY = 0.5  # Landmarks at or below this visibility are not extrapolated
+
+# Annotated video recording
+RECORD_ANNOTATED_VIDEO = False  # Save the annotated feed for coaches
+RECORDING_DIR = "recordings"
+RECORDING_MAX_MB = 200  # Start a new file once the current one reaches this size
+RECORDING_MAX_SECONDS = 600  # ...or this duration
@@ -4,6 +4,7 @@ Contains exercise configurations and utilities
 """
 
 from .exercise_config import (
+    EXERCISE_ALIASES,
     EXERCISE_ANGLES,
     EXERCISE_PROCEDURES,
     MEDIAPIPE_LANDMARKS,
@@ -11,10 +12,19 @@ from .exercise_config import (
     validate_angle,
     get_exercise_procedures,
     get_all_exercises,
-    get_landmark_indices
+    get_landmark_indices,
+    resolve_exercise_name
+)
+from .rep_engine import (
+    REP_PROGRAMS,
+    RepEngine,
+    RepProgram,
+    compile_rep_program,
+    get_rep_program
 )
 
 __all__ = [
+    'EXERCISE_ALIASES',
     'EXERCISE_ANGLES',
     'EXERCISE_PROCEDURES', 
     'MEDIAPIPE_LANDMARKS',
@@ -22,5 +32,11 @@ __all__ = [
     'validate_angle',
     'get_exercise_procedures',
     'get_all_exercises',
-    'get_landmark_indices'
+    'get_landmark_indices',
+    'resolve_exercise_name',
+    'REP_PROGRAMS',
+    'RepEngine',
+    'RepProgram',
+    'compile_rep_program',
+    'get_rep_program'
 ]
\ No newline at end of file
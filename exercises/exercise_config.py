@@ -48,6 +48,23 @@ MEDIAPIPE_LANDMARKS = {
 # ============================================================================
 # EXERCISE ANGLE CONFIGURATIONS
 # Each machine has its own angle measurement rules
+#
+# "angle_space" (optional) chooses where angles are measured:
+#   "image" - 2D on normalized image landmarks (default); depends on where
+#             the camera stands relative to the machine
+#   "world" - 3D on MediaPipe world landmarks (metres); independent of
+#             camera placement, falls back to "image" when unavailable
+#
+# "smoothing" (optional) is a filters.create_filter() spec for the angle,
+# e.g. {"type": "one_euro", "min_cutoff": 1.0, "beta": 0.007};
+# the default is a moving average over PostureMonitor's smoothing_window
+# samples, config.ANGLE_SMOOTHING_WINDOW (4) in the app, headless and batch runs
+#
+# "return_angle" (optional) is the angle the joint must get back to for a
+# rep to count (see exercises.rep_engine). By default it lies 40 degrees
+# short of target_angle_range: below it for ranges centred at or above
+# 135 degrees (extension), above it otherwise (flexion). "tolerance" is the
+# hysteresis band kept around the target once it has been reached.
 # ============================================================================
 
 EXERCISE_ANGLES = {
@@ -268,6 +285,12 @@ EXERCISE_ANGLES = {
     }
 }
 
+# Names used by the UI for machines keyed differently above
+EXERCISE_ALIASES = {
+    "Biceps Curl": "Biceps Curl Machine",
+    "Back Extension": "Back Extension Machine"
+}
+
 # ============================================================================
 # EXERCISE PROCEDURES DATABASE
 # Two random steps will be selected from each list
@@ -421,8 +444,27 @@ def get_exercise_config(exercise_name):
     Returns:
         dict: Exercise configuration or default if not found
     """
+    exercise_name = EXERCISE_ALIASES.get(exercise_name, exercise_name)
     return EXERCISE_ANGLES.get(exercise_name, EXERCISE_ANGLES["Chest Press"])
 
+def resolve_exercise_name(exercise_name):
+    """
+    EXERCISE_ANGLES key for an exercise name or one of its UI aliases
+    
+    Args:
+        exercise_name (str): Name of the exercise
+        
+    Returns:
+        str: Key into EXERCISE_ANGLES
+        
+    Raises:
+        ValueError: If the exercise is unknown
+    """
+    exercise_name = EXERCISE_ALIASES.get(exercise_name, exercise_name)
+    if exercise_name not in EXERCISE_ANGLES:
+        raise ValueError(f"Unknown exercise: {exercise_name}")
+    return exercise_name
+
 def get_exercise_procedures(exercise_name, num_steps=2):
     """
     Get random procedure steps for an exercise
@@ -505,6 +547,7 @@ DEFAULT_EXERCISE_CONFIG = {
         "right": [12, 14, 16]
     },
     "primary_side": "both",
+    "angle_space": "image",
     "target_angle_range": (160, 175),
     "tolerance": 10,
     "direction": "forward",
@@ -0,0 +1,210 @@
+"""
+FitPose Rep Engine
+Table-driven posture and repetition state machine compiled from EXERCISE_ANGLES
+
+Each exercise is compiled once into a RepProgram: the angle edges of six
+zones along the movement, plus flat (state, zone) lookup tables. Each
+sample then costs one bisect, one table lookup and at most two timer checks.
+
+    zones (in movement order, from the return position to past the target)
+    RETURN     at or beyond the return angle; finishing here completes a rep
+    SHORT      between the return angle and the target
+    NEAR_SHORT within `tolerance` short of the target (hysteresis band)
+    TARGET     inside target_angle_range
+    NEAR_PAST  within `tolerance` past the target (hysteresis band)
+    PAST       further than `tolerance` past the target
+
+    states
+    READY      waiting for the target to be reached
+    HOLD       target reached, hold timer running
+    TOP        held long enough: posture correct, rep armed
+    RETURNING  left the target after a completed hold
+
+A new hold starts only inside the target itself, but once started it and
+TOP survive the hysteresis bands around it, so noise at a range edge does
+not flicker the state. A rep counts when an armed rep reaches RETURN, at
+least `debounce` seconds after TOP was entered.
+
+No Tk, NumPy or pose code is involved: angles in, state out.
+"""
+from bisect import bisect_right
+from collections import namedtuple
+
+from .exercise_config import EXERCISE_ALIASES, EXERCISE_ANGLES
+
+# Zones, in movement order
+ZONE_RETURN, ZONE_SHORT, ZONE_NEAR_SHORT, ZONE_TARGET, ZONE_NEAR_PAST, ZONE_PAST = range(6)
+ZONE_COUNT = 6
+
+# States
+STATE_READY, STATE_HOLD, STATE_TOP, STATE_RETURNING = range(4)
+
+# Posture categories reported with each (state, zone)
+POSTURE_WAITING = "waiting"
+POSTURE_HOLDING = "holding"
+POSTURE_CORRECT = "correct"
+POSTURE_INCORRECT = "incorrect"
+
+# Transition actions
+ACTION_NONE, ACTION_START_HOLD, ACTION_COUNT = range(3)
+
+# Default distance from the target to the return angle, when an exercise
+# has no "return_angle"
+DEFAULT_RANGE_OF_MOTION = 40
+
+# Target ranges centred at or above this are reached by extending the joint
+EXTENSION_MIDPOINT = 135
+
+_N, _H, _C = ACTION_NONE, ACTION_START_HOLD, ACTION_COUNT
+
+# (next state, action) per zone, one row per state
+TRANSITIONS = (
+    # RETURN              SHORT                   NEAR_SHORT              TARGET              NEAR_PAST           PAST
+    ((STATE_READY, _N),   (STATE_READY, _N),      (STATE_READY, _N),      (STATE_HOLD, _H),   (STATE_READY, _N),  (STATE_READY, _N)),
+    ((STATE_READY, _N),   (STATE_READY, _N),      (STATE_HOLD, _N),       (STATE_HOLD, _N),   (STATE_HOLD, _N),   (STATE_READY, _N)),
+    ((STATE_READY, _C),   (STATE_RETURNING, _N),  (STATE_TOP, _N),        (STATE_TOP, _N),    (STATE_TOP, _N),    (STATE_TOP, _N)),
+    ((STATE_READY, _C),   (STATE_RETURNING, _N),  (STATE_RETURNING, _N),  (STATE_TOP, _N),    (STATE_TOP, _N),    (STATE_TOP, _N)),
+)
+
+RepProgram = namedtuple("RepProgram", [
+    "name",         # exercise name
+    "edges",        # zone edges in progress units (angle, negated for flexion)
+    "sign",         # +1 when the target is reached by extending, -1 by flexing
+    "transitions",  # flat (next state, action) table, indexed state * ZONE_COUNT + zone
+    "statuses",     # flat (posture, status, feedback) table, same indexing
+    "hold_time",    # seconds the target must be held before a rep is armed
+    "debounce",     # minimum seconds between arming and counting a rep
+])
+
+
+def compile_rep_program(name, rules, hold_time=0.8, debounce=0.5):
+    """
+    Compile one EXERCISE_ANGLES entry into a RepProgram
+
+    Args:
+        name (str): Exercise name
+        rules (dict): EXERCISE_ANGLES entry; uses target_angle_range, tolerance,
+            feedback_messages and the optional return_angle
+        hold_time (float): Seconds the target must be held
+        debounce (float): Minimum seconds from arming a rep to counting it
+
+    Returns:
+        RepProgram: Immutable compiled program
+    """
+    low, high = rules["target_angle_range"]
+    tolerance = rules.get("tolerance", 0)
+    messages = rules["feedback_messages"]
+
+    return_angle = rules.get("return_angle")
+    if return_angle is None:
+        extension = (low + high) / 2 >= EXTENSION_MIDPOINT
+        return_angle = low - DEFAULT_RANGE_OF_MOTION if extension else high + DEFAULT_RANGE_OF_MOTION
+    else:
+        extension = return_angle < low
+
+    # Progress increases towards the target, so one set of edges serves both directions
+    if extension:
+        sign, start, end = 1, low, high
+        short_message, past_message = messages["too_small"], messages["too_large"]
+    else:
+        sign, start, end = -1, -high, -low
+        short_message, past_message = messages["too_large"], messages["too_small"]
+    edges = (sign * return_angle, start - tolerance, start, end, end + tolerance)
+    if any(a >= b for a, b in zip(edges, edges[1:])):
+        raise ValueError(f"{name}: return angle {return_angle} overlaps the target range")
+
+    statuses = []
+    for state in range(len(TRANSITIONS)):
+        for zone in range(ZONE_COUNT):
+            if state == STATE_HOLD:
+                statuses.append((POSTURE_HOLDING, "Hold", "Keep position"))
+            elif state == STATE_TOP and ZONE_NEAR_SHORT <= zone <= ZONE_NEAR_PAST:
+                statuses.append((POSTURE_CORRECT, "Correct posture", messages["correct"]))
+            elif zone <= ZONE_NEAR_SHORT:
+                statuses.append((POSTURE_INCORRECT, "Incorrect posture", short_message))
+            else:
+                statuses.append((POSTURE_INCORRECT, "Incorrect posture", past_message))
+
+    transitions = tuple(entry for row in TRANSITIONS for entry in row)
+    return RepProgram(name, edges, sign, transitions, tuple(statuses), hold_time, debounce)
+
+
+# Every machine compiled with the default hold and debounce times
+REP_PROGRAMS = {name: compile_rep_program(name, rules) for name, rules in EXERCISE_ANGLES.items()}
+
+
+def get_rep_program(exercise_name):
+    """Default RepProgram for an exercise or UI alias, or None for an unknown exercise"""
+    return REP_PROGRAMS.get(EXERCISE_ALIASES.get(exercise_name, exercise_name))
+
+
+class RepEngine:
+    """Runs a RepProgram over a stream of (angle, timestamp) samples"""
+
+    def __init__(self, program):
+        self.program = program
+        self.reset()
+
+    def reset(self):
+        """Return to READY"""
+        self.state = STATE_READY
+        self.zone = None
+        self.hold_start = None
+        self.top_time = None  # when the current rep was armed
+
+    def update(self, angle, timestamp):
+        """
+        Advance the state machine by one sample
+
+        Args:
+            angle (float): Joint angle in degrees
+            timestamp (float): Sample time in seconds
+
+        Returns:
+            bool: True when this sample completed a rep
+        """
+        program = self.program
+        zone = bisect_right(program.edges, program.sign * angle)
+        state, action = program.transitions[self.state * ZONE_COUNT + zone]
+        self.zone = zone
+
+        if action == ACTION_START_HOLD:
+            self.hold_start = timestamp
+        elif action == ACTION_COUNT:
+            if timestamp - self.top_time < program.debounce:
+                return False  # too soon after arming: stay put until it has passed
+            self.state = state
+            return True
+
+        if state == STATE_HOLD and timestamp - self.hold_start >= program.hold_time:
+            state = STATE_TOP
+            self.top_time = timestamp
+        self.state = state
+        return False
+
+    def run(self, angles, timestamps):
+        """
+        Feed a whole series of samples
+
+        Returns:
+            int: Reps completed during the series
+        """
+        update = self.update
+        return sum(update(angle, t) for angle, t in zip(angles, timestamps))
+
+    def status(self):
+        """(posture, status, feedback) for the latest sample, or None before the first"""
+        if self.zone is None:
+            return None
+        return self.program.statuses[self.state * ZONE_COUNT + self.zone]
+
+    def hold_remaining(self, timestamp):
+        """Seconds of the hold still to go while in HOLD, else 0"""
+        if self.state != STATE_HOLD:
+            return 0.0
+        return max(0.0, self.program.hold_time - (timestamp - self.hold_start))
+
+    @property
+    def posture_correct(self):
+        """True while the armed pose is within the target band"""
+        return self.state == STATE_TOP and ZONE_NEAR_SHORT <= self.zone <= ZONE_NEAR_PAST
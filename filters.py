@@ -0,0 +1,254 @@
+"""
+Filters
+Constant-time streaming filters for smoothing angles sample by sample
+
+Every filter has the same interface:
+
+    update(value, timestamp) -> filtered value
+    reset()                  -> forget all history
+    value                    -> last filtered value (None before the first sample)
+
+Timestamps are in seconds. Time-aware filters (One Euro, Kalman) use them
+to adapt to uneven frame rates; the others ignore them.
+"""
+import math
+from collections import deque
+
+import numpy as np
+
+# Used when an exercise has no "smoothing" entry in EXERCISE_ANGLES
+DEFAULT_FILTER = {"type": "moving_average", "window": 8}
+
+# Frame interval assumed when timestamps do not advance
+DEFAULT_DT = 1.0 / 30
+
+
+class MovingAverage:
+    """Mean of the last `window` samples, kept as a running sum"""
+
+    # Re-summing the window now and then stops float error from accumulating
+    RESYNC_INTERVAL = 1024
+
+    def __init__(self, window=8):
+        self.window = max(1, int(window))
+        self.samples = deque(maxlen=self.window)
+        self.total = 0.0
+        self.updates = 0
+        self.value = None
+
+    def update(self, value, timestamp=None):
+        if len(self.samples) == self.window:
+            self.total -= self.samples[0]
+        self.samples.append(value)
+        self.total += value
+
+        self.updates += 1
+        if self.updates % self.RESYNC_INTERVAL == 0:
+            self.total = math.fsum(self.samples)
+
+        self.value = self.total / len(self.samples)
+        return self.value
+
+    def reset(self):
+        self.samples.clear()
+        self.total = 0.0
+        self.updates = 0
+        self.value = None
+
+
+class ExponentialMovingAverage:
+    """value += alpha * (sample - value); higher alpha follows faster"""
+
+    def __init__(self, alpha=0.3):
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        self.alpha = alpha
+        self.value = None
+
+    def update(self, value, timestamp=None):
+        if self.value is None:
+            self.value = value
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+    def reset(self):
+        self.value = None
+
+
+def _smoothing_factor(dt, cutoff):
+    """EMA alpha for a first-order low-pass at `cutoff` Hz over `dt` seconds"""
+    tau = 1.0 / (2 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class OneEuroFilter:
+    """Speed-adaptive low-pass (Casiez et al., CHI 2012)
+
+    Holds still poses steady with a low cutoff and raises the cutoff as
+    the signal moves faster, so reps are followed with little lag.
+    min_cutoff (Hz) sets jitter at rest; beta sets how quickly the cutoff
+    grows with speed (per unit/s); d_cutoff smooths the speed estimate.
+    """
+
+    def __init__(self, min_cutoff=1.0, beta=0.007, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def update(self, value, timestamp=None):
+        if self.value is None:
+            self.value = value
+            self.last_time = timestamp
+            return value
+
+        dt = DEFAULT_DT
+        if timestamp is not None and self.last_time is not None and timestamp > self.last_time:
+            dt = timestamp - self.last_time
+        self.last_time = timestamp
+
+        speed = (value - self.value) / dt
+        self.speed += _smoothing_factor(dt, self.d_cutoff) * (speed - self.speed)
+
+        cutoff = self.min_cutoff + self.beta * abs(self.speed)
+        self.value += _smoothing_factor(dt, cutoff) * (value - self.value)
+        return self.value
+
+    def reset(self):
+        self.value = None
+        self.speed = 0.0
+        self.last_time = None
+
+
+class LandmarkOneEuro:
+    """One Euro filter bank over all landmark coordinates at once
+
+    Each (landmark, coordinate) pair is an independent One Euro filter,
+    but the whole (33, 3) block is updated with a few array operations per
+    frame instead of 99 scalar filters. Visibility passes through
+    unfiltered. Speeds are per second in the landmarks' units (normalized
+    image coordinates, or metres for world landmarks), so beta differs
+    from the scalar angle filter's.
+    """
+
+    def __init__(self, min_cutoff=1.0, beta=5.0, d_cutoff=1.0, columns=3):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.columns = columns
+        self.reset()
+
+    def update(self, landmarks, timestamp=None):
+        """
+        Smooth one frame
+
+        Args:
+            landmarks (np.ndarray): (33, 4) landmarks
+            timestamp (float): Frame time in seconds
+
+        Returns:
+            np.ndarray: New (33, 4) array with filtered x, y, z
+        """
+        raw = landmarks[:, :self.columns]
+        if self.value is None:
+            self.value = raw.astype(np.float64)
+            self.speed = np.zeros_like(self.value)
+            self.last_time = timestamp
+            return landmarks.copy()
+
+        dt = DEFAULT_DT
+        if timestamp is not None and self.last_time is not None and timestamp > self.last_time:
+            dt = timestamp - self.last_time
+        self.last_time = timestamp
+
+        delta = raw - self.value
+        self.speed += _smoothing_factor(dt, self.d_cutoff) * (delta / dt - self.speed)
+
+        # Per-coordinate cutoff, then the EMA factor 1 / (1 + tau / dt) with tau = 1 / (2 pi f)
+        cutoff = self.min_cutoff + self.beta * np.abs(self.speed)
+        self.value += delta / (1.0 + 1.0 / (2 * math.pi * dt * cutoff))
+
+        smoothed = landmarks.copy()
+        smoothed[:, :self.columns] = self.value
+        return smoothed
+
+    def reset(self):
+        self.value = None
+        self.speed = None
+        self.last_time = None
+
+
+class Kalman1D:
+    """Constant-velocity Kalman filter over (angle, angular velocity)
+
+    process_noise is the white-acceleration spectral density (units^2/s^3):
+    raise it to follow quick direction changes. measurement_noise is the
+    variance of one raw sample (units^2).
+    """
+
+    def __init__(self, process_noise=5000.0, measurement_noise=9.0):
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self.reset()
+
+    def update(self, value, timestamp=None):
+        if self.value is None:
+            self.value = value
+            self.velocity = 0.0
+            self.p00, self.p01, self.p11 = self.measurement_noise, 0.0, 1e3
+            self.last_time = timestamp
+            return value
+
+        dt = DEFAULT_DT
+        if timestamp is not None and self.last_time is not None and timestamp > self.last_time:
+            dt = timestamp - self.last_time
+        self.last_time = timestamp
+
+        # Predict: x = F x, P = F P F' + Q, with F = [[1, dt], [0, 1]]
+        q = self.process_noise
+        x = self.value + self.velocity * dt
+        p00 = self.p00 + dt * (2 * self.p01 + dt * self.p11) + q * dt ** 3 / 3
+        p01 = self.p01 + dt * self.p11 + q * dt ** 2 / 2
+        p11 = self.p11 + q * dt
+
+        # Correct with the measured angle (H = [1, 0])
+        s = p00 + self.measurement_noise
+        k0, k1 = p00 / s, p01 / s
+        residual = value - x
+        self.value = x + k0 * residual
+        self.velocity += k1 * residual
+        self.p00, self.p01, self.p11 = (1 - k0) * p00, (1 - k0) * p01, p11 - k1 * p01
+        return self.value
+
+    def reset(self):
+        self.value = None
+        self.velocity = 0.0
+        self.p00 = self.p01 = self.p11 = 0.0
+        self.last_time = None
+
+
+FILTER_TYPES = {
+    "moving_average": MovingAverage,
+    "ema": ExponentialMovingAverage,
+    "one_euro": OneEuroFilter,
+    "kalman": Kalman1D,
+}
+
+
+def create_filter(spec=None):
+    """
+    Build a filter from a spec such as {"type": "one_euro", "beta": 0.01}
+
+    Args:
+        spec (dict): "type" from FILTER_TYPES plus that filter's keyword
+            arguments; None gives DEFAULT_FILTER
+
+    Returns:
+        A filter with update(value, timestamp) and reset()
+    """
+    options = dict(spec or DEFAULT_FILTER)
+    kind = options.pop("type")
+    if kind not in FILTER_TYPES:
+        raise ValueError(f"Unknown filter type: {kind}")
+    return FILTER_TYPES[kind](**options)
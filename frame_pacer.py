@@ -0,0 +1,72 @@
+"""
+Frame Pacer
+Deadline-based loop pacing so frame periods do not drift with work time
+"""
+import time
+from collections import deque
+
+
+class FramePacer:
+    """Keeps a loop on a target frame rate using monotonic deadlines
+
+    Call wait() once per iteration after doing the work. The pacer sleeps
+    only for what is left of the current period, skips sleeping when the
+    loop is already behind, and re-anchors instead of bursting to catch up
+    after a long stall.
+    """
+
+    def __init__(self, target_fps=30, window=60):
+        self.target_fps = target_fps
+        self.period = 1.0 / target_fps
+        self.next_deadline = None
+        self.missed_deadlines = 0
+        self.tick_times = deque(maxlen=window)
+
+    def wait(self):
+        """Sleep until the next deadline; returns immediately when behind"""
+        now = time.monotonic()
+
+        if self.next_deadline is None:
+            self.next_deadline = now + self.period
+        else:
+            if now < self.next_deadline:
+                time.sleep(self.next_deadline - now)
+                now = time.monotonic()
+            else:
+                self.missed_deadlines += 1
+
+            self.next_deadline += self.period
+            if self.next_deadline < now:
+                self.next_deadline = now + self.period
+
+        self.tick_times.append(now)
+
+    def tick(self):
+        """Record an iteration without sleeping, for loops paced elsewhere"""
+        self.tick_times.append(time.monotonic())
+
+    def restart_if_late(self):
+        """
+        Restart the deadlines from now if they have already passed
+
+        For a loop that was idle waiting for its input: that wait is not a
+        missed deadline, so the current period starts when the input arrived.
+        """
+        now = time.monotonic()
+        if self.next_deadline is not None and now > self.next_deadline:
+            self.next_deadline = now + self.period
+
+    def effective_fps(self):
+        """Measured loop rate over the recent window"""
+        if len(self.tick_times) < 2:
+            return 0.0
+        elapsed = self.tick_times[-1] - self.tick_times[0]
+        if elapsed <= 0:
+            return 0.0
+        return (len(self.tick_times) - 1) / elapsed
+
+    def reset(self):
+        """Forget deadlines and statistics"""
+        self.next_deadline = None
+        self.missed_deadlines = 0
+        self.tick_times.clear()
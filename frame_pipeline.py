@@ -0,0 +1,203 @@
+"""
+Frame Pipeline
+Staged capture -> inference -> render processing connected by latest-frame slots
+"""
+import threading
+import time
+from frame_pacer import FramePacer
+
+
+class LatestSlot:
+    """Single-item hand-off where a newer item replaces an unread one
+
+    Producers never block and consumers always get the freshest item, so a
+    slow stage drops stale work instead of letting a queue build up behind it.
+    """
+
+    def __init__(self, name="slot"):
+        self.name = name
+        self._cond = threading.Condition()
+        self._item = None
+        self._closed = False
+        self.put_count = 0
+        self.dropped = 0
+
+    def put(self, item):
+        """Publish an item, dropping the previous one if nobody took it"""
+        with self._cond:
+            if self._item is not None:
+                self.dropped += 1
+            self._item = item
+            self.put_count += 1
+            self._cond.notify()
+
+    def take(self, timeout=None):
+        """
+        Remove and return the newest item
+
+        Args:
+            timeout (float): Seconds to wait for an item, None waits forever
+
+        Returns:
+            The newest item, or None on timeout or when the slot is closed
+        """
+        with self._cond:
+            if self._item is None and not self._closed:
+                self._cond.wait(timeout)
+            item, self._item = self._item, None
+            return item
+
+    def close(self):
+        """Wake any waiting consumer and reject further waits"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def reset(self):
+        """Clear the slot so it can be reused after close()"""
+        with self._cond:
+            self._item = None
+            self._closed = False
+            self.put_count = 0
+            self.dropped = 0
+
+
+class PipelineStage:
+    """One pipeline stage running its work function on its own thread"""
+
+    # Weight of the newest sample in the running work-time average
+    LATENCY_SMOOTHING = 0.1
+
+    def __init__(self, name, work, input_slot=None, output_slot=None, target_fps=None):
+        self.name = name
+        self.work = work
+        self.input_slot = input_slot
+        self.output_slot = output_slot
+        self.pacer = FramePacer(target_fps) if target_fps else None
+        self.running = False
+        self.thread = None
+        self.processed = 0
+        self.errors = 0
+        self.latency = 0.0  # smoothed seconds spent in work() per item
+
+    def start(self):
+        """Start the stage thread"""
+        self.running = True
+        self.latency = 0.0
+        if self.pacer:
+            self.pacer.reset()
+        self.thread = threading.Thread(target=self._run, name=f"pipeline-{self.name}", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Ask the stage thread to finish after its current item"""
+        self.running = False
+
+    def join(self, timeout=1.0):
+        """Wait for the stage thread to exit"""
+        if self.thread and self.thread.is_alive() and self.thread is not threading.current_thread():
+            self.thread.join(timeout=timeout)
+
+    def stats(self):
+        """Counters plus pacing figures when the stage is rate-limited"""
+        stats = {"processed": self.processed, "errors": self.errors,
+                 "latency_ms": round(self.latency * 1000, 1)}
+        if self.pacer:
+            stats["effective_fps"] = round(self.pacer.effective_fps(), 1)
+            stats["missed_deadlines"] = self.pacer.missed_deadlines
+        return stats
+
+    def _run(self):
+        """Stage loop: take newest input, do the work, publish the result"""
+        while self.running:
+            item = None
+
+            if self.input_slot is not None:
+                item = self.input_slot.take(timeout=0.1)
+                if item is None:
+                    continue
+                # Time spent waiting for input is not a missed deadline
+                if self.pacer:
+                    self.pacer.restart_if_late()
+
+            started = time.perf_counter()
+            try:
+                result = self.work(item)
+            except Exception as e:
+                self.errors += 1
+                print(f"✗ Pipeline stage '{self.name}' error: {e}")
+                continue
+
+            elapsed = time.perf_counter() - started
+            if self.processed:
+                self.latency += self.LATENCY_SMOOTHING * (elapsed - self.latency)
+            else:
+                self.latency = elapsed
+
+            self.processed += 1
+            if result is not None and self.output_slot is not None:
+                self.output_slot.put(result)
+
+            # Hold this stage to its own rate without delaying the others
+            if self.pacer:
+                self.pacer.wait()
+
+        self.running = False
+
+
+class FramePipeline:
+    """Owns the slots and stages of a staged frame-processing pipeline"""
+
+    def __init__(self):
+        self.slots = []
+        self.stages = []
+
+    def add_slot(self, name):
+        """Create a latest-frame-wins slot between two stages"""
+        slot = LatestSlot(name)
+        self.slots.append(slot)
+        return slot
+
+    def add_stage(self, name, work, input_slot=None, output_slot=None, target_fps=None):
+        """Register a stage; stages start in the order they were added"""
+        stage = PipelineStage(name, work, input_slot, output_slot, target_fps)
+        self.stages.append(stage)
+        return stage
+
+    def start(self):
+        """Start every stage"""
+        for slot in self.slots:
+            slot.reset()
+        for stage in self.stages:
+            stage.start()
+
+    def stop(self, timeout=1.0):
+        """Stop every stage and wait briefly for their threads"""
+        for stage in self.stages:
+            stage.stop()
+        for slot in self.slots:
+            slot.close()
+        for stage in self.stages:
+            stage.join(timeout=timeout)
+
+    def latency(self):
+        """
+        Expected seconds from a frame entering the first stage to leaving the last
+
+        The sum of every stage's measured work time, plus half a period
+        for each paced stage: the average wait for its next deadline.
+        """
+        total = 0.0
+        for stage in self.stages:
+            total += stage.latency
+            if stage.pacer:
+                total += stage.pacer.period / 2
+        return total
+
+    def stats(self):
+        """Processed/dropped counters for logging and benchmarking"""
+        return {
+            "stages": {stage.name: stage.stats() for stage in self.stages},
+            "slots": {slot.name: {"put": slot.put_count, "dropped": slot.dropped}
+                      for slot in self.slots},
+        }
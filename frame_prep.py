@@ -0,0 +1,74 @@
+"""
+Frame Preparation
+Mirror, colour-convert and resize frames into preallocated buffers
+"""
+import cv2
+import numpy as np
+
+
+def choose_interpolation(src_size, dst_size):
+    """
+    Interpolation for a resize from src_size to dst_size
+
+    INTER_AREA averages source pixels and avoids moire when shrinking;
+    INTER_LINEAR is cheaper and smoother when enlarging.
+    """
+    if dst_size[0] < src_size[0] or dst_size[1] < src_size[1]:
+        return cv2.INTER_AREA
+    return cv2.INTER_LINEAR
+
+
+def resize_into(src, dst):
+    """Resize src to dst's size in place, or copy when the sizes already match"""
+    src_size = (src.shape[1], src.shape[0])
+    dst_size = (dst.shape[1], dst.shape[0])
+    if src_size == dst_size:
+        np.copyto(dst, src)
+    else:
+        cv2.resize(src, dst_size, dst=dst, interpolation=choose_interpolation(src_size, dst_size))
+    return dst
+
+
+class FramePreparer:
+    """Turns captured BGR frames into mirrored RGB frames without allocating
+
+    Each frame is colour-converted once into the next buffer of a small
+    ring and mirrored in place. The result is shared by reference: pose
+    inference reads it, annotations are drawn on it (in RGB), and the
+    display only has to resize it. A buffer stays valid until pool_size
+    more frames have been prepared, which must cover every stage that
+    still holds one (inference, the annotated slot, and render).
+    """
+
+    def __init__(self, pool_size=4, mirror=True):
+        self.pool_size = pool_size
+        self.mirror = mirror
+        self.buffers = []
+        self.shape = None
+        self.index = 0
+
+    def _ensure_buffers(self, shape):
+        if shape == self.shape:
+            return
+        self.buffers = [np.empty(shape, dtype=np.uint8) for _ in range(self.pool_size)]
+        self.shape = shape
+        self.index = 0
+
+    def prepare(self, bgr_frame):
+        """
+        Mirrored RGB copy of a BGR frame
+
+        Args:
+            bgr_frame (np.ndarray): Captured frame (left untouched)
+
+        Returns:
+            np.ndarray: Pooled RGB buffer, reused pool_size frames later
+        """
+        self._ensure_buffers(bgr_frame.shape)
+        rgb = self.buffers[self.index]
+        self.index = (self.index + 1) % self.pool_size
+
+        cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2RGB, dst=rgb)
+        if self.mirror:
+            cv2.flip(rgb, 1, dst=rgb)
+        return rgb
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+FitPose Headless Runner
+Capture, pose, angle smoothing and rep counting without Tk, for kiosks
+and servers. Rep and posture events are written as JSON lines.
+
+Usage:
+    python headless.py --exercise "Chest Press" --source 0
+    python headless.py --source session.mp4 --output events.jsonl
+    python headless.py --source session.mp4 --record-trace session.fptrace
+    python headless.py --replay session.fptrace
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# stdout carries only JSON events; status messages printed by the modules
+# below (including at import time) are sent to stderr instead. Spawned
+# pose workers re-import this script as __mp_main__ and share the same stdout.
+EVENT_STREAM = sys.stdout
+if __name__ in ("__main__", "__mp_main__"):
+    sys.stdout = sys.stderr
+
+import config
+from camera_manager import CameraManager
+from frame_pacer import FramePacer
+from frame_pipeline import LatestSlot
+from landmark_trace import LandmarkTrace, TraceRecorder, replay
+from pose_estimator import PoseEstimator
+from posture_monitor import PostureMonitor
+
+
+class JsonLineWriter:
+    """Writes one JSON object per line to a file or stdout"""
+
+    def __init__(self, path=None):
+        self.stream = open(path, "a", encoding="utf-8") if path else EVENT_STREAM
+        self.owns_stream = path is not None
+
+    def write(self, event):
+        self.stream.write(json.dumps(event) + "\n")
+        self.stream.flush()
+
+    def close(self):
+        if self.owns_stream:
+            self.stream.close()
+
+
+def run(exercise, source, writer, max_frames=None, duration=None, realtime=False,
+        trace_path=None):
+    """
+    Monitor one exercise from a source until it ends or a limit is hit
+
+    Live devices are read on the capture thread and only the newest frame
+    is processed. Recordings are read frame by frame, as fast as possible
+    unless `realtime` paces them at their own frame rate. With `trace_path`
+    every frame's landmarks are also recorded for later replay.
+
+    Returns:
+        dict: Summary with frame count, throughput and reps
+    """
+    estimator = PoseEstimator.from_config()
+    if not estimator.available:
+        raise RuntimeError("MediaPipe is required for headless monitoring")
+
+    monitor = PostureMonitor(exercise, smoothing_window=config.ANGLE_SMOOTHING_WINDOW,
+                             on_event=writer.write)
+    camera = CameraManager(
+        source,
+        loop=False,
+        pool_size=config.CAPTURE_POOL_SIZE,
+        width=config.CAMERA_WIDTH,
+        height=config.CAMERA_HEIGHT,
+        fps=config.CAMERA_FPS
+    )
+    if not camera.open():
+        raise RuntimeError(f"Cannot open source: {source}")
+
+    recorder = None
+    if trace_path:
+        recorder = TraceRecorder(trace_path, metadata={"exercise": exercise, "source": str(source)})
+
+    estimator.start()
+    frames = 0
+    started = time.monotonic()
+
+    try:
+        if camera.source.live:
+            captured = LatestSlot("captured")
+            camera.start(callback=captured.put)
+            pacer = None
+        else:
+            pacer = FramePacer(camera.source.fps) if realtime else None
+
+        while True:
+            if camera.source.live:
+                frame = captured.take(timeout=1.0)
+                if frame is None:
+                    if not camera.running:
+                        break
+                    continue
+            else:
+                frame = camera.read()
+                if frame is None:
+                    break
+
+            landmarks = estimator.estimate(frame.image, frame.timestamp)
+            monitor.process_landmarks(landmarks, frame.timestamp, estimator.world_landmarks)
+            if recorder:
+                recorder.append(frame.timestamp, landmarks)
+            frames += 1
+
+            if max_frames and frames >= max_frames:
+                break
+            if duration and time.monotonic() - started >= duration:
+                break
+            if pacer:
+                pacer.wait()
+
+    except KeyboardInterrupt:
+        pass
+    finally:
+        camera.stop()
+        estimator.stop()
+        if recorder:
+            recorder.close()
+
+    elapsed = time.monotonic() - started
+    return {
+        "event": "summary",
+        "exercise": exercise,
+        "frames": frames,
+        "elapsed": round(elapsed, 3),
+        "fps": round(frames / elapsed, 1) if elapsed > 0 else 0.0,
+        "reps": monitor.rep_count,
+    }
+
+
+def run_replay(exercise, trace_path, writer):
+    """Push a recorded landmark trace through the monitor, skipping capture and pose"""
+    trace = LandmarkTrace(trace_path)
+    monitor = PostureMonitor(exercise, smoothing_window=config.ANGLE_SMOOTHING_WINDOW,
+                             on_event=writer.write)
+
+    started = time.monotonic()
+    replay(trace, monitor)
+    elapsed = time.monotonic() - started
+
+    return {
+        "event": "summary",
+        "exercise": exercise,
+        "frames": len(trace),
+        "elapsed": round(elapsed, 3),
+        "fps": round(len(trace) / elapsed, 1) if elapsed > 0 else 0.0,
+        "reps": monitor.rep_count,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FitPose headless posture monitor")
+    parser.add_argument("--exercise", default="Chest Press",
+                        help="Exercise to monitor (default: Chest Press)")
+    parser.add_argument("--source", default=str(config.CAMERA_SOURCE),
+                        help="Camera index, video file or image directory")
+    parser.add_argument("--output", help="Append JSON lines to this file instead of stdout")
+    parser.add_argument("--max-frames", type=int, help="Stop after this many frames")
+    parser.add_argument("--duration", type=float, help="Stop after this many seconds")
+    parser.add_argument("--realtime", action="store_true",
+                        help="Pace recordings at their own frame rate")
+    parser.add_argument("--record-trace", metavar="PATH",
+                        help="Also record every frame's landmarks to this trace")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="Replay a recorded landmark trace instead of capturing")
+    args = parser.parse_args(argv)
+
+    writer = JsonLineWriter(args.output)
+    try:
+        if args.replay:
+            summary = run_replay(args.exercise, args.replay, writer)
+        else:
+            summary = run(args.exercise, args.source, writer, args.max_frames,
+                          args.duration, args.realtime, args.record_trace)
+    except (RuntimeError, OSError, ValueError) as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+    else:
+        writer.write(summary)
+    finally:
+        writer.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+Kinematics
+Joint angles, angular velocity and acceleration over whole landmark recordings
+"""
+import math
+from collections import namedtuple
+
+import numpy as np
+from angle_engine import MIN_VISIBILITY, joint_angles
+from exercises import EXERCISE_ANGLES, resolve_exercise_name
+
+# angles in degrees, velocity in degrees/s, acceleration in degrees/s^2,
+# each (T, n_angles) with columns in `names` order
+Kinematics = namedtuple("Kinematics", ["names", "timestamps", "angles", "velocity", "acceleration"])
+
+METHODS = ("gradient", "savgol")
+
+
+def angle_series(landmarks, triplets, chunk_frames=4096, min_visibility=MIN_VISIBILITY, dims=2):
+    """
+    Joint angles for every frame of a recording
+
+    Reads the input chunk_frames at a time, so a memory-mapped (T, 33, 4)
+    trace is never loaded whole; only the small (T, N) result is kept.
+
+    Args:
+        landmarks (np.ndarray): (T, 33, 4) landmarks, e.g. LandmarkTrace.landmarks
+        triplets (np.ndarray): (N, 3) joint index triplets
+        chunk_frames (int): Frames read and processed per step
+        min_visibility (float): Angles with a less visible joint are NaN
+        dims (int): 2 for image landmarks, 3 for world landmarks
+
+    Returns:
+        np.ndarray: (T, N) float32 angles in degrees
+    """
+    triplets = np.asarray(triplets, dtype=np.intp).reshape(-1, 3)
+    frames = len(landmarks)
+    angles = np.empty((frames, len(triplets)), dtype=np.float32)
+    for start in range(0, frames, chunk_frames):
+        stop = min(start + chunk_frames, frames)
+        angles[start:stop] = joint_angles(np.asarray(landmarks[start:stop]), triplets,
+                                          min_visibility, dims)
+    return angles
+
+
+def savgol_matrix(window, polyorder, deriv=0, delta=1.0):
+    """
+    Savitzky-Golay weights for every position of a window
+
+    Row i gives the deriv-th derivative, at sample i, of the polynomial
+    least-squares fit over the window. The middle row is the usual
+    convolution kernel; the others handle the first and last samples.
+
+    Returns:
+        np.ndarray: (window, window) weights
+    """
+    half = window // 2
+    x = np.arange(-half, half + 1, dtype=np.float64)
+    fit = np.linalg.pinv(np.vander(x, polyorder + 1, increasing=True))
+
+    # deriv-th derivative of x**j at each sample
+    basis = np.zeros((window, polyorder + 1))
+    for j in range(deriv, polyorder + 1):
+        basis[:, j] = math.perm(j, deriv) * x ** (j - deriv)
+    return basis @ fit / delta ** deriv
+
+
+def savgol_filter(values, window=9, polyorder=3, deriv=0, delta=1.0):
+    """
+    Savitzky-Golay smoothing or differentiation along axis 0
+
+    Edges are fitted with the first and last full window rather than
+    padded. The window shrinks for series shorter than it. NaN samples
+    spread to every output whose window contains them.
+
+    Args:
+        values (np.ndarray): (T, N) uniformly sampled series
+        window (int): Odd window length in samples
+        polyorder (int): Fitted polynomial order, below window
+        deriv (int): Derivative order (0 smooths)
+        delta (float): Sample spacing, e.g. seconds per frame
+
+    Returns:
+        np.ndarray: (T, N) float64 result
+
+    Raises:
+        ValueError: If window is not a positive odd number
+    """
+    if window < 1 or window % 2 == 0:
+        raise ValueError(f"Savitzky-Golay window must be a positive odd number, got {window}")
+
+    values = np.asarray(values, dtype=np.float64)
+    frames = len(values)
+    window = min(window, frames if frames % 2 else frames - 1)
+    polyorder = min(polyorder, window - 1)
+    if window < 1 or deriv > polyorder:
+        return np.zeros(values.shape)
+
+    weights = savgol_matrix(window, polyorder, deriv, delta)
+    half = window // 2
+    out = np.empty(values.shape)
+
+    kernel = weights[half, ::-1]
+    for column in range(values.shape[1]):
+        out[half:frames - half, column] = np.convolve(values[:, column], kernel, mode="valid")
+    out[:half] = weights[:half] @ values[:window]
+    out[frames - half:] = weights[half + 1:] @ values[frames - window:]
+    return out
+
+
+def compute_kinematics(landmarks, joint_triplets, timestamps=None, fps=30.0, method="gradient",
+                       window=9, polyorder=3, chunk_frames=4096, min_visibility=MIN_VISIBILITY,
+                       dims=2):
+    """
+    Angles and their first two time derivatives for a whole recording
+
+    Args:
+        landmarks (np.ndarray): (T, 33, 4) landmarks; may be memory-mapped
+        joint_triplets (dict): Name -> [a, b, c], e.g. EXERCISE_ANGLES[...]["landmarks"]
+        timestamps (np.ndarray): (T,) frame times in seconds; None means uniform at fps
+        fps (float): Frame rate used when timestamps is None
+        method (str): "gradient" (central finite differences, exact for uneven
+            timestamps) or "savgol" (smoothed, assumes the median frame spacing).
+            Frames sharing a timestamp get the derivatives of the first of them
+        window (int): Savitzky-Golay window in frames
+        polyorder (int): Savitzky-Golay polynomial order
+        chunk_frames (int): Frames read per step while measuring angles
+        dims (int): 3 when landmarks are world landmarks (3D angles)
+
+    Returns:
+        Kinematics: float32 angles, velocity and acceleration, (T, N) each
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown derivative method: {method}")
+
+    names = tuple(joint_triplets)
+    triplets = [joint_triplets[name] for name in names]
+    angles = angle_series(landmarks, triplets, chunk_frames, min_visibility, dims)
+
+    frames = len(angles)
+    if timestamps is None:
+        timestamps = np.arange(frames, dtype=np.float64) / fps
+    else:
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+
+    # A repeated timestamp would be a zero time step: differentiate over
+    # the distinct times only, then copy the result back to every frame
+    times, first, inverse = np.unique(timestamps, return_index=True, return_inverse=True)
+    distinct = angles[first]
+
+    if len(times) < 2:
+        velocity = np.zeros_like(distinct)
+        acceleration = np.zeros_like(distinct)
+    elif method == "gradient":
+        velocity = np.gradient(distinct, times, axis=0)
+        acceleration = np.gradient(velocity, times, axis=0)
+    else:
+        delta = float(np.median(np.diff(times)))
+        velocity = savgol_filter(distinct, window, polyorder, 1, delta)
+        acceleration = savgol_filter(distinct, window, polyorder, 2, delta)
+    velocity = velocity[inverse]
+    acceleration = acceleration[inverse]
+
+    return Kinematics(names, timestamps, angles, velocity.astype(np.float32),
+                      acceleration.astype(np.float32))
+
+
+def trace_kinematics(trace, exercise_name, **options):
+    """
+    compute_kinematics for a recorded LandmarkTrace and one exercise
+
+    Frames without a pose are stored as zeros, so their angles are NaN.
+    Traces hold image landmarks only, so angles are always 2D here.
+    """
+    rules = EXERCISE_ANGLES[resolve_exercise_name(exercise_name)]
+    return compute_kinematics(trace.landmarks, rules["landmarks"], trace.timestamps, **options)
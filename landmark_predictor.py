@@ -0,0 +1,97 @@
+"""
+Landmark Predictor
+Extrapolates landmarks forward by the pipeline's capture-to-display latency
+"""
+import numpy as np
+from pose_landmarks import VISIBILITY
+
+
+class LandmarkPredictor:
+    """Predicts where each landmark will be when its frame reaches the screen
+
+    Per-landmark velocity is the least-squares slope over the last `history`
+    frames. The pose is moved along it by the requested horizon, subject to
+    a confidence clamp that keeps the prediction from overshooting:
+
+    - the horizon is capped at max_horizon seconds
+    - a landmark never moves further than max_ratio times the distance it
+      covered over the history window, so a stroke that is slowing down or
+      turning around is not thrown past its end point
+    - the move is scaled down for landmarks whose visibility is near or
+      below min_visibility, down to no extrapolation at all
+    """
+
+    def __init__(self, history=4, max_horizon=0.15, max_ratio=1.0, min_visibility=0.5,
+                 max_gap=0.5, columns=3):
+        self.history = max(2, int(history))
+        self.max_horizon = max_horizon
+        self.max_ratio = max_ratio
+        self.min_visibility = min_visibility
+        self.max_gap = max_gap  # seconds without a pose before the history is dropped
+        self.columns = columns
+        self.positions = None  # (history, 33, columns) ring buffer
+        self.times = np.zeros(self.history)
+        self.reset()
+
+    def predict(self, landmarks, timestamp, horizon):
+        """
+        Record a frame and extrapolate it
+
+        Args:
+            landmarks (np.ndarray): (33, 4) landmarks, or None when no pose was found
+            timestamp (float): Capture time of the frame in seconds
+            horizon (float): Seconds to look ahead, e.g. FramePipeline.latency()
+
+        Returns:
+            np.ndarray: New (33, 4) array with predicted x, y, z, or None
+        """
+        if landmarks is None:
+            self.reset()
+            return None
+
+        if self.count and timestamp - self.times[self.newest] > self.max_gap:
+            self.reset()
+        if self.count and timestamp <= self.times[self.newest]:
+            # Same frame again (e.g. an estimated stride frame): replace it
+            self.index = self.newest
+            self.count -= 1
+        self.record(landmarks, timestamp)
+
+        horizon = min(max(horizon, 0.0), self.max_horizon)
+        if self.count < 2 or horizon == 0.0:
+            return landmarks.copy()
+
+        # Least-squares velocity per coordinate over the buffered frames
+        times = self.times[:self.count]
+        positions = self.positions[:self.count]
+        centered = times - times.mean()
+        velocity = np.tensordot(centered, positions, axes=1) / np.dot(centered, centered)
+        offset = velocity * horizon
+
+        # Clamp: no further than the recent travel, less for uncertain landmarks
+        oldest = self.index if self.count == self.history else 0
+        travel = np.linalg.norm(self.positions[self.newest] - self.positions[oldest], axis=1)
+        distance = np.linalg.norm(offset, axis=1)
+        scale = np.minimum(1.0, self.max_ratio * travel / np.maximum(distance, 1e-12))
+        confidence = (landmarks[:, VISIBILITY] - self.min_visibility) / (1.0 - self.min_visibility)
+        scale *= np.clip(confidence, 0.0, 1.0)
+
+        predicted = landmarks.copy()
+        predicted[:, :self.columns] += offset * scale[:, None]
+        return predicted
+
+    def record(self, landmarks, timestamp):
+        """Store one frame in the ring buffer"""
+        if self.positions is None:
+            self.positions = np.empty((self.history,) + landmarks[:, :self.columns].shape)
+        self.positions[self.index] = landmarks[:, :self.columns]
+        self.times[self.index] = timestamp
+        self.newest = self.index
+        self.index = (self.index + 1) % self.history
+        self.count = min(self.count + 1, self.history)
+
+    def reset(self):
+        """Forget the history, e.g. when tracking is lost"""
+        self.index = 0
+        self.newest = 0
+        self.count = 0
@@ -0,0 +1,156 @@
+"""
+Landmark Trace
+Compact memory-mapped record/replay format for per-frame pose landmarks
+
+A trace is a directory (by convention ending in .fptrace) of raw column
+files plus a small JSON header:
+
+    meta.json       format version, frame count, free-form metadata
+    landmarks.f32   float32 (frames, 33, 4) rows of x, y, z, visibility
+    timestamps.f64  float64 (frames,) frame time in seconds
+    present.u8      uint8 (frames,) 1 when a pose was detected
+
+The recorder appends whole chunks to each column and rewrites the header
+after every chunk, so a crash loses at most one chunk. Readers memory-map
+the columns, so opening an hour-long trace costs no reading at all.
+"""
+import json
+import os
+
+import numpy as np
+from pose_landmarks import NUM_LANDMARKS
+
+TRACE_VERSION = 1
+
+LANDMARKS_FILE = "landmarks.f32"
+TIMESTAMPS_FILE = "timestamps.f64"
+PRESENT_FILE = "present.u8"
+META_FILE = "meta.json"
+
+
+class TraceRecorder:
+    """Appends per-frame landmarks to a trace in fixed-size chunks"""
+
+    def __init__(self, path, chunk_frames=256, metadata=None):
+        self.path = path
+        self.chunk_frames = chunk_frames
+        self.metadata = dict(metadata or {})
+        self.frames = 0
+
+        # Preallocated chunk buffers, written out when full
+        self.landmarks = np.zeros((chunk_frames, NUM_LANDMARKS, 4), dtype=np.float32)
+        self.timestamps = np.zeros(chunk_frames, dtype=np.float64)
+        self.present = np.zeros(chunk_frames, dtype=np.uint8)
+        self.pending = 0
+
+        os.makedirs(path, exist_ok=True)
+        for name in (LANDMARKS_FILE, TIMESTAMPS_FILE, PRESENT_FILE):
+            open(os.path.join(path, name), "wb").close()
+        self._write_meta()
+
+    def append(self, timestamp, landmarks):
+        """
+        Record one frame
+
+        Args:
+            timestamp (float): Frame time in seconds
+            landmarks (np.ndarray): (33, 4) landmarks, or None without a pose
+        """
+        i = self.pending
+        self.timestamps[i] = timestamp
+        if landmarks is None:
+            self.landmarks[i] = 0.0
+            self.present[i] = 0
+        else:
+            self.landmarks[i] = landmarks
+            self.present[i] = 1
+
+        self.pending += 1
+        if self.pending == self.chunk_frames:
+            self.flush()
+
+    def flush(self):
+        """Append buffered frames to the column files"""
+        if self.pending == 0:
+            return
+
+        n = self.pending
+        columns = ((LANDMARKS_FILE, self.landmarks), (TIMESTAMPS_FILE, self.timestamps),
+                   (PRESENT_FILE, self.present))
+        for name, column in columns:
+            with open(os.path.join(self.path, name), "ab") as f:
+                column[:n].tofile(f)
+
+        self.frames += n
+        self.pending = 0
+        self._write_meta()
+
+    def close(self):
+        """Flush the last partial chunk"""
+        self.flush()
+
+    def _write_meta(self):
+        meta = {"version": TRACE_VERSION, "num_landmarks": NUM_LANDMARKS,
+                "frames": self.frames, "metadata": self.metadata}
+        tmp_path = os.path.join(self.path, META_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, os.path.join(self.path, META_FILE))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class LandmarkTrace:
+    """Read-only, memory-mapped view of a recorded trace"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+
+        if meta.get("version") != TRACE_VERSION:
+            raise ValueError(f"Unsupported trace version: {meta.get('version')}")
+
+        self.frames = meta["frames"]
+        self.metadata = meta.get("metadata", {})
+        self.landmarks = self._map(LANDMARKS_FILE, np.float32, (self.frames, meta["num_landmarks"], 4))
+        self.timestamps = self._map(TIMESTAMPS_FILE, np.float64, (self.frames,))
+        self.present = self._map(PRESENT_FILE, np.uint8, (self.frames,))
+
+    def _map(self, name, dtype, shape):
+        if self.frames == 0:
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(os.path.join(self.path, name), dtype=dtype, mode="r", shape=shape)
+
+    def __len__(self):
+        return self.frames
+
+    def frame(self, index):
+        """(timestamp, landmarks or None) for one frame"""
+        if not self.present[index]:
+            return float(self.timestamps[index]), None
+        return float(self.timestamps[index]), self.landmarks[index]
+
+    def __iter__(self):
+        for index in range(self.frames):
+            yield self.frame(index)
+
+
+def replay(trace, monitor):
+    """
+    Feed a trace through a PostureMonitor as fast as possible
+
+    Args:
+        trace (LandmarkTrace): Recorded landmarks
+        monitor (PostureMonitor): Monitor configured with the rules to test
+
+    Returns:
+        PostureMonitor: The same monitor, for reading rep_count and status
+    """
+    for timestamp, landmarks in trace:
+        monitor.process_landmarks(landmarks, timestamp)
+    return monitor
@@ -121,6 +121,9 @@ class FitPoseApp:
         # Bind escape key
         self.root.bind('<Escape>', lambda e: self.quit_app())
         
+        # Closing the window must also stop the camera and pose worker process
+        self.root.protocol("WM_DELETE_WINDOW", self.quit_app)
+        
         # Store selected exercise
         self.selected_exercise = None
     
@@ -0,0 +1,183 @@
+"""
+Pose Estimator
+MediaPipe pose inference with the stride, ROI and worker-process options
+"""
+import sys
+
+import cv2
+import config
+from filters import LandmarkOneEuro
+from pose_landmarks import LandmarkStride, results_to_arrays
+from pose_worker import POSE_OPTIONS, PoseWorkerProcess
+from roi_tracker import RoiTracker
+
+# Try to import MediaPipe with proper error handling. Status goes to
+# stderr: this runs on import in every process, including pose workers
+# spawned from the headless runner, whose stdout carries only JSON events.
+try:
+    import mediapipe as mp
+    MEDIAPIPE_AVAILABLE = hasattr(mp, 'solutions')
+    print("✓ MediaPipe successfully imported", file=sys.stderr)
+except ImportError as e:
+    MEDIAPIPE_AVAILABLE = False
+    print(f"✗ MediaPipe not available: {e}", file=sys.stderr)
+    print("Please install: pip install mediapipe", file=sys.stderr)
+
+
+class PoseEstimator:
+    """Turns BGR frames into (33, 4) landmark arrays
+
+    Inference runs every `stride` frames (estimating the frames between),
+    optionally on a landmark-guided crop, and optionally in a separate
+    worker process. Falls back to in-process MediaPipe if the worker fails.
+    With smoothing enabled every landmark goes through a One Euro filter
+    bank, so angles and overlays all see the same steadied skeleton.
+    """
+
+    def __init__(self, stride=1, max_gap=0.5, use_roi=False, roi_margin=0.25,
+                 roi_max_side=None, use_worker=False, max_width=640, max_height=480,
+                 smoothing=False, smoothing_min_cutoff=1.0, smoothing_beta=5.0):
+        self.available = MEDIAPIPE_AVAILABLE
+        self.stride = LandmarkStride(stride, max_gap)
+        self.world_stride = LandmarkStride(stride, max_gap)
+        self.world_landmarks = None  # metric landmarks for the last estimated frame
+        self.landmark_filter = None
+        self.world_filter = None
+        if smoothing:
+            self.landmark_filter = LandmarkOneEuro(smoothing_min_cutoff, smoothing_beta)
+            self.world_filter = LandmarkOneEuro(smoothing_min_cutoff, smoothing_beta)
+        self.roi_tracker = None
+        if use_roi:
+            self.roi_tracker = RoiTracker(margin=roi_margin, max_side=roi_max_side)
+        self.use_worker = use_worker
+        self.max_width = max_width
+        self.max_height = max_height
+        self.pose = None
+        self.worker = None
+
+    @classmethod
+    def from_config(cls, **overrides):
+        """Estimator configured from config.py; keyword arguments override single settings"""
+        options = dict(
+            stride=config.POSE_INFERENCE_STRIDE,
+            max_gap=config.POSE_MAX_ESTIMATE_GAP,
+            use_roi=config.POSE_ROI_ENABLED,
+            roi_margin=config.POSE_ROI_MARGIN,
+            roi_max_side=config.POSE_ROI_MAX_SIDE,
+            use_worker=config.POSE_WORKER_PROCESS,
+            max_width=config.CAMERA_WIDTH,
+            max_height=config.CAMERA_HEIGHT,
+            smoothing=config.LANDMARK_SMOOTHING,
+            smoothing_min_cutoff=config.LANDMARK_MIN_CUTOFF,
+            smoothing_beta=config.LANDMARK_BETA
+        )
+        options.update(overrides)
+        return cls(**options)
+
+    def start(self):
+        """Load the model (in the worker process when enabled)"""
+        if not self.available:
+            return
+        if self.use_worker:
+            self.worker = PoseWorkerProcess(self.max_width, self.max_height)
+            self.worker.start()
+        else:
+            self.create_pose()
+
+    def create_pose(self):
+        """Initialize in-process MediaPipe Pose"""
+        try:
+            self.pose = mp.solutions.pose.Pose(**POSE_OPTIONS)
+            print("✓ MediaPipe Pose initialized")
+        except TypeError:
+            self.pose = mp.solutions.pose.Pose()
+            print("✓ MediaPipe Pose initialized (old version)")
+
+    def stop(self):
+        """Release the model and stop the worker process"""
+        if self.worker:
+            self.worker.stop()
+            self.worker = None
+        if self.pose:
+            try:
+                self.pose.close()
+            except Exception:
+                pass
+            self.pose = None
+
+    def reset(self):
+        """Forget tracked poses, e.g. when the exercise changes"""
+        self.stride.reset()
+        self.world_stride.reset()
+        self.world_landmarks = None
+        for landmark_filter in (self.landmark_filter, self.world_filter):
+            if landmark_filter:
+                landmark_filter.reset()
+        if self.roi_tracker:
+            self.roi_tracker.reset()
+
+    def estimate(self, frame, timestamp, rgb=False):
+        """
+        Landmarks for one frame
+
+        Args:
+            frame (np.ndarray): BGR frame, or RGB when rgb is True
+            timestamp (float): Frame time in seconds
+            rgb (bool): Frame is already RGB, so no conversion is needed
+
+        Returns:
+            np.ndarray: (33, 4) landmarks, or None when no pose is tracked.
+                The matching world landmarks are left in self.world_landmarks.
+        """
+        # Only every Nth frame pays for inference; the rest are estimated
+        if self.stride.should_infer():
+            landmarks, world = self.detect(frame, rgb)
+            self.stride.update(landmarks, timestamp)
+            self.world_stride.update(world, timestamp)
+        else:
+            landmarks = self.stride.estimate(timestamp)
+            world = self.world_stride.estimate(timestamp)
+
+        self.world_landmarks = self.smooth(self.world_filter, world, timestamp)
+        return self.smooth(self.landmark_filter, landmarks, timestamp)
+
+    @staticmethod
+    def smooth(landmark_filter, landmarks, timestamp):
+        """Filtered copy of landmarks; a lost pose restarts the filter"""
+        if landmark_filter is None:
+            return landmarks
+        if landmarks is None:
+            landmark_filter.reset()
+            return None
+        return landmark_filter.update(landmarks, timestamp)
+
+    def detect(self, frame, rgb=False):
+        """
+        Run pose inference, cropped to the tracked region when enabled
+
+        Returns:
+            tuple: ((33, 4) landmarks, (33, 4) world landmarks), either may be None
+        """
+        if self.roi_tracker is None:
+            rgb_frame = frame if rgb else cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            return self.run_pose(rgb_frame)
+
+        # Cropping first means only the region is converted
+        roi_image, roi = self.roi_tracker.crop(frame)
+        rgb_frame = roi_image if rgb else cv2.cvtColor(roi_image, cv2.COLOR_BGR2RGB)
+
+        # World landmarks are metric around the hips, so the crop does not affect them
+        landmarks, world = self.run_pose(rgb_frame)
+        if landmarks is not None:
+            landmarks = self.roi_tracker.to_full_frame(landmarks, roi)
+        self.roi_tracker.update(landmarks)
+        return landmarks, world
+
+    def run_pose(self, rgb_frame):
+        """Pose inference on an RGB image, in the worker process when available"""
+        if self.worker and self.worker.available():
+            return self.worker.process(rgb_frame)
+
+        if self.pose is None:
+            self.create_pose()
+        return results_to_arrays(self.pose.process(rgb_frame))
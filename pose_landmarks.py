@@ -0,0 +1,164 @@
+"""
+Pose Landmarks
+Array form of MediaPipe pose landmarks and inference-stride estimation
+"""
+from itertools import chain
+
+import numpy as np
+
+NUM_LANDMARKS = 33
+
+# Columns of a (33, 4) landmark array
+X, Y, Z, VISIBILITY = 0, 1, 2, 3
+
+
+# Protobuf wire layout of a landmark with every field set: a length-delimited
+# record (tag 0x0A, length) holding fixed32 fields x, y, z, visibility and,
+# in newer MediaPipe, presence, each as a tag byte plus a little-endian float.
+def _record_layouts():
+    """Record size -> (field count, [(byte offset, expected bytes for all 33)])"""
+    layouts = {}
+    for fields in (4, 5):
+        tags = [0x0A, 5 * fields] + [(n << 3) | 5 for n in range(1, fields + 1)]
+        offsets = [0, 1] + [2 + 5 * i for i in range(fields)]
+        layouts[2 + 5 * fields] = (
+            fields, [(offset, bytes([tag]) * NUM_LANDMARKS) for offset, tag in zip(offsets, tags)])
+    return layouts
+
+
+_RECORD_LAYOUTS = _record_layouts()
+
+
+def _parse_wire(pose_landmarks):
+    """(33, 4) array read straight from the serialized message, or None"""
+    serialize = getattr(pose_landmarks, "SerializeToString", None)
+    if serialize is None:
+        return None
+
+    data = serialize()
+    record, remainder = divmod(len(data), NUM_LANDMARKS)
+    layout = _RECORD_LAYOUTS.get(record)
+    if remainder or layout is None:
+        return None
+
+    # Strided byte slices check every record's tags without touching the floats
+    fields, tags = layout
+    for offset, expected in tags:
+        if data[offset::record] != expected:
+            return None  # an unset field or an unexpected schema
+
+    records = np.frombuffer(data, dtype=np.uint8).reshape(NUM_LANDMARKS, record)
+    values = records[:, 2:].reshape(NUM_LANDMARKS, fields, 5)[:, :4, 1:]
+    return np.ascontiguousarray(values).view("<f4").reshape(NUM_LANDMARKS, 4).astype(
+        np.float32, copy=False)
+
+
+def landmarks_to_array(pose_landmarks):
+    """
+    Convert MediaPipe pose landmarks into a (33, 4) float32 array
+
+    This is the only place protobuf fields are read; everything downstream
+    works on the array.
+
+    Args:
+        pose_landmarks: results.pose_landmarks (or pose_world_landmarks)
+
+    Returns:
+        np.ndarray: Rows of (x, y, z, visibility), or None without a pose
+    """
+    if pose_landmarks is None:
+        return None
+
+    # Serializing in C and viewing the floats in place is several times
+    # faster than 132 protobuf attribute reads
+    landmarks = _parse_wire(pose_landmarks)
+    if landmarks is not None:
+        return landmarks
+
+    values = chain.from_iterable((lm.x, lm.y, lm.z, lm.visibility)
+                                 for lm in pose_landmarks.landmark)
+    return np.fromiter(values, dtype=np.float32, count=NUM_LANDMARKS * 4).reshape(NUM_LANDMARKS, 4)
+
+
+def results_to_arrays(results):
+    """
+    Image and world landmarks from one MediaPipe Pose result
+
+    World landmarks are metric (x, y, z) in metres around the hip centre;
+    older MediaPipe releases do not provide them.
+
+    Returns:
+        tuple: ((33, 4) landmarks or None, (33, 4) world landmarks or None)
+    """
+    landmarks = landmarks_to_array(results.pose_landmarks)
+    if landmarks is None:
+        return None, None
+    return landmarks, landmarks_to_array(getattr(results, "pose_world_landmarks", None))
+
+
+class LandmarkStride:
+    """Runs pose inference every Nth frame and estimates the frames between
+
+    A skipped frame is always newer than the latest result, so its landmarks
+    are extrapolated linearly from the two most recent pose results, at most
+    one inference interval past the latest; visibility is not extrapolated.
+    Angle and rep logic therefore still receive a sample on every frame.
+    """
+
+    def __init__(self, stride=1, max_gap=0.5):
+        self.stride = max(1, int(stride))
+        self.max_gap = max_gap  # seconds before an old pose is considered lost
+        self.frame_index = 0
+        self.previous = None  # (timestamp, landmarks)
+        self.latest = None
+
+    def should_infer(self):
+        """True when this frame is due for a real pose inference"""
+        due = self.frame_index % self.stride == 0 or self.latest is None
+        self.frame_index += 1
+        return due
+
+    def update(self, landmarks, timestamp):
+        """Store a fresh inference result (None when no pose was found)"""
+        if landmarks is None:
+            self.previous = None
+            self.latest = None
+            return
+        self.previous = self.latest
+        self.latest = (timestamp, landmarks)
+
+    def estimate(self, timestamp):
+        """
+        Landmarks for a frame that skipped inference
+
+        Args:
+            timestamp (float): Capture time of the frame
+
+        Returns:
+            np.ndarray: Estimated (33, 4) landmarks, or None if tracking is lost
+        """
+        if self.latest is None:
+            return None
+
+        t1, latest = self.latest
+        if timestamp - t1 > self.max_gap:
+            return None
+        if self.previous is None:
+            return latest
+
+        t0, previous = self.previous
+        if t1 <= t0:
+            return latest
+
+        alpha = min((timestamp - t0) / (t1 - t0), 2.0)
+        estimated = previous + (latest - previous) * alpha
+
+        # Visibility is a confidence, not a position: keep the measured value
+        estimated[:, VISIBILITY] = latest[:, VISIBILITY]
+        return estimated
+
+    def reset(self):
+        """Drop stored poses, e.g. when the exercise changes"""
+        self.frame_index = 0
+        self.previous = None
+        self.latest = None
@@ -0,0 +1,270 @@
+"""
+Pose Worker Process
+Runs MediaPipe Pose in a separate process with shared-memory frame hand-off
+"""
+import multiprocessing as mp
+import queue
+import threading
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+from pose_landmarks import NUM_LANDMARKS, results_to_arrays
+
+POSE_OPTIONS = {
+    "static_image_mode": False,
+    "model_complexity": 1,
+    "smooth_landmarks": True,
+    "min_detection_confidence": 0.5,
+    "min_tracking_confidence": 0.5,
+}
+
+
+def _pose_worker_main(slot_names, result_name, num_slots, request_queue, result_queue, options):
+    """Worker process entry point: read frames from slots, write landmarks back"""
+    frame_shms = [shared_memory.SharedMemory(name=name) for name in slot_names]
+    result_shm = shared_memory.SharedMemory(name=result_name)
+    results = np.ndarray((num_slots, 2, NUM_LANDMARKS, 4), dtype=np.float32, buffer=result_shm.buf)
+    pose = None
+
+    try:
+        try:
+            import mediapipe as mediapipe
+            pose = mediapipe.solutions.pose.Pose(**options)
+        except Exception as e:
+            result_queue.put(("error", str(e)))
+            return
+
+        result_queue.put(("ready",))
+
+        while True:
+            request = request_queue.get()
+            if request is None:
+                break
+
+            slot, seq, height, width = request
+            image = np.ndarray((height, width, 3), dtype=np.uint8, buffer=frame_shms[slot].buf)
+            output = pose.process(image)
+            del image
+
+            landmarks, world = results_to_arrays(output)
+            if landmarks is not None:
+                results[slot, 0] = landmarks
+            if world is not None:
+                results[slot, 1] = world
+            result_queue.put(("result", slot, seq, landmarks is not None, world is not None))
+
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if pose is not None:
+            pose.close()
+        del results
+        result_shm.close()
+        for shm in frame_shms:
+            shm.close()
+
+
+class PoseWorkerProcess:
+    """MediaPipe Pose in its own process so inference does not hold our GIL
+
+    Frames are copied once into a ring of shared-memory slots and only the
+    slot index travels through the request queue; landmarks come back
+    through a small shared (slots, 2, 33, 4) float32 array of image and
+    world landmarks. No image is ever
+    pickled.
+    """
+
+    def __init__(self, max_width=640, max_height=480, num_slots=3, timeout=1.0,
+                 options=None, max_timeouts=3):
+        self.max_width = max_width
+        self.max_height = max_height
+        self.num_slots = num_slots
+        self.timeout = timeout
+        self.max_timeouts = max_timeouts  # consecutive timeouts before giving up on the worker
+        self.timeouts = 0
+        self.options = dict(POSE_OPTIONS, **(options or {}))
+        self.slot_bytes = max_width * max_height * 3
+
+        self.context = mp.get_context("spawn")
+        self.worker = None
+        self.request_queue = None
+        self.result_queue = None
+        self.frame_shms = []
+        self.result_shm = None
+        self.results = None
+
+        self.next_slot = 0
+        self.in_flight = {}  # slot -> seq
+        self.seq = 0
+        self.ready = False
+        self.failed = False
+        self.running = False
+        self.lock = threading.Lock()  # keeps stop() from freeing slots mid-request
+
+    def start(self):
+        """Allocate shared memory and launch the worker (non-blocking)"""
+        self.frame_shms = [shared_memory.SharedMemory(create=True, size=self.slot_bytes)
+                           for _ in range(self.num_slots)]
+        result_bytes = self.num_slots * 2 * NUM_LANDMARKS * 4 * 4
+        self.result_shm = shared_memory.SharedMemory(create=True, size=result_bytes)
+        self.results = np.ndarray((self.num_slots, 2, NUM_LANDMARKS, 4), dtype=np.float32,
+                                  buffer=self.result_shm.buf)
+
+        self.request_queue = self.context.Queue()
+        self.result_queue = self.context.Queue()
+        self.worker = self.context.Process(
+            target=_pose_worker_main,
+            args=([shm.name for shm in self.frame_shms], self.result_shm.name,
+                  self.num_slots, self.request_queue, self.result_queue, self.options),
+            name="pose-worker",
+            daemon=True
+        )
+        self.worker.start()
+        self.running = True
+        print("✓ Pose worker process starting")
+
+    def available(self):
+        """False once the worker has failed or been stopped"""
+        return self.running and not self.failed
+
+    def submit(self, rgb_image):
+        """
+        Copy an RGB image into the next free slot and queue it
+
+        Args:
+            rgb_image (np.ndarray): uint8 (H, W, 3) image
+
+        Returns:
+            int: Sequence number of the request, or None if every slot is busy
+        """
+        if not self.available():
+            return None
+
+        slot = self.next_slot
+        while slot in self.in_flight:
+            # Results of requests we stopped waiting for still free their slots
+            if self.collect(timeout=0) is None:
+                return None
+        self.next_slot = (slot + 1) % self.num_slots
+
+        # Landmarks are normalized, so a uniform downscale keeps them valid
+        height, width = rgb_image.shape[:2]
+        if rgb_image.nbytes > self.slot_bytes:
+            scale = min(self.max_width / width, self.max_height / height)
+            rgb_image = cv2.resize(rgb_image, (int(width * scale), int(height * scale)),
+                                   interpolation=cv2.INTER_AREA)
+            height, width = rgb_image.shape[:2]
+
+        view = np.ndarray((height, width, 3), dtype=np.uint8, buffer=self.frame_shms[slot].buf)
+        view[...] = rgb_image
+        del view
+
+        self.seq += 1
+        self.in_flight[slot] = self.seq
+        self.request_queue.put((slot, self.seq, height, width))
+        return self.seq
+
+    def collect(self, timeout=None):
+        """
+        Wait for the next finished request
+
+        Returns:
+            tuple: (seq, landmarks, world_landmarks), each array None when
+                missing, or None on timeout or worker failure
+        """
+        while self.available():
+            try:
+                message = self.result_queue.get(timeout=self.timeout if timeout is None else timeout)
+            except queue.Empty:
+                if self.worker is not None and not self.worker.is_alive():
+                    self.failed = True
+                    print("✗ Pose worker process exited unexpectedly")
+                return None
+            except (OSError, ValueError):
+                return None
+
+            kind = message[0]
+            if kind == "stopped":
+                return None
+            if kind == "ready":
+                self.ready = True
+                print("✓ Pose worker process ready")
+                continue
+            if kind == "error":
+                self.failed = True
+                print(f"✗ Pose worker failed: {message[1]}")
+                return None
+
+            _, slot, seq, found, has_world = message
+            self.in_flight.pop(slot, None)
+            landmarks = self.results[slot, 0].copy() if found else None
+            world = self.results[slot, 1].copy() if has_world else None
+            return seq, landmarks, world
+
+        return None
+
+    def process(self, rgb_image):
+        """Synchronous inference: (landmarks, world_landmarks) for one image"""
+        with self.lock:
+            seq = self.submit(rgb_image)
+            if seq is None:
+                # Every slot is still held by a request the worker has not answered
+                self.count_timeout()
+                return None, None
+
+            # The first request also waits for MediaPipe to load in the worker
+            timeout = self.timeout if self.ready else max(self.timeout, 30.0)
+            while True:
+                result = self.collect(timeout)
+                if result is None:
+                    self.count_timeout()
+                    return None, None
+                if result[0] == seq:
+                    self.timeouts = 0
+                    return result[1:]
+
+    def count_timeout(self):
+        """Mark the worker failed after max_timeouts timeouts in a row"""
+        if not self.available():
+            return
+        self.timeouts += 1
+        if self.timeouts >= self.max_timeouts:
+            self.failed = True
+            print(f"✗ Pose worker timed out {self.timeouts} times in a row; using in-process pose")
+
+    def stop(self):
+        """Stop the worker and free the shared memory"""
+        if not self.running:
+            return
+        self.running = False
+
+        # Wake a caller blocked in collect() and tell the worker to exit
+        try:
+            self.result_queue.put(("stopped",))
+            self.request_queue.put(None)
+        except (OSError, ValueError):
+            pass
+
+        with self.lock:
+            if self.worker is not None:
+                self.worker.join(timeout=2)
+                if self.worker.is_alive():
+                    self.worker.terminate()
+                    self.worker.join(timeout=1)
+                self.worker = None
+
+            for q in (self.request_queue, self.result_queue):
+                q.close()
+                q.cancel_join_thread()
+
+            self.results = None
+            self.result_shm.close()
+            self.result_shm.unlink()
+            for shm in self.frame_shms:
+                shm.close()
+                shm.unlink()
+            self.frame_shms = []
+            self.in_flight.clear()
+
+        print("✓ Pose worker process stopped")
@@ -0,0 +1,188 @@
+"""
+Posture Monitor
+Tk-free angle smoothing, posture checking and rep counting
+"""
+import numpy as np
+from angle_engine import get_angle_table
+from exercises import EXERCISE_ANGLES, RepEngine, compile_rep_program, resolve_exercise_name
+from exercises.rep_engine import (POSTURE_CORRECT, POSTURE_HOLDING, POSTURE_INCORRECT,
+                                  POSTURE_WAITING)
+from filters import create_filter
+from rep_segmenter import RepSegmenter
+
+# Status colours shared with the camera page
+COLOR_CORRECT = "#4CAF50"
+COLOR_INCORRECT = "#F44336"
+COLOR_WAITING = "#FF9800"
+
+POSTURE_COLORS = {
+    POSTURE_CORRECT: COLOR_CORRECT,
+    POSTURE_INCORRECT: COLOR_INCORRECT,
+    POSTURE_HOLDING: COLOR_WAITING,
+    POSTURE_WAITING: COLOR_WAITING,
+}
+
+
+def get_monitor_config(exercise_name):
+    """Get live-monitoring configuration for specific exercise; raises ValueError if unknown"""
+    return EXERCISE_ANGLES[resolve_exercise_name(exercise_name)]
+
+
+class PostureMonitor:
+    """Posture and repetition state for one exercise, independent of any UI
+
+    Feed it landmarks (or an angle) with the frame timestamp; it keeps the
+    smoothed angle, posture status and rep count, and reports rep and
+    posture changes through the optional on_event callback as plain dicts.
+    Posture and reps come from the exercise's compiled RepEngine; angles
+    are interior joint angles, as in EXERCISE_ANGLES.
+    """
+
+    def __init__(self, exercise_name="Chest Press", smoothing_window=8,
+                 hold_time=0.8, rep_debounce=0.5, on_event=None, smoothing=None):
+        self.on_event = on_event
+
+        # FIX 1: ANGLE STABILIZATION
+        # An explicit smoothing spec wins over the exercise's "smoothing" entry;
+        # without either, a moving average over smoothing_window samples
+        self.smoothing = smoothing
+        self.smoothing_window = smoothing_window
+        self.angle_filter = None
+        self.current_angle = None
+        self.side_angles = (None, None)  # latest raw (left, right) angles
+
+        # FIX 2: CORRECT POSTURE HOLD TIMER
+        self.correct_hold_time = hold_time  # seconds to hold correct posture
+        self.posture_correct = False
+
+        # Rep counting
+        self.rep_count = 0
+        self.rep_debounce = rep_debounce  # seconds between arming and counting a rep
+        self.rep_engine = None
+
+        # Tempo: each finished rep's phases, from turning points of the smoothed angle
+        self.rep_segmenter = None
+        self.last_rep = None  # RepRecord of the latest segmented rep
+
+        # Latest status for display
+        self.status = "Waiting for detection"
+        self.feedback = "Stand in frame"
+        self.status_color = COLOR_WAITING
+
+        self.set_exercise(exercise_name)
+
+    def set_exercise(self, exercise_name):
+        """Switch exercise and clear the tracking state"""
+        self.exercise_name = exercise_name
+        self.exercise_config = get_monitor_config(exercise_name)
+
+        # Angles, posture and reps for every machine in EXERCISE_ANGLES
+        self.angle_table = get_angle_table(exercise_name)
+        self.rep_engine = RepEngine(compile_rep_program(
+            exercise_name, self.exercise_config, self.correct_hold_time, self.rep_debounce))
+        self.rep_segmenter = RepSegmenter(self.rep_engine.program)
+        self.last_rep = None
+
+        spec = self.smoothing or self.exercise_config.get("smoothing") or {
+            "type": "moving_average", "window": self.smoothing_window}
+        self.angle_filter = create_filter(spec)
+        self.current_angle = None
+        self.side_angles = (None, None)
+        self.posture_correct = False
+
+    def reset_counter(self):
+        """Reset the repetition counter"""
+        self.rep_count = 0
+
+    def calculate_angle(self, landmarks, side, world_landmarks=None):
+        """Calculate angle for specific side from a (33, 4) landmark array"""
+        return self.angle_table.angle(landmarks, "left" if side == "left" else "right",
+                                      world_landmarks=world_landmarks)
+
+    def process_landmarks(self, landmarks, timestamp, world_landmarks=None):
+        """
+        Update from one frame's pose
+
+        Args:
+            landmarks (np.ndarray): (33, 4) landmarks, or None without a pose
+            timestamp (float): Frame time in seconds
+            world_landmarks (np.ndarray): (33, 4) metric landmarks, used by
+                exercises measured in world space
+
+        Returns:
+            float: Smoothed angle, or None when no angle could be measured
+        """
+        if landmarks is None:
+            self.side_angles = (None, None)
+            self.set_status("No pose detected", "Stand in frame", COLOR_WAITING, timestamp)
+            return None
+
+        # Both sides in one vectorized call; NaN marks a hidden joint
+        angles = self.angle_table.compute(landmarks, world_landmarks=world_landmarks)
+        left, right = angles[:2]
+        left_angle = None if np.isnan(left) else float(left)
+        right_angle = None if np.isnan(right) else float(right)
+        self.side_angles = (left_angle, right_angle)
+
+        if left_angle is None or right_angle is None:
+            self.set_status("Adjust position", "Ensure joints are visible", COLOR_WAITING, timestamp)
+            return None
+
+        return self.update((left_angle + right_angle) / 2, timestamp)
+
+    def update(self, raw_angle, timestamp):
+        """Smooth a raw angle, then check posture and reps; returns the smoothed angle"""
+        # FIX 1: ANGLE STABILIZATION - constant-time streaming filter
+        smoothed_angle = self.angle_filter.update(raw_angle, timestamp)
+        self.current_angle = smoothed_angle
+
+        self.check_posture_and_reps(smoothed_angle, timestamp)
+        self.segment_reps(smoothed_angle, timestamp)
+        return smoothed_angle
+
+    def segment_reps(self, angle, timestamp):
+        """Feed the tempo segmenter; reports each finished rep as a "tempo" event"""
+        record = self.rep_segmenter.update(angle, timestamp)
+        if record is not None:
+            self.last_rep = record
+            self.emit("tempo", timestamp, **{
+                field: round(float(value), 3) if isinstance(value, float) else value
+                for field, value in record._asdict().items()})
+
+    def check_posture_and_reps(self, angle, timestamp):
+        """Check posture and count repetitions"""
+        # FIX 2: CORRECT POSTURE HOLD TIMER
+        if angle is None:
+            self.rep_engine.reset()
+            self.posture_correct = False
+            self.set_status("Waiting for detection", "Stand in frame", COLOR_WAITING, timestamp)
+            return
+
+        # FIX 3: REP COUNT ONLY IF GREEN BLINK COMPLETES
+        # The engine only counts reps whose target was held for the full hold time
+        if self.rep_engine.update(angle, timestamp):
+            self.rep_count += 1
+            self.emit("rep", timestamp, reps=self.rep_count,
+                      top=round(self.rep_engine.top_time, 3))
+
+        posture, status, feedback = self.rep_engine.status()
+        if posture == POSTURE_HOLDING:
+            status = f"Hold... {self.rep_engine.hold_remaining(timestamp):.1f}s"
+        self.posture_correct = self.rep_engine.posture_correct
+        self.set_status(status, feedback, POSTURE_COLORS[posture], timestamp)
+
+    def set_status(self, status, feedback, color, timestamp):
+        """Store the display status and report posture changes"""
+        changed = feedback != self.feedback
+        self.status = status
+        self.feedback = feedback
+        self.status_color = color
+        if changed:
+            self.emit("posture", timestamp, correct=self.posture_correct,
+                      status=status, feedback=feedback)
+
+    def emit(self, event, timestamp, **fields):
+        """Send an event dict to the on_event callback, if any"""
+        if self.on_event:
+            self.on_event(dict(event=event, exercise=self.exercise_name,
+                               timestamp=round(timestamp, 3), **fields))
@@ -0,0 +1,295 @@
+"""
+Rep Segmenter
+Rep boundaries and tempo from a smoothed joint angle, live or over whole traces
+
+Reps are found from turning points rather than fixed thresholds, so
+partial reps are reported too. The angle is first mapped to "progress"
+towards the exercise's target (negated for flexion exercises), so a rep is
+always valley -> peak -> valley:
+
+    start      the angle leaves the starting valley
+    peak       the angle arrives at the peak (the hold begins)
+    end        the angle arrives at the next valley
+
+A turning point is final once the angle has moved `hysteresis` degrees
+back from it, which bounds the look-ahead to a few frames of movement.
+Arrival and departure are the first and last samples within `plateau`
+degrees of the turning point, so a hold at either end is not counted as
+movement time.
+"""
+from collections import namedtuple
+
+import numpy as np
+from exercises import EXERCISE_ANGLES, get_rep_program, resolve_exercise_name
+from kinematics import angle_series, savgol_filter
+
+# Times in seconds, range_of_motion in degrees, peak_velocity in degrees/s.
+# concentric is start -> peak (towards the target), eccentric is the way back.
+RepRecord = namedtuple("RepRecord", [
+    "start", "peak", "end", "range_of_motion",
+    "concentric", "hold", "eccentric", "peak_velocity", "complete",
+])
+
+# One turning point: progress value and the arrival/departure times around it
+_TurningPoint = namedtuple("_TurningPoint", ["value", "arrive", "leave", "velocity"])
+
+
+def _rep_record(program, valley, peak, end):
+    """RepRecord from valley -> peak -> valley turning points"""
+    complete = True
+    if program:
+        complete = peak.value >= program.edges[1] and end.value <= program.edges[0]
+    return RepRecord(
+        start=valley.leave,
+        peak=peak.arrive,
+        end=end.arrive,
+        range_of_motion=float(peak.value - valley.value),
+        concentric=peak.arrive - valley.leave,
+        hold=peak.leave - peak.arrive,
+        eccentric=end.arrive - peak.leave,
+        peak_velocity=float(max(peak.velocity, end.velocity)),
+        complete=bool(complete),
+    )
+
+
+class RepSegmenter:
+    """Incremental rep segmentation, one smoothed angle sample at a time
+
+    Keeps only the samples since the last turning point, never more than
+    max_phase_samples of them, so memory and per-sample work stay bounded.
+    A phase longer than that keeps its running extreme and the most recent
+    samples.
+    """
+
+    def __init__(self, program=None, hysteresis=10.0, plateau=3.0, max_phase_samples=1800):
+        """
+        Args:
+            program (RepProgram): Compiled exercise; sets the direction and
+                decides whether a rep reached the target and returned.
+                None treats larger angles as the target and every rep as complete
+            hysteresis (float): Degrees the angle must move back to confirm a turn
+            plateau (float): Degrees around a turning point counted as holding
+            max_phase_samples (int): Longest phase kept, in samples
+        """
+        if not 0 <= plateau < hysteresis:
+            raise ValueError("plateau must be smaller than hysteresis")
+        self.program = program
+        self.sign = program.sign if program else 1
+        self.hysteresis = hysteresis
+        self.plateau = plateau
+        self.max_phase_samples = max_phase_samples
+        self.reps = []
+        self.reset()
+
+    def reset(self):
+        """Drop the partial phase, e.g. when tracking is lost"""
+        self.times = []
+        self.values = []
+        self.speeds = []
+        self.direction = -1  # -1 looking for a valley, +1 for a peak
+        self.extreme = None  # index of the running extreme in the buffers
+        self.valley = None
+        self.peak = None
+
+    def update(self, angle, timestamp):
+        """
+        Add one smoothed angle sample
+
+        Args:
+            angle (float): Smoothed joint angle in degrees
+            timestamp (float): Sample time in seconds
+
+        Returns:
+            RepRecord: The rep completed by this sample's turning point, else None
+        """
+        value = self.sign * angle
+        times, values, speeds = self.times, self.values, self.speeds
+
+        speed = 0.0
+        if times and timestamp > times[-1]:
+            speed = abs(value - values[-1]) / (timestamp - times[-1])
+        times.append(timestamp)
+        values.append(value)
+        speeds.append(speed)
+
+        record = None
+        if self.extreme is None:
+            self.extreme = 0
+        extreme_value = values[self.extreme]
+        if (value - extreme_value) * self.direction > 0:
+            self.extreme = len(values) - 1
+        elif (extreme_value - value) * self.direction >= self.hysteresis:
+            record = self.confirm()
+
+        # Also after a turn confirmed at the oldest sample, which keeps them all
+        if len(values) > self.max_phase_samples:
+            # Drop the oldest sample, unless it is the running extreme (e.g.
+            # holding still right after a turning point): then the next oldest
+            drop = 1 if self.extreme == 0 else 0
+            del times[drop], values[drop], speeds[drop]
+            if drop == 0:
+                self.extreme -= 1
+        return record
+
+    def confirm(self):
+        """Close the phase at the running extreme; returns a RepRecord when it ends a rep"""
+        times, values, speeds = self.times, self.values, self.speeds
+        index = self.extreme
+        value = values[index]
+
+        arrive = index
+        while arrive > 0 and abs(values[arrive - 1] - value) <= self.plateau:
+            arrive -= 1
+        leave = index
+        while abs(values[leave + 1] - value) <= self.plateau:
+            leave += 1
+        point = _TurningPoint(float(value), float(times[arrive]), float(times[leave]),
+                              float(max(speeds[1:index + 1], default=0.0)))
+
+        # The next phase starts at this turning point; find its running extreme
+        del times[:index], values[:index], speeds[:index]
+        self.direction = -self.direction
+        pick = max if self.direction > 0 else min
+        self.extreme = pick(range(len(values)), key=values.__getitem__)
+
+        record = None
+        if self.direction > 0:
+            # A valley: it ends the rep started at the previous valley
+            if self.valley is not None and self.peak is not None:
+                record = _rep_record(self.program, self.valley, self.peak, point)
+                self.reps.append(record)
+            self.valley = point
+            self.peak = None
+        else:
+            self.peak = point
+        return record
+
+
+def _turning_points(values, hysteresis):
+    """Indices of confirmed turning points, alternating valley and peak
+
+    Only local extrema can become turning points, so the hysteresis state
+    machine runs over those few candidates instead of every sample.
+    """
+    step = np.diff(values)
+    nonzero = np.flatnonzero(step)
+    if len(nonzero) == 0:
+        return []
+
+    # Candidate extrema: the last sample before the direction of travel changes
+    slope = np.sign(step[nonzero])
+    turns = nonzero[1:][slope[1:] != slope[:-1]]
+    candidates = np.concatenate(([0], turns, [len(values) - 1]))
+    candidate_values = values[candidates].tolist()
+
+    points = []
+    direction, extreme = -1, 0
+    for position in range(1, len(candidates)):
+        value = candidate_values[position]
+        if (value - candidate_values[extreme]) * direction > 0:
+            extreme = position
+        elif (candidate_values[extreme] - value) * direction >= hysteresis:
+            points.append(int(candidates[extreme]))
+            direction = -direction
+            extreme = position
+    return points
+
+
+def segment_reps(angles, timestamps, program=None, hysteresis=10.0, plateau=3.0):
+    """
+    Offline RepSegmenter over a whole smoothed angle series
+
+    NaN samples (frames without a pose) are skipped, as the live monitor
+    skips frames without an angle.
+
+    Args:
+        angles (np.ndarray): (T,) smoothed joint angles in degrees
+        timestamps (np.ndarray): (T,) sample times in seconds
+        program (RepProgram): Compiled exercise, as for RepSegmenter
+        hysteresis (float): Degrees the angle must move back to confirm a turn
+        plateau (float): Degrees around a turning point counted as holding
+
+    Returns:
+        list: RepRecord per rep, in order
+    """
+    angles = np.asarray(angles, dtype=np.float64)
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    valid = ~np.isnan(angles)
+    values = (program.sign if program else 1) * angles[valid]
+    times = timestamps[valid]
+    if len(values) < 3:
+        return []
+
+    points = _turning_points(values, hysteresis)
+    if len(points) < 3:
+        return []
+
+    # Backward-difference speed, as in the live segmenter; 0 where time stalls
+    dt = np.diff(times)
+    speeds = np.zeros(len(values))
+    moving = dt > 0
+    speeds[1:][moving] = np.abs(np.diff(values))[moving] / dt[moving]
+
+    # The phase into turning point k spans (starts[k], points[k]] and the
+    # phase out of it (points[k], ends[k]]; laid end to end each set covers
+    # one contiguous range, so every point is handled by one reduceat
+    points = np.asarray(points)
+    last = len(values) - 1
+    starts = np.concatenate(([0], points[:-1]))
+    ends = np.concatenate((points[1:], [last]))
+    index = np.arange(len(values))
+    point_values = values[points]
+    into = points - starts  # phase lengths, 0 only for a turning point at sample 0
+
+    # Arrival: just after the last sample of the incoming phase outside the plateau
+    outside = np.abs(values[:points[-1]] - np.repeat(point_values, into)) > plateau
+    last_outside = np.maximum.reduceat(np.where(outside, index[:points[-1]], -1), starts)
+    arrive = np.where((into > 0) & (last_outside >= starts), last_outside + 1, starts)
+
+    # Departure: just before the first sample of the outgoing phase outside it
+    outside = np.abs(values[points[0] + 1:] - np.repeat(point_values, ends - points)) > plateau
+    first_outside = np.minimum.reduceat(np.where(outside, index[points[0] + 1:], last + 1),
+                                        points - points[0])
+    leave = np.where(first_outside <= last, first_outside - 1, last)
+
+    # Peak speed of the phase leading into each turning point
+    velocity = np.maximum.reduceat(speeds[1:points[-1] + 1], starts)
+    velocity = np.where(into > 0, velocity, 0.0)
+
+    turning = [_TurningPoint(float(value), float(times[a]), float(times[b]), float(v))
+               for value, a, b, v in zip(point_values, arrive, leave, velocity)]
+
+    # Turning points alternate valley, peak, valley, ...; reps span valley to valley
+    return [_rep_record(program, turning[i], turning[i + 1], turning[i + 2])
+            for i in range(0, len(turning) - 2, 2)]
+
+
+def trace_reps(trace, exercise_name, window=9, polyorder=3, **options):
+    """
+    segment_reps for a recorded LandmarkTrace and one exercise
+
+    Uses the mean of the left and right angles, as the live monitor does,
+    smoothed with a zero-lag Savitzky-Golay filter instead of the live
+    causal filter, so boundaries are not delayed by smoothing lag.
+
+    Args:
+        trace (LandmarkTrace): Recorded landmarks
+        exercise_name (str): Exercise whose angles and rep program to use
+        window (int): Savitzky-Golay window in frames
+        polyorder (int): Savitzky-Golay polynomial order
+        **options: hysteresis and plateau for segment_reps
+
+    Returns:
+        list: RepRecord per rep, in order
+    """
+    program = get_rep_program(exercise_name)
+    rules = EXERCISE_ANGLES[resolve_exercise_name(exercise_name)]["landmarks"]
+    angles = angle_series(trace.landmarks, [rules["left"], rules["right"]]).mean(axis=1)
+
+    # Smooth each run of frames with a pose separately; the gaps stay NaN
+    smoothed = np.full(len(angles), np.nan)
+    valid = np.concatenate(([False], ~np.isnan(angles), [False]))
+    edges = np.flatnonzero(valid[1:] != valid[:-1]).reshape(-1, 2)
+    for start, stop in edges:
+        smoothed[start:stop] = savgol_filter(angles[start:stop, None], window, polyorder)[:, 0]
+    return segment_reps(smoothed, trace.timestamps, program, **options)
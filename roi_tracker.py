@@ -0,0 +1,110 @@
+"""
+ROI Tracker
+Crops pose inference input to the region around the previous pose
+"""
+import cv2
+import numpy as np
+from pose_landmarks import X, Y, Z, VISIBILITY
+
+
+class RoiTracker:
+    """Landmark-guided region of interest for pose inference
+
+    The box around the previous frame's visible landmarks, grown by a
+    margin, is cropped out of the next frame (and downscaled if it is still
+    larger than max_side). Landmarks found in the crop are mapped back to
+    full-frame coordinates. Losing the pose falls back to the full frame.
+    """
+
+    def __init__(self, margin=0.25, min_size=0.3, max_side=None,
+                 visibility_threshold=0.3, joints=None):
+        self.margin = margin  # fraction of the box size added on each side
+        self.min_size = min_size  # smallest crop as a fraction of the frame
+        self.max_side = max_side  # downscale crops larger than this (pixels)
+        self.visibility_threshold = visibility_threshold
+        self.joints = joints  # landmark indices that define the box (None = all)
+        self.roi = None  # normalized (x0, y0, x1, y1) or None for full frame
+
+    def crop(self, frame):
+        """
+        Cut the inference input out of a full frame
+
+        Args:
+            frame (np.ndarray): Full frame (H, W, C)
+
+        Returns:
+            tuple: (image, roi) where roi is the normalized (x0, y0, x1, y1)
+                box the image covers, to be passed to to_full_frame()
+        """
+        h, w = frame.shape[:2]
+
+        if self.roi is None:
+            image = frame
+            roi = (0.0, 0.0, 1.0, 1.0)
+        else:
+            x0 = int(self.roi[0] * w)
+            y0 = int(self.roi[1] * h)
+            x1 = max(int(np.ceil(self.roi[2] * w)), x0 + 1)
+            y1 = max(int(np.ceil(self.roi[3] * h)), y0 + 1)
+            image = frame[y0:y1, x0:x1]
+            roi = (x0 / w, y0 / h, x1 / w, y1 / h)
+
+        crop_h, crop_w = image.shape[:2]
+        if self.max_side and max(crop_h, crop_w) > self.max_side:
+            scale = self.max_side / max(crop_h, crop_w)
+            size = (max(1, int(crop_w * scale)), max(1, int(crop_h * scale)))
+            image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+        return image, roi
+
+    @staticmethod
+    def to_full_frame(landmarks, roi):
+        """Map (33, 4) landmarks found inside a crop back to the full frame"""
+        x0, y0, x1, y1 = roi
+        if roi == (0.0, 0.0, 1.0, 1.0):
+            return landmarks
+
+        mapped = landmarks.copy()
+        mapped[:, X] = x0 + landmarks[:, X] * (x1 - x0)
+        mapped[:, Y] = y0 + landmarks[:, Y] * (y1 - y0)
+        # MediaPipe scales z like x, so it shrinks with the crop width
+        mapped[:, Z] = landmarks[:, Z] * (x1 - x0)
+        return mapped
+
+    def update(self, landmarks):
+        """Aim the next crop at these full-frame landmarks (None = lost)"""
+        if landmarks is None:
+            self.roi = None
+            return
+
+        points = landmarks if self.joints is None else landmarks[self.joints]
+        visible = points[points[:, VISIBILITY] >= self.visibility_threshold]
+        if len(visible) < 2:
+            self.roi = None
+            return
+
+        x_min, y_min = visible[:, X].min(), visible[:, Y].min()
+        x_max, y_max = visible[:, X].max(), visible[:, Y].max()
+
+        # Grow by the margin, then up to the minimum size around the centre
+        box_w = max((x_max - x_min) * (1 + 2 * self.margin), self.min_size)
+        box_h = max((y_max - y_min) * (1 + 2 * self.margin), self.min_size)
+        cx = (x_min + x_max) / 2
+        cy = (y_min + y_max) / 2
+
+        roi = (
+            max(0.0, cx - box_w / 2),
+            max(0.0, cy - box_h / 2),
+            min(1.0, cx + box_w / 2),
+            min(1.0, cy + box_h / 2),
+        )
+
+        # A box that covers (almost) everything is just the full frame
+        if (roi[2] - roi[0]) * (roi[3] - roi[1]) > 0.9:
+            self.roi = None
+        else:
+            self.roi = tuple(float(v) for v in roi)
+
+    def reset(self):
+        """Return to full-frame inference"""
+        self.roi = None
@@ -0,0 +1,26 @@
+"""Output file naming for batch analysis"""
+import os
+
+import pytest
+from batch_analyzer import output_names
+
+
+def test_unique_file_names_are_kept():
+    assert output_names(["a/squat.mp4", "b/press.avi"]) == {"a/squat.mp4": "squat",
+                                                          "b/press.avi": "press"}
+
+
+def test_shared_file_names_use_their_paths():
+    paths = [os.path.join("a", "session.mp4"), os.path.join("b", "session.mp4"),
+             os.path.join("c", "d", "session.avi"), os.path.join("c", "other.mp4")]
+    names = output_names(paths)
+    assert names == {paths[0]: "a__session", paths[1]: "b__session",
+                     paths[2]: "c__d__session", paths[3]: "other"}
+    assert len(set(names.values())) == len(paths)
+
+
+def test_unresolvable_clash_is_rejected():
+    # x/s.mp4 is renamed "x__s", which another video already uses
+    with pytest.raises(ValueError):
+        output_names([os.path.join("x", "s.mp4"), os.path.join("y", "s.mp4"),
+                      os.path.join("z", "x__s.mp4")])
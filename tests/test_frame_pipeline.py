@@ -0,0 +1,32 @@
+"""Paced pipeline stages"""
+import time
+
+from frame_pipeline import FramePipeline
+
+
+def run_render_stage(input_fps, render_fps=30, seconds=0.6):
+    """Feed a paced render stage at input_fps; returns its stats"""
+    pipeline = FramePipeline()
+    slot = pipeline.add_slot("annotated")
+    stage = pipeline.add_stage("render", lambda item: None, input_slot=slot,
+                               target_fps=render_fps)
+    pipeline.start()
+    try:
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            slot.put(object())
+            time.sleep(1.0 / input_fps)
+    finally:
+        pipeline.stop()
+    return stage.stats()
+
+
+def test_slow_input_is_not_a_missed_deadline():
+    stats = run_render_stage(input_fps=10)
+    assert stats["processed"] >= 3
+    assert stats["missed_deadlines"] == 0
+
+
+def test_fast_input_is_held_to_the_target_rate():
+    stats = run_render_stage(input_fps=200, render_fps=20)
+    assert stats["processed"] <= 0.6 * 20 + 2
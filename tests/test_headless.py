@@ -0,0 +1,56 @@
+"""The headless runner's stdout is a pure JSON-lines event stream"""
+import json
+import os
+import subprocess
+import sys
+
+import cv2
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# A MediaPipe stand-in that finds the same pose in every frame
+STUB_MEDIAPIPE = '''
+from types import SimpleNamespace
+
+LANDMARKS = SimpleNamespace(landmark=[
+    SimpleNamespace(x=0.3 + 0.01 * i, y=0.2 + 0.02 * (i % 7), z=0.0, visibility=1.0)
+    for i in range(33)])
+
+
+class Pose:
+    def __init__(self, **options):
+        pass
+
+    def process(self, image):
+        return SimpleNamespace(pose_landmarks=LANDMARKS, pose_world_landmarks=LANDMARKS)
+
+    def close(self):
+        pass
+
+
+solutions = SimpleNamespace(pose=SimpleNamespace(Pose=Pose))
+'''
+
+
+def test_stdout_is_json_lines(tmp_path):
+    stub = tmp_path / "stub" / "mediapipe"
+    stub.mkdir(parents=True)
+    (stub / "__init__.py").write_text(STUB_MEDIAPIPE)
+    frames = tmp_path / "frames"
+    frames.mkdir()
+    for i in range(5):
+        cv2.imwrite(str(frames / f"{i:03d}.png"), np.full((48, 64, 3), i * 40, dtype=np.uint8))
+
+    env = dict(os.environ, PYTHONPATH=str(tmp_path / "stub"))
+    result = subprocess.run([sys.executable, os.path.join(ROOT, "headless.py"),
+                             "--source", str(frames)],
+                            capture_output=True, text=True, env=env, cwd=tmp_path, timeout=120)
+
+    assert result.returncode == 0, result.stderr
+    lines = result.stdout.splitlines()
+    events = [json.loads(line) for line in lines]
+    assert events[-1]["event"] == "summary"
+    assert events[-1]["frames"] == 5
+    # Status messages still reach the user, on stderr
+    assert "MediaPipe successfully imported" in result.stderr
@@ -0,0 +1,53 @@
+"""Savitzky-Golay filtering and whole-trace kinematics"""
+import numpy as np
+import pytest
+from kinematics import compute_kinematics, savgol_filter
+
+# Left elbow: shoulder, elbow, wrist
+TRIPLETS = {"elbow": [11, 13, 15]}
+
+
+def elbow_landmarks(angles):
+    """(T, 33, 4) landmarks whose left elbow bends to the given angles"""
+    landmarks = np.zeros((len(angles), 33, 4), dtype=np.float32)
+    landmarks[..., 3] = 1.0
+    radians = np.radians(angles)
+    landmarks[:, 11, :2] = [0.5, 0.3]
+    landmarks[:, 13, :2] = [0.5, 0.5]
+    landmarks[:, 15, 0] = 0.5 + 0.2 * np.sin(radians)
+    landmarks[:, 15, 1] = 0.5 - 0.2 * np.cos(radians)
+    return landmarks
+
+
+@pytest.mark.parametrize("window", [0, -3, 4, 8])
+def test_savgol_rejects_bad_windows(window):
+    with pytest.raises(ValueError):
+        savgol_filter(np.zeros((20, 1)), window)
+
+
+def test_savgol_keeps_polynomials():
+    x = np.arange(30, dtype=np.float64)[:, None]
+    cubic = 0.01 * x ** 3 - x ** 2 + 3 * x
+    np.testing.assert_allclose(savgol_filter(cubic, 7, 3), cubic, atol=1e-8)
+    np.testing.assert_allclose(savgol_filter(cubic, 7, 3, deriv=1),
+                               0.03 * x ** 2 - 2 * x + 3, atol=1e-8)
+
+
+@pytest.mark.parametrize("method", ["gradient", "savgol"])
+def test_repeated_timestamps_stay_finite(method):
+    timestamps = np.arange(20) / 30.0
+    angles = 90 + 60 * timestamps  # 60 degrees/s
+    repeated = np.repeat(np.arange(20), 2)[:30]
+    result = compute_kinematics(elbow_landmarks(angles[repeated]), TRIPLETS,
+                                timestamps[repeated], method=method, window=5)
+
+    assert np.isfinite(result.velocity).all()
+    assert np.isfinite(result.acceleration).all()
+    np.testing.assert_allclose(result.velocity[:, 0], 60.0, rtol=1e-3)
+    # Frames sharing a timestamp share its derivatives
+    np.testing.assert_array_equal(result.velocity[0::2], result.velocity[1::2])
+
+
+def test_single_timestamp_has_no_motion():
+    result = compute_kinematics(elbow_landmarks([90.0, 100.0, 110.0]), TRIPLETS, [1.0, 1.0, 1.0])
+    assert not result.velocity.any() and not result.acceleration.any()
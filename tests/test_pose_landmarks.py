@@ -0,0 +1,79 @@
+"""landmarks_to_array against plain attribute reads"""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pose_landmarks import NUM_LANDMARKS, landmarks_to_array, results_to_arrays
+
+
+def attribute_array(pose_landmarks):
+    """The reference: one attribute read per field"""
+    return np.array([[lm.x, lm.y, lm.z, lm.visibility] for lm in pose_landmarks.landmark],
+                    dtype=np.float32)
+
+
+def landmark_list_class(presence):
+    """NormalizedLandmarkList built with protobuf alone, optionally with presence"""
+    descriptor_pb2 = pytest.importorskip("google.protobuf.descriptor_pb2")
+    from google.protobuf import descriptor_pool, message_factory
+
+    field = descriptor_pb2.FieldDescriptorProto
+    package = f"test{int(presence)}"
+    proto = descriptor_pb2.FileDescriptorProto(name=f"{package}.proto", package=package)
+    landmark = proto.message_type.add(name="NormalizedLandmark")
+    names = ("x", "y", "z", "visibility") + (("presence",) if presence else ())
+    for number, name in enumerate(names, 1):
+        landmark.field.add(name=name, number=number, type=field.TYPE_FLOAT,
+                           label=field.LABEL_OPTIONAL)
+    landmark_list = proto.message_type.add(name="NormalizedLandmarkList")
+    landmark_list.field.add(name="landmark", number=1, type=field.TYPE_MESSAGE,
+                            type_name=f".{package}.NormalizedLandmark", label=field.LABEL_REPEATED)
+
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(proto)
+    return message_factory.GetMessageClass(
+        pool.FindMessageTypeByName(f"{package}.NormalizedLandmarkList"))
+
+
+def random_values(seed=0):
+    rng = np.random.default_rng(seed)
+    values = rng.uniform(-1, 2, (NUM_LANDMARKS, 4)).astype(np.float32)
+    values[0] = [0.0, -0.0, 1e-30, 1.0]
+    return values
+
+
+@pytest.mark.parametrize("presence", [False, True])
+def test_protobuf_matches_attribute_reads(presence):
+    message = landmark_list_class(presence)()
+    for x, y, z, visibility in random_values().tolist():
+        fields = dict(x=x, y=y, z=z, visibility=visibility)
+        if presence:
+            fields["presence"] = 0.5
+        message.landmark.add(**fields)
+
+    array = landmarks_to_array(message)
+    assert array.dtype == np.float32 and array.shape == (NUM_LANDMARKS, 4)
+    np.testing.assert_array_equal(array, attribute_array(message))
+
+
+def test_protobuf_with_unset_field_matches_attribute_reads():
+    # A missing field changes the wire layout, so this must take the slow path
+    message = landmark_list_class(False)()
+    for index, (x, y, z, visibility) in enumerate(random_values(1).tolist()):
+        if index == 7:
+            message.landmark.add(x=x, y=y, z=z)
+        else:
+            message.landmark.add(x=x, y=y, z=z, visibility=visibility)
+
+    np.testing.assert_array_equal(landmarks_to_array(message), attribute_array(message))
+
+
+def test_plain_objects_match_attribute_reads():
+    landmarks = SimpleNamespace(landmark=[
+        SimpleNamespace(x=x, y=y, z=z, visibility=v) for x, y, z, v in random_values(2).tolist()])
+    np.testing.assert_array_equal(landmarks_to_array(landmarks), attribute_array(landmarks))
+
+
+def test_missing_pose():
+    assert landmarks_to_array(None) is None
+    assert results_to_arrays(SimpleNamespace(pose_landmarks=None)) == (None, None)
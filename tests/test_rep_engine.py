@@ -0,0 +1,57 @@
+"""Rep counting for every compiled exercise program"""
+import numpy as np
+import pytest
+from exercises import EXERCISE_ANGLES, REP_PROGRAMS, RepEngine, get_rep_program
+from exercises.rep_engine import STATE_READY
+
+FPS = 30.0
+
+
+def make_session(program, reps, noise=0.0, seed=0, move_seconds=1.0, hold_seconds=1.2):
+    """Return angle -> middle of the target -> hold -> back, `reps` times"""
+    return_progress, _, target_start, target_end, _ = program.edges
+    middle = (target_start + target_end) / 2
+    move = np.linspace(return_progress - 5, middle, int(move_seconds * FPS))
+    hold = np.full(int(hold_seconds * FPS), middle)
+    rep = np.concatenate([move, hold, move[::-1]])
+    angles = program.sign * np.tile(rep, reps)
+    angles += np.random.default_rng(seed).normal(0, noise, angles.size)
+    return angles.tolist(), (np.arange(angles.size) / FPS).tolist()
+
+
+def test_every_exercise_has_a_program():
+    assert set(REP_PROGRAMS) == set(EXERCISE_ANGLES)
+    assert len(REP_PROGRAMS) == 12
+
+
+@pytest.mark.parametrize("name", sorted(REP_PROGRAMS))
+@pytest.mark.parametrize("noise", [0.0, 2.0])
+def test_counts_every_rep(name, noise):
+    program = REP_PROGRAMS[name]
+    angles, timestamps = make_session(program, reps=10, noise=noise)
+    assert RepEngine(program).run(angles, timestamps) == 10
+
+
+@pytest.mark.parametrize("name", sorted(REP_PROGRAMS))
+def test_touch_and_go_does_not_count(name):
+    program = REP_PROGRAMS[name]
+    # In and out of the target well within the hold time
+    angles, timestamps = make_session(program, reps=3, move_seconds=0.2, hold_seconds=0.0)
+    assert RepEngine(program).run(angles, timestamps) == 0
+
+
+@pytest.mark.parametrize("name", sorted(REP_PROGRAMS))
+def test_partial_rep_does_not_count(name):
+    program = REP_PROGRAMS[name]
+    angles, timestamps = make_session(program, reps=1)
+    # Stop halfway back: armed, but the return angle is never reached
+    angles = angles[:len(angles) - int(FPS) // 2]
+    engine = RepEngine(program)
+    assert engine.run(angles, timestamps) == 0
+    assert engine.state != STATE_READY
+
+
+def test_ui_aliases_resolve():
+    assert get_rep_program("Biceps Curl") is REP_PROGRAMS["Biceps Curl Machine"]
+    assert get_rep_program("Back Extension") is REP_PROGRAMS["Back Extension Machine"]
+    assert get_rep_program("Nope") is None
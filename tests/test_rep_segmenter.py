@@ -0,0 +1,82 @@
+"""Live and offline rep segmentation"""
+import numpy as np
+import pytest
+from exercises import get_rep_program
+from rep_segmenter import RepSegmenter, segment_reps
+
+FPS = 30.0
+
+
+def random_session(seed, reps=8):
+    """Random rep, hold and rest lengths and depths, with noise and pose dropouts"""
+    rng = np.random.default_rng(seed)
+    parts = [np.full(rng.integers(1, 30), 110.0)]
+    for _ in range(reps):
+        top = rng.uniform(140, 175)
+        parts += [np.linspace(110, top, rng.integers(5, 60)), np.full(rng.integers(0, 40), top),
+                  np.linspace(top, rng.uniform(100, 120), rng.integers(5, 60)),
+                  np.full(rng.integers(0, 40), 110.0)]
+    angles = np.concatenate(parts) + rng.normal(0, rng.uniform(0, 2), sum(map(len, parts)))
+    angles[rng.random(len(angles)) < 0.02] = np.nan
+    timestamps = np.cumsum(rng.uniform(0.5, 1.5, len(angles)) / FPS)
+    return angles, timestamps
+
+
+def run_live(angles, timestamps, program, **options):
+    """RepSegmenter over the samples, skipping NaN as the live monitor does"""
+    segmenter = RepSegmenter(program, **options)
+    for angle, t in zip(angles.tolist(), timestamps.tolist()):
+        if not np.isnan(angle):
+            segmenter.update(angle, t)
+    return segmenter.reps
+
+
+@pytest.mark.parametrize("exercise", ["Chest Press", "Lat Pulldown", None])
+@pytest.mark.parametrize("seed", range(20))
+def test_live_matches_offline(exercise, seed):
+    program = get_rep_program(exercise) if exercise else None
+    angles, timestamps = random_session(seed)
+    if program and program.sign < 0:
+        angles = 280 - angles  # a flexion exercise: the same movement, mirrored
+    offline = segment_reps(angles, timestamps, program)
+    assert run_live(angles, timestamps, program) == offline
+    assert len(offline) > 0
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_capped_phases_keep_turning_points(seed):
+    # Holds longer than max_phase_samples force the live buffers to be trimmed;
+    # turning points survive, only plateau edges older than the cap are lost
+    angles, timestamps = random_session(seed)
+    angles = np.repeat(angles, 4)
+    timestamps = np.arange(len(angles)) / FPS
+    program = get_rep_program("Chest Press")
+
+    segmenter = RepSegmenter(program, max_phase_samples=20)
+    longest = 0
+    for angle, t in zip(angles.tolist(), timestamps.tolist()):
+        if not np.isnan(angle):
+            segmenter.update(angle, t)
+            longest = max(longest, len(segmenter.values))
+    offline = segment_reps(angles, timestamps, program)
+
+    assert longest <= 20
+    assert [r.range_of_motion for r in segmenter.reps] == [r.range_of_motion for r in offline]
+    assert [r.complete for r in segmenter.reps] == [r.complete for r in offline]
+
+
+def test_tempo_of_clean_reps():
+    rep = np.concatenate([np.linspace(110, 170, 31), np.full(30, 170.0),
+                          np.linspace(170, 110, 46)[1:], np.full(15, 110.0)])
+    angles = np.concatenate([np.full(15, 110.0), np.tile(rep, 3)])
+    timestamps = np.arange(len(angles)) / FPS
+
+    reps = segment_reps(angles, timestamps, get_rep_program("Chest Press"))
+    assert len(reps) == 2  # the last rep has no valley after it to confirm
+    for record in reps:
+        assert record.complete
+        assert record.range_of_motion == pytest.approx(60.0)
+        assert record.concentric == pytest.approx(1.0, abs=0.15)
+        assert record.hold == pytest.approx(1.0, abs=0.15)
+        assert record.eccentric == pytest.approx(1.5, abs=0.15)
+        assert record.peak_velocity == pytest.approx(60.0, rel=0.05)
@@ -9,17 +9,16 @@ import numpy as np
 import threading
 import time
 import config
-from PIL import Image, ImageTk
-
-# Try to import MediaPipe with proper error handling
-try:
-    import mediapipe as mp
-    MEDIAPIPE_AVAILABLE = True
-    print("✓ MediaPipe successfully imported")
-except ImportError as e:
-    MEDIAPIPE_AVAILABLE = False
-    print(f"✗ MediaPipe not available: {e}")
-    print("Please install: pip install mediapipe")
+from camera_manager import CameraManager
+from frame_pipeline import FramePipeline
+from frame_prep import FramePreparer
+from landmark_predictor import LandmarkPredictor
+from pose_estimator import PoseEstimator
+from posture_monitor import PostureMonitor, get_monitor_config
+from video_recorder import AnnotatedVideoRecorder
+from ui.frame_display import FrameDisplay
+from ui.overlay import MOCK_LAYER, OverlayCompositor, draw_skeleton, guide_layer, skeleton_for
+from ui.ui_state import BORDER_CORRECT, BORDER_INCORRECT, build_ui_state
 
 class CameraPage(tk.Frame):
     """Real-time camera feed with exercise monitoring - STABILIZED VERSION"""
@@ -30,45 +29,54 @@ class CameraPage(tk.Frame):
         self.configure(bg="#1a1a1a")
         
         # Camera setup
-        self.cap = None
+        self.camera = None
         self.running = False
+        self.pipeline = None
+        self.recorder = None
         
         # Exercise tracking
         self.current_exercise = "Chest Press"
         self.exercise_config = self.get_exercise_config("Chest Press")
         
         # Pose detection
-        self.pose = None
-        self.mp_pose = None
-        self.mediapipe_available = MEDIAPIPE_AVAILABLE
-        
-        # Initialize MediaPipe if available
-        if self.mediapipe_available:
-            self.initialize_mediapipe()
-        else:
+        self.pose_estimator = PoseEstimator.from_config()
+        self.mediapipe_available = self.pose_estimator.available
+        if not self.mediapipe_available:
             print("⚠ Running in mock mode - MediaPipe not available")
-            self.create_mock_pose()
         
-        # FIX 1: ANGLE STABILIZATION
-        self.angle_buffer = []  # Moving average buffer
-        self.angle_buffer_size = 8  # Smoothing window
-        self.current_angle = None
-        
-        # FIX 2: CORRECT POSTURE HOLD TIMER
-        self.correct_hold_start = None
-        self.correct_hold_time = 0.8  # seconds to hold correct posture
-        self.posture_correct = False
-        
-        # Rep counting
-        self.rep_count = 0
-        self.rep_state = "down"  # down, up, counting
-        self.last_state_change = time.time()
-        self.rep_debounce = 0.5  # seconds
-        
-        # Blinking border
+        # Latency compensation: landmarks are moved ahead to the expected display time
+        self.landmark_predictor = None
+        self.world_predictor = None
+        if config.LANDMARK_PREDICTION:
+            self.landmark_predictor = self.create_predictor()
+            self.world_predictor = self.create_predictor()
+        
+        # Mirrored RGB frame buffers reused by the inference stage
+        self.frame_preparer = FramePreparer(pool_size=config.FRAME_PREP_POOL_SIZE)
+        
+        # FIX 4: NO DARK OVERLAY - just text, pre-rendered once per frame size
+        self.overlay = OverlayCompositor()
+        self.overlay.add_layer("guide", guide_layer(self.exercise_config["joints_to_track"]))
+        self.overlay.add_layer("mock", MOCK_LAYER)
+        self.overlay_layers = ("guide",) if self.mediapipe_available else ("guide", "mock")
+        self.skeleton = skeleton_for(self.exercise_config["landmarks"].values())
+        
+        # Angle smoothing, posture hold timer and rep counting
+        self.monitor = PostureMonitor(self.current_exercise,
+                                      smoothing_window=config.ANGLE_SMOOTHING_WINDOW)
+        
+        # Coalesced UI updates: the pipeline publishes one snapshot per frame,
+        # the Tk thread applies the newest one at most UI_REFRESH_HZ times/s
+        self.ui_state = None
+        self.applied_ui_state = None
+        self.ui_update_scheduled = threading.Event()
+        self.next_ui_update = 0.0
+        
+        # Blinking border, driven by posture transitions in apply_ui_state
+        self.border_mode = None
         self.blink_state = False
         self.blink_interval = 500  # ms
-        self.last_blink_time = 0
+        self.blink_job = None
         
         # Mock data for testing
         self.mock_angle = 118  # Start at 118°
@@ -77,73 +85,6 @@ class CameraPage(tk.Frame):
         # UI setup
         self.create_ui()
         
-    def initialize_mediapipe(self):
-        """Initialize MediaPipe Pose"""
-        try:
-            if hasattr(mp, 'solutions'):
-                self.mp_pose = mp.solutions.pose
-                
-                try:
-                    self.pose = self.mp_pose.Pose(
-                        static_image_mode=False,
-                        model_complexity=1,
-                        smooth_landmarks=True,
-                        min_detection_confidence=0.5,
-                        min_tracking_confidence=0.5
-                    )
-                    print("✓ MediaPipe Pose initialized")
-                except TypeError:
-                    self.pose = self.mp_pose.Pose()
-                    print("✓ MediaPipe Pose initialized (old version)")
-                
-                if hasattr(mp.solutions, 'drawing_utils'):
-                    self.mp_drawing = mp.solutions.drawing_utils
-                else:
-                    self.create_mock_drawing()
-            else:
-                self.create_mock_pose()
-                
-        except Exception as e:
-            print(f"✗ MediaPipe initialization failed: {e}")
-            self.create_mock_pose()
-    
-    def create_mock_pose(self):
-        """Create mock pose detection"""
-        class MockPose:
-            def __init__(self, **kwargs):
-                self.kwargs = kwargs
-            
-            def process(self, image):
-                class Result:
-                    def __init__(self):
-                        self.pose_landmarks = None
-                return Result()
-            
-            def close(self):
-                pass
-        
-        class MockDrawingUtils:
-            @staticmethod
-            def draw_landmarks(image, landmarks, connections, **kwargs):
-                # Just draw text - NO DARK OVERLAY
-                h, w, c = image.shape
-                cv2.putText(image, "MOCK MODE", (w-150, 40),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
-        
-        self.mp_pose = type('MockMPPose', (), {'Pose': MockPose})()
-        self.mp_drawing = MockDrawingUtils()
-        self.pose = self.mp_pose.Pose()
-        self.mediapipe_available = False
-    
-    def create_mock_drawing(self):
-        """Create mock drawing utilities"""
-        class MockDrawingUtils:
-            @staticmethod
-            def draw_landmarks(image, landmarks, connections, **kwargs):
-                pass
-        
-        self.mp_drawing = MockDrawingUtils()
-    
     def create_ui(self):
         """Create the camera monitoring interface"""
         # Main container
@@ -209,6 +150,7 @@ class CameraPage(tk.Frame):
             relief="flat"
         )
         self.camera_label.pack(fill="both", expand=True)
+        self.frame_display = FrameDisplay(self.camera_label)
         
         # =========== RIGHT PANEL: MONITORING INFO (50%) ===========
         right_panel = tk.Frame(main_container, bg="#1a1a1a")
@@ -275,7 +217,7 @@ class CameraPage(tk.Frame):
         
         self.target_range_label = tk.Label(
             target_panel,
-            text="160° – 175°",
+            text=self.format_target_range(),
             font=("Arial", 24, "bold"),
             bg="#2d2d2d",
             fg="#4CAF50"
@@ -392,21 +334,25 @@ class CameraPage(tk.Frame):
     
     def get_exercise_config(self, exercise_name):
         """Get configuration for specific exercise"""
-        if exercise_name == "Chest Press":
-            return {
-                "landmarks": {
-                    "left": [11, 13, 15],
-                    "right": [12, 14, 16]
-                },
-                "down_range": (80, 100),
-                "up_range": (160, 175)
-            }
-        return None
+        return get_monitor_config(exercise_name)
+    
+    def format_target_range(self):
+        """Target angle range of the current exercise, as shown in the side panel"""
+        low, high = self.exercise_config["target_angle_range"]
+        return f"{low}° – {high}°"
     
     def set_exercise(self, exercise_name):
         """Set the exercise configuration"""
         self.current_exercise = exercise_name
         self.exercise_config = self.get_exercise_config(exercise_name)
+        self.monitor.set_exercise(exercise_name)
+        self.skeleton = skeleton_for(self.exercise_config["landmarks"].values())
+        self.overlay.add_layer("guide", guide_layer(self.exercise_config["joints_to_track"]))
+        self.target_range_label.config(text=self.format_target_range())
+        self.pose_estimator.reset()
+        for predictor in (self.landmark_predictor, self.world_predictor):
+            if predictor:
+                predictor.reset()
         self.exercise_title.config(text=f"{exercise_name.upper()} – LIVE MONITORING")
         
         if not self.running:
@@ -415,18 +361,36 @@ class CameraPage(tk.Frame):
     def start_camera(self):
         """Start camera capture"""
         try:
-            self.cap = cv2.VideoCapture(0)
+            self.camera = CameraManager(
+                config.CAMERA_SOURCE,
+                loop=config.CAMERA_LOOP,
+                pool_size=config.CAPTURE_POOL_SIZE,
+                width=config.CAMERA_WIDTH,
+                height=config.CAMERA_HEIGHT,
+                fps=config.CAMERA_FPS
+            )
             
-            if not self.cap.isOpened():
+            if not self.camera.open():
                 raise Exception("Cannot open camera")
             
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            self.pose_estimator.start()
+            
+            if config.RECORD_ANNOTATED_VIDEO:
+                self.recorder = AnnotatedVideoRecorder(
+                    config.RECORDING_DIR,
+                    fps=config.CAMERA_FPS,
+                    max_bytes=config.RECORDING_MAX_MB * 1024 * 1024,
+                    max_seconds=config.RECORDING_MAX_SECONDS,
+                    prefix=self.current_exercise.lower().replace(" ", "_"),
+                    rgb_input=True
+                )
+                self.recorder.start()
             
             self.running = True
-            self.camera_thread = threading.Thread(target=self.update_camera, daemon=True)
-            self.camera_thread.start()
-            self.update_border_animation()
+            self.pipeline = self.build_pipeline()
+            self.pipeline.start()
+            self.camera.start(callback=self.captured_slot.put,
+                              on_error=self.on_camera_error)
             
             print("✓ Camera started successfully")
             
@@ -434,6 +398,56 @@ class CameraPage(tk.Frame):
             print(f"✗ Camera initialization failed: {e}")
             self.show_camera_error(f"Camera Error: {str(e)}")
     
+    def create_predictor(self):
+        """LandmarkPredictor configured from config.py"""
+        return LandmarkPredictor(
+            history=config.PREDICTION_HISTORY,
+            max_horizon=config.PREDICTION_MAX_HORIZON,
+            max_ratio=config.PREDICTION_MAX_RATIO,
+            min_visibility=config.PREDICTION_MIN_VISIBILITY,
+            max_gap=config.POSE_MAX_ESTIMATE_GAP
+        )
+    
+    def predict_landmarks(self, landmarks, world_landmarks, timestamp):
+        """Move both landmark sets ahead by the pipeline's measured latency"""
+        if self.landmark_predictor is None or self.pipeline is None:
+            return landmarks, world_landmarks
+        
+        horizon = self.pipeline.latency()
+        return (self.landmark_predictor.predict(landmarks, timestamp, horizon),
+                self.world_predictor.predict(world_landmarks, timestamp, horizon))
+    
+    def predicted_angle(self, smoothed_angle, predicted, predicted_world):
+        """Displayed angle: the monitor's smoothed angle moved by the predicted change"""
+        if smoothed_angle is None or self.landmark_predictor is None or predicted is None:
+            return smoothed_angle
+        
+        measured_left, measured_right = self.monitor.side_angles
+        left, right = self.monitor.angle_table.compute(
+            predicted, world_landmarks=predicted_world)[:2]
+        if np.isnan(left) or np.isnan(right):
+            return smoothed_angle
+        return smoothed_angle + (left + right - measured_left - measured_right) / 2
+    
+    def build_pipeline(self):
+        """
+        Build the inference -> render pipeline fed by the camera thread
+        
+        The CameraManager thread is the capture stage. Each stage runs on
+        its own thread and hands over through a latest-frame-wins slot, so
+        slow pose inference drops stale frames instead of delaying capture
+        or queueing up latency.
+        """
+        pipeline = FramePipeline()
+        self.captured_slot = pipeline.add_slot("captured")
+        annotated = pipeline.add_slot("annotated")
+        
+        pipeline.add_stage("inference", self.infer_frame,
+                           input_slot=self.captured_slot, output_slot=annotated)
+        pipeline.add_stage("render", self.render_frame, input_slot=annotated,
+                           target_fps=config.DISPLAY_FPS)
+        return pipeline
+    
     def show_camera_error(self, message):
         """Display camera error message"""
         self.camera_label.config(
@@ -442,339 +456,176 @@ class CameraPage(tk.Frame):
             fg="#FF6B6B"
         )
     
-    def update_camera(self):
-        """Thread function to update camera feed"""
-        while self.running and self.cap and self.cap.isOpened():
-            try:
-                ret, frame = self.cap.read()
-                
-                if ret:
-                    processed_frame = self.process_frame(frame)
-                    rgb_image = cv2.cvtColor(processed_frame, cv2.COLOR_BGR2RGB)
-                    
-                    # Resize to fit
-                    label_width = self.camera_label.winfo_width()
-                    label_height = self.camera_label.winfo_height()
-                    
-                    if label_width > 1 and label_height > 1:
-                        rgb_image = cv2.resize(rgb_image, (label_width, label_height))
-                    else:
-                        rgb_image = cv2.resize(rgb_image, (640, 480))
-                    
-                    pil_image = Image.fromarray(rgb_image)
-                    imgtk = ImageTk.PhotoImage(image=pil_image)
-                    
-                    self.after(0, self.update_camera_label, imgtk)
-                else:
-                    self.show_camera_error("Cannot read from camera")
-                    break
-                
-            except Exception as e:
-                print(f"✗ Camera frame error: {e}")
-                break
-            
-            time.sleep(0.033)
-        
-        if self.cap:
-            self.cap.release()
-            self.cap = None
+    def on_camera_error(self, message):
+        """Called from the capture thread when the camera stops delivering"""
+        self.after(0, self.show_camera_error, message)
     
-    def process_frame(self, frame):
-        """Process frame with exercise-specific joint detection"""
+    def infer_frame(self, captured):
+        """Inference stage: run pose and annotations on the newest frame"""
+        # The captured image is a pooled buffer shared by reference;
+        # process_frame mirrors it into a pooled RGB buffer before drawing on it.
+        annotated = self.process_frame(captured.image, captured.timestamp)
+        
+        # Never blocks: the recorder copies into its own buffers or drops the frame
+        if self.recorder:
+            self.recorder.submit(annotated, captured.timestamp)
+        return annotated
+    
+    def render_frame(self, processed_frame):
+        """Render stage: scale the newest annotated RGB frame for display"""
+        # The display size comes from <Configure> events, never from Tk calls here
+        if self.frame_display.prepare(processed_frame):
+            self.after(0, self.frame_display.present)
+    
+    def process_frame(self, frame, timestamp=None):
+        """Process a BGR frame with exercise-specific joint detection
+        
+        Returns the mirrored, annotated frame in RGB. Colours drawn here are
+        therefore RGB tuples.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        
         if frame is None:
             return np.zeros((480, 640, 3), dtype=np.uint8)
         
-        frame = cv2.flip(frame, 1)
+        # One conversion, shared by inference, recording and display
+        frame = self.frame_preparer.prepare(frame)
         h, w, c = frame.shape
         
         # FIX 5: TEXT ONLY - NO BACKGROUND
-        cv2.putText(frame, "ADJUST POSITION", (20, 40),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
-        cv2.putText(frame, "ENSURE UPPER BODY IS VISIBLE", (20, 70),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        # Static text comes from a cached layer; only dynamic text is drawn here
+        self.overlay.apply(frame, self.overlay_layers)
         
-        cv2.putText(frame, f"Reps: {self.rep_count}", (20, h-30),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
+        cv2.putText(frame, f"Reps: {self.monitor.rep_count}", (20, h-30),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 0), 2)
         
-        if self.pose and self.mediapipe_available:
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.pose.process(rgb_frame)
+        if self.mediapipe_available:
+            # Reps, posture and tempo use the measured pose; the prediction
+            # only moves what is drawn, so it can never count a rep early
+            landmarks = self.pose_estimator.estimate(frame, timestamp, rgb=True)
+            world_landmarks = self.pose_estimator.world_landmarks
+            smoothed_angle = self.monitor.process_landmarks(landmarks, timestamp, world_landmarks)
             
-            if results.pose_landmarks:
-                self.draw_exercise_joints(frame, results.pose_landmarks)
-                
-                left_angle = self.calculate_angle(results.pose_landmarks.landmark, "left")
-                right_angle = self.calculate_angle(results.pose_landmarks.landmark, "right")
-                
-                if left_angle is not None and right_angle is not None:
-                    # FIX 1: ANGLE STABILIZATION WITH MOVING AVERAGE
-                    raw_angle = (left_angle + right_angle) / 2
-                    self.angle_buffer.append(raw_angle)
-                    
-                    if len(self.angle_buffer) > self.angle_buffer_size:
-                        self.angle_buffer.pop(0)
-                    
-                    smoothed_angle = sum(self.angle_buffer) / len(self.angle_buffer)
-                    self.current_angle = smoothed_angle
-                    
-                    # Update angle display
-                    color = "#4CAF50" if self.posture_correct else "#F44336"
-                    self.after(0, lambda a=smoothed_angle, c=color: self.update_angle_display(a, c))
-                    
-                    # Check posture and reps
-                    self.check_posture_and_reps(smoothed_angle)
-                    
-                    # Draw angle on frame
-                    cv2.putText(frame, f"Angle: {smoothed_angle:.0f}°", (20, 100),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
-                else:
-                    self.after(0, lambda: self.update_angle_display(None, "#FF9800"))
-                    self.after(0, lambda: self.update_status("Adjust position", "Ensure joints are visible", "#FF9800"))
-            else:
-                self.after(0, lambda: self.update_angle_display(None, "#FF9800"))
-                self.after(0, lambda: self.update_status("No pose detected", "Stand in frame", "#FF9800"))
+            predicted, predicted_world = self.predict_landmarks(
+                landmarks, world_landmarks, timestamp)
+            if predicted is not None:
+                self.draw_exercise_joints(frame, predicted)
+            smoothed_angle = self.predicted_angle(smoothed_angle, predicted, predicted_world)
+            
+            if smoothed_angle is not None:
+                # Draw angle on frame
+                cv2.putText(frame, f"Angle: {smoothed_angle:.0f}°", (20, 100),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 0), 2)
         else:
             # Mock mode
             self.mock_angle += self.mock_increment
             if self.mock_angle > 170 or self.mock_angle < 80:
                 self.mock_increment = -self.mock_increment
             
-            self.current_angle = self.mock_angle
-            
-            # Apply smoothing to mock data too
-            self.angle_buffer.append(self.mock_angle)
-            if len(self.angle_buffer) > self.angle_buffer_size:
-                self.angle_buffer.pop(0)
-            smoothed_mock = sum(self.angle_buffer) / len(self.angle_buffer)
-            
-            # Check posture with smoothed angle
-            self.check_posture_and_reps(smoothed_mock)
-            
-            # Update displays
-            color = "#4CAF50" if self.posture_correct else "#F44336"
-            self.after(0, lambda a=smoothed_mock, c=color: self.update_angle_display(a, c))
-            
-            # FIX 4: NO DARK OVERLAY - just text
-            cv2.putText(frame, "MOCK MODE", (w-150, 40),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
+            # Apply smoothing to mock data too, then check posture
+            smoothed_angle = self.monitor.update(self.mock_angle, timestamp)
+        
+        self.publish_ui_state(build_ui_state(
+            self.monitor, smoothed_angle, self.current_exercise, not self.mediapipe_available))
         
         return frame
     
     def draw_exercise_joints(self, frame, landmarks):
-        """Draw only exercise-specific joints"""
-        if not self.exercise_config:
+        """Draw only exercise-specific joints from a (33, 4) landmark array"""
+        draw_skeleton(frame, landmarks, self.skeleton)
+    
+    def publish_ui_state(self, state):
+        """Inference thread: hand over the newest snapshot, coalescing updates"""
+        self.ui_state = state
+        
+        # At most one apply_ui_state is ever pending; later snapshots ride on it
+        if not self.ui_update_scheduled.is_set():
+            self.ui_update_scheduled.set()
+            delay = max(0, int((self.next_ui_update - time.monotonic()) * 1000))
+            self.after(delay, self.apply_ui_state)
+    
+    def apply_ui_state(self):
+        """Tk thread: apply the newest snapshot, touching only changed widgets"""
+        self.ui_update_scheduled.clear()
+        self.next_ui_update = time.monotonic() + 1.0 / config.UI_REFRESH_HZ
+        
+        state = self.ui_state
+        last = self.applied_ui_state
+        if state is None or state == last:
             return
         
-        h, w, c = frame.shape
+        if last is None or (state.angle_text, state.angle_color) != (last.angle_text, last.angle_color):
+            self.angle_display.config(text=state.angle_text, fg=state.angle_color)
         
-        # Draw connections first
-        connections = [
-            (11, 13), (13, 15),  # Left arm
-            (12, 14), (14, 16),  # Right arm
-        ]
-        
-        for start_idx, end_idx in connections:
-            if (start_idx < len(landmarks.landmark) and 
-                end_idx < len(landmarks.landmark)):
-                start = landmarks.landmark[start_idx]
-                end = landmarks.landmark[end_idx]
-                
-                start_x = int(start.x * w)
-                start_y = int(start.y * h)
-                end_x = int(end.x * w)
-                end_y = int(end.y * h)
-                
-                cv2.line(frame, (start_x, start_y), (end_x, end_y), (0, 255, 0), 3)
-        
-        # Draw joints
-        indices = [11, 12, 13, 14, 15, 16]
-        for idx in indices:
-            if idx < len(landmarks.landmark):
-                landmark = landmarks.landmark[idx]
-                x = int(landmark.x * w)
-                y = int(landmark.y * h)
-                
-                if idx in [11, 12]:  # Shoulders
-                    color = (0, 255, 0)
-                    radius = 10
-                elif idx in [13, 14]:  # Elbows
-                    color = (255, 255, 0)
-                    radius = 12
-                else:  # Wrists
-                    color = (0, 255, 255)
-                    radius = 8
-                
-                cv2.circle(frame, (x, y), radius, color, -1)
-                cv2.circle(frame, (x, y), radius + 2, (255, 255, 255), 2)
-    
-    def calculate_angle(self, landmarks, side):
-        """Calculate angle for specific side"""
-        if not self.exercise_config:
-            return None
+        if last is None or (state.status, state.status_color) != (last.status, last.status_color):
+            self.status_display.config(text=state.status, fg=state.status_color)
         
-        try:
-            if side == "left":
-                indices = self.exercise_config["landmarks"]["left"]
-            else:
-                indices = self.exercise_config["landmarks"]["right"]
-            
-            idx_a, idx_b, idx_c = indices
-            
-            if idx_a >= len(landmarks) or idx_b >= len(landmarks) or idx_c >= len(landmarks):
-                return None
-            
-            a = landmarks[idx_a]
-            b = landmarks[idx_b]
-            c = landmarks[idx_c]
-            
-            # Check visibility
-            if hasattr(a, 'visibility') and a.visibility < 0.3:
-                return None
-            if hasattr(b, 'visibility') and b.visibility < 0.3:
-                return None
-            if hasattr(c, 'visibility') and c.visibility < 0.3:
-                return None
-            
-            # Calculate angle
-            ba = np.array([a.x - b.x, a.y - b.y])
-            bc = np.array([c.x - b.x, c.y - b.y])
-            
-            cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc))
-            cosine_angle = np.clip(cosine_angle, -1.0, 1.0)
-            angle = np.degrees(np.arccos(cosine_angle))
-            
-            return 180 - angle
-            
-        except:
-            return None
-    
-    def check_posture_and_reps(self, angle):
-        """Check posture and count repetitions - FIXED VERSION"""
-        if not self.exercise_config:
-            return
+        if last is None or state.feedback_text != last.feedback_text:
+            self.update_feedback_text(state.feedback_text)
         
-        current_time = time.time()
-        up_min, up_max = self.exercise_config["up_range"]
-        down_min, down_max = self.exercise_config["down_range"]
-        
-        # Check if angle is in target range
-        in_target_range = up_min <= angle <= up_max
-        
-        # FIX 2: CORRECT POSTURE HOLD TIMER
-        if angle is None:
-            self.correct_hold_start = None
-            self.posture_correct = False
-            self.after(0, lambda: self.update_status("Waiting for detection", "Stand in frame", "#FF9800"))
-        elif in_target_range:
-            # Start or continue hold timer
-            if self.correct_hold_start is None:
-                self.correct_hold_start = current_time
-            
-            # Check if held long enough
-            if current_time - self.correct_hold_start >= self.correct_hold_time:
-                self.posture_correct = True
-                self.after(0, lambda: self.update_status("Correct posture", "Good form!", "#4CAF50"))
-            else:
-                # Still holding, not yet correct
-                self.posture_correct = False
-                hold_remaining = self.correct_hold_time - (current_time - self.correct_hold_start)
-                self.after(0, lambda: self.update_status(f"Hold... {hold_remaining:.1f}s", "Keep position", "#FF9800"))
-        else:
-            # Not in target range - reset hold timer
-            self.correct_hold_start = None
-            self.posture_correct = False
-            
-            if angle < up_min:
-                self.after(0, lambda: self.update_status("Incorrect posture", "Push further", "#F44336"))
-            else:
-                self.after(0, lambda: self.update_status("Incorrect posture", "Don't overextend", "#F44336"))
-        
-        # FIX 3: REP COUNT ONLY IF GREEN BLINK COMPLETES
-        if current_time - self.last_state_change > self.rep_debounce:
-            if self.rep_state == "down":
-                if self.posture_correct:  # Only if fully correct (held long enough)
-                    self.rep_state = "up"
-                    self.last_state_change = current_time
-                    
-            elif self.rep_state == "up":
-                if not in_target_range and down_min <= angle <= down_max:
-                    # Only count if we were in correct posture and now returned to down position
-                    self.rep_count += 1
-                    self.after(0, self.update_rep_display)
-                    self.rep_state = "down"
-                    self.last_state_change = current_time
-    
-    def update_camera_label(self, image):
-        """Update camera label"""
-        self.camera_label.config(image=image)
-        self.camera_label.image = image
-    
-    def update_angle_display(self, angle, color="#FF9800"):
-        """Update angle display"""
-        if angle is None:
-            self.angle_display.config(text="No angle", fg="#FF9800")
-        else:
-            self.angle_display.config(text=f"{angle:.0f}°", fg=color)
-    
-    def update_rep_display(self):
-        """Update rep counter display"""
-        self.rep_display.config(text=str(self.rep_count))
-    
-    def update_status(self, status, feedback, color):
-        """Update status and feedback"""
-        self.status_display.config(text=status, fg=color)
+        if last is None or state.reps_text != last.reps_text:
+            self.rep_display.config(text=state.reps_text)
+        
+        if state.border != self.border_mode:
+            self.set_border_mode(state.border)
         
+        self.applied_ui_state = state
+    
+    def update_feedback_text(self, text):
+        """Replace the feedback panel text"""
         self.feedback_text.config(state="normal")
         self.feedback_text.delete("1.0", "end")
-        
-        if not self.mediapipe_available:
-            self.feedback_text.insert("1.0", 
-                f"⚠ MOCK MODE\n\n"
-                f"Status: {status}\n"
-                f"Feedback: {feedback}\n\n"
-                f"Install MediaPipe for real detection:\n"
-                f"pip install mediapipe"
-            )
-        else:
-            self.feedback_text.insert("1.0", 
-                f"Exercise: {self.current_exercise}\n"
-                f"Target Angle: 160° – 175°\n\n"
-                f"Status: {status}\n"
-                f"Feedback: {feedback}\n\n"
-                f"Reps: {self.rep_count}"
-            )
-        
+        self.feedback_text.insert("1.0", text)
         self.feedback_text.config(state="disabled")
     
-    def update_border_animation(self):
-        """Update border color with blinking effect"""
-        if not self.running:
-            return
-        
-        current_time = time.time() * 1000
+    def set_border_mode(self, mode):
+        """Set the border for a posture state; only "incorrect" keeps a timer"""
+        self.cancel_blink()
+        self.border_mode = mode
         
-        if self.current_angle is None:
-            self.camera_border.config(bg="#2196F3")
-        elif self.posture_correct:
+        if mode == BORDER_CORRECT:
             self.camera_border.config(bg="#4CAF50")
-            self.blink_state = False
+        elif mode == BORDER_INCORRECT:
+            self.blink_state = True
+            self.blink_border()
         else:
-            if current_time - self.last_blink_time > self.blink_interval:
-                if self.blink_state:
-                    self.camera_border.config(bg="#F44336")
-                else:
-                    self.camera_border.config(bg="#000000")
-                self.blink_state = not self.blink_state
-                self.last_blink_time = current_time
-        
-        self.after(100, self.update_border_animation)
+            self.camera_border.config(bg="#2196F3")
+    
+    def blink_border(self):
+        """Alternate red and black while posture is incorrect"""
+        self.blink_job = None
+        if not self.running or self.border_mode != BORDER_INCORRECT:
+            return
+        
+        self.camera_border.config(bg="#F44336" if self.blink_state else "#000000")
+        self.blink_state = not self.blink_state
+        self.blink_job = self.after(self.blink_interval, self.blink_border)
+    
+    def cancel_blink(self):
+        """Stop the blink timer if one is pending"""
+        if self.blink_job is not None:
+            self.after_cancel(self.blink_job)
+            self.blink_job = None
     
     def reset_counter(self):
         """Reset the repetition counter"""
-        self.rep_count = 0
+        self.monitor.reset_counter()
         self.rep_display.config(text="0")
+        self.applied_ui_state = None
         print("✓ Rep counter reset")
     
+    def log_pipeline_stats(self):
+        """Print the session's measured rates and drops"""
+        stats = self.pipeline.stats()
+        inference = stats["stages"]["inference"]
+        render = stats["stages"]["render"]
+        print(f"✓ Camera stopped: capture {self.camera.effective_fps():.1f} fps, "
+              f"inference {inference['latency_ms']} ms/frame "
+              f"({stats['slots']['captured']['dropped']} frames skipped), "
+              f"render {render['effective_fps']} fps "
+              f"({render['missed_deadlines']} missed deadlines)")
+    
     def stop_and_go_back(self):
         """Stop camera and go back"""
         self.stop_camera()
@@ -783,10 +634,17 @@ class CameraPage(tk.Frame):
     def stop_camera(self):
         """Stop camera"""
         self.running = False
-        if self.cap:
-            self.cap.release()
-        if self.pose:
-            try:
-                self.pose.close()
-            except:
-                pass
\ No newline at end of file
+        self.cancel_blink()
+        self.border_mode = None
+        if self.pipeline:
+            self.pipeline.stop()
+            self.log_pipeline_stats()
+            self.pipeline = None
+            self.frame_display.reset()
+        if self.camera:
+            self.camera.stop()
+            self.camera = None
+        if self.recorder:
+            self.recorder.stop()
+            self.recorder = None
+        self.pose_estimator.stop()
@@ -0,0 +1,143 @@
+"""
+Frame Display
+Shows pipeline frames in a Tk label through one reusable PhotoImage
+"""
+import threading
+from collections import namedtuple
+
+import numpy as np
+from frame_prep import resize_into
+from PIL import Image, ImageTk
+
+# Where a frame of source_size lands inside a display of display_size
+Layout = namedtuple("Layout", ["source_size", "display_size", "scaled_size", "offset"])
+
+
+def compute_layout(source_size, display_size):
+    """Largest aspect-preserving fit of source_size, centred in display_size"""
+    src_w, src_h = source_size
+    dst_w, dst_h = display_size
+    scale = min(dst_w / src_w, dst_h / src_h)
+    scaled = (max(1, min(dst_w, round(src_w * scale))), max(1, min(dst_h, round(src_h * scale))))
+    offset = ((dst_w - scaled[0]) // 2, (dst_h - scaled[1]) // 2)
+    return Layout(source_size, display_size, scaled, offset)
+
+
+class FrameDisplay:
+    """Camera label image that is updated in place instead of rebuilt
+
+    The label's size is tracked from <Configure> events on the Tk thread
+    and published as a single tuple, so the render thread never calls into
+    Tk. The render thread letterboxes each RGB frame into a preallocated
+    buffer (prepare); the Tk thread then pastes that buffer into a
+    PhotoImage kept per display size (present). A frame that arrives
+    while the previous one is still waiting for the Tk thread is dropped,
+    so the buffer is never overwritten mid-paste and after() callbacks never
+    pile up.
+    """
+
+    def __init__(self, label, default_size=(640, 480)):
+        self.label = label
+        self.photo = None
+        self.photo_size = None
+
+        # Replaced whole by the Tk thread, read by the render thread
+        self.display_size = default_size
+        self.label.bind("<Configure>", self.on_configure, add="+")
+
+        self.layout = None
+        self.rgb = None  # RGB buffer at display size, handed to the Tk thread
+        self.view = None  # Region of rgb the frame is scaled into
+        self.pending = threading.Event()
+
+        self.presented = 0
+        self.dropped = 0
+
+    @property
+    def size(self):
+        """Size of the prepared buffer, or None before the first frame"""
+        return self.layout.display_size if self.layout else None
+
+    def on_configure(self, event):
+        """Tk thread: record the drawable area of the label"""
+        # The image must fit inside the border, or the label would grow to fit it
+        inset = 2 * (int(self.label.cget("borderwidth")) + int(self.label.cget("highlightthickness")))
+        width = event.width - inset
+        height = event.height - inset
+        if width > 1 and height > 1:
+            self.display_size = (width, height)
+
+    def _ensure_layout(self, source_size, display_size):
+        layout = self.layout
+        if layout and layout.source_size == source_size and layout.display_size == display_size:
+            return
+
+        layout = compute_layout(source_size, display_size)
+        if self.layout is None or self.layout.display_size != display_size:
+            # Letterbox bars stay black because only the view is ever written
+            self.rgb = np.zeros((display_size[1], display_size[0], 3), np.uint8)
+        else:
+            self.rgb[...] = 0
+
+        x, y = layout.offset
+        w, h = layout.scaled_size
+        self.view = self.rgb[y:y + h, x:x + w]
+        self.layout = layout
+
+    def prepare(self, rgb_frame):
+        """
+        Render thread: scale an RGB frame for display
+
+        Args:
+            rgb_frame (np.ndarray): Annotated frame
+
+        Returns:
+            bool: True if a present() call should be scheduled on the Tk thread
+        """
+        if self.pending.is_set():
+            self.dropped += 1
+            return False
+
+        self._ensure_layout((rgb_frame.shape[1], rgb_frame.shape[0]), self.display_size)
+
+        # A plain copy when no scaling is needed: the pipeline reuses rgb_frame's buffer
+        resize_into(rgb_frame, self.view)
+
+        self.pending.set()
+        return True
+
+    def present(self):
+        """Tk thread: paste the prepared buffer into the label's PhotoImage"""
+        try:
+            if self.rgb is None:
+                return
+
+            size = self.size
+            if self.photo is None or self.photo_size != size:
+                self.photo = ImageTk.PhotoImage("RGB", size)
+                self.photo_size = size
+                self.label.config(image=self.photo)
+                self.label.image = self.photo
+
+            # frombuffer wraps the array without copying; paste copies into Tk
+            image = Image.frombuffer("RGB", size, self.rgb, "raw", "RGB", 0, 1)
+            self.photo.paste(image)
+            self.presented += 1
+        finally:
+            self.pending.clear()
+
+    def reset(self):
+        """
+        Tk thread: clear the label and drop the prepared frame, e.g. when the camera stops
+
+        Call once the render thread has stopped. A present() still queued
+        on the Tk thread then finds nothing to paste.
+        """
+        self.layout = None
+        self.rgb = None
+        self.view = None
+        self.photo = None
+        self.photo_size = None
+        self.label.config(image="")
+        self.label.image = None
+        self.pending.clear()
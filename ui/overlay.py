@@ -0,0 +1,146 @@
+"""
+Overlay
+Cached static annotation layers and the per-frame skeleton drawing
+"""
+from collections import namedtuple
+
+import cv2
+import numpy as np
+
+# Negative origin coordinates are measured from the right/bottom edge
+TextItem = namedtuple("TextItem", ["text", "origin", "scale", "color", "thickness"])
+
+# connections: (start, end) landmark pairs; joints: (landmark, colour, radius)
+Skeleton = namedtuple("Skeleton", ["connections", "joints"])
+
+# Colours are RGB: frames are annotated after FramePreparer's conversion
+WHITE = (255, 255, 255)
+GREEN = (0, 255, 0)
+YELLOW = (255, 255, 0)
+CYAN = (0, 255, 255)
+
+MOCK_LAYER = (
+    TextItem("MOCK MODE", (-150, 40), 0.7, YELLOW, 2),
+)
+
+# Style per position in an angle triplet: outer joint, vertex, end joint
+# (shoulder, elbow, wrist for the arm machines)
+TRIPLET_STYLES = ((GREEN, 10), (CYAN, 12), (YELLOW, 8))
+
+
+def guide_layer(joints):
+    """
+    Static positioning hint for an exercise
+
+    Args:
+        joints (list): Joint names, e.g. EXERCISE_ANGLES[...]["joints_to_track"]
+
+    Returns:
+        tuple: TextItems for OverlayCompositor.add_layer
+    """
+    return (
+        TextItem("ADJUST POSITION", (20, 40), 0.8, WHITE, 2),
+        TextItem(f"KEEP {', '.join(joints).upper()} VISIBLE", (20, 70), 0.7, WHITE, 2),
+    )
+
+
+def skeleton_for(triplets):
+    """
+    Lines and joints to draw for an exercise's angle triplets
+
+    Args:
+        triplets: (a, b, c) landmark triplets with b the vertex, e.g.
+            AngleTable.triplets or the values of EXERCISE_ANGLES[...]["landmarks"]
+
+    Returns:
+        Skeleton: Each triplet drawn as a-b and b-c, each landmark once
+    """
+    connections = []
+    joints = {}
+    for triplet in triplets:
+        a, b, c = (int(index) for index in triplet)
+        connections += [(a, b), (b, c)]
+        for index, style in zip((a, b, c), TRIPLET_STYLES):
+            joints.setdefault(index, style)
+    return Skeleton(tuple(connections),
+                    tuple((index, color, radius) for index, (color, radius) in joints.items()))
+
+
+def _resolve_origin(origin, width, height):
+    x, y = origin
+    return (x + width if x < 0 else x, y + height if y < 0 else y)
+
+
+class OverlayCompositor:
+    """Blends static text layers from a cache instead of re-rasterizing them
+
+    The enabled layers are rendered once per frame size: each text item
+    becomes a premultiplied colour patch and a matching inverse-alpha
+    patch, cropped to the pixels it covers. Each frame then gets every
+    patch in a single multiply-add over that small region, which keeps
+    the anti-aliased edges cv2.putText would have drawn.
+    """
+
+    def __init__(self):
+        self.layers = {}
+        self.cache_key = None
+        self.patches = []
+
+    def add_layer(self, name, items):
+        """Register a named layer of TextItems"""
+        self.layers[name] = tuple(items)
+        self.cache_key = None
+
+    def _render(self, shape, names):
+        height, width = shape[:2]
+        self.patches = []
+
+        for name in names:
+            for item in self.layers[name]:
+                origin = _resolve_origin(item.origin, width, height)
+                # Drawing on black gives colour * alpha; drawing white gives alpha
+                color = np.zeros(shape, dtype=np.uint8)
+                alpha = np.zeros(shape, dtype=np.uint8)
+                cv2.putText(color, item.text, origin, cv2.FONT_HERSHEY_SIMPLEX,
+                            item.scale, item.color, item.thickness)
+                cv2.putText(alpha, item.text, origin, cv2.FONT_HERSHEY_SIMPLEX,
+                            item.scale, WHITE, item.thickness)
+
+                x, y, w, h = cv2.boundingRect(alpha[..., 0])
+                if w == 0 or h == 0:
+                    continue
+                box = (slice(y, y + h), slice(x, x + w))
+                self.patches.append((box, color[box].copy(), 255 - alpha[box]))
+
+    def apply(self, frame, names):
+        """
+        Composite the named layers onto a frame in place
+
+        Args:
+            frame (np.ndarray): (H, W, 3) frame
+            names (tuple): Layers to draw, in drawing order
+        """
+        key = (frame.shape, names)
+        if key != self.cache_key:
+            self._render(frame.shape, names)
+            self.cache_key = key
+
+        for box, color, inverse_alpha in self.patches:
+            region = frame[box]
+            cv2.multiply(region, inverse_alpha, dst=region, scale=1 / 255)
+            cv2.add(region, color, dst=region)
+
+
+def draw_skeleton(frame, landmarks, skeleton):
+    """Draw an exercise's Skeleton from a (33, 4) landmark array"""
+    h, w = frame.shape[:2]
+    points = (landmarks[:, :2] * (w, h)).astype(np.int32)
+
+    for start_idx, end_idx in skeleton.connections:
+        cv2.line(frame, tuple(points[start_idx].tolist()), tuple(points[end_idx].tolist()),
+                 GREEN, 3)
+
+    for idx, color, radius in skeleton.joints:
+        center = tuple(points[idx].tolist())
+        cv2.circle(frame, center, radius, color, -1)
+        cv2.circle(frame, center, radius + 2, WHITE, 2)
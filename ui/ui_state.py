@@ -0,0 +1,78 @@
+"""
+UI State
+Immutable per-frame snapshot of everything the camera page displays
+"""
+from collections import namedtuple
+
+# Display-ready values, so comparing two snapshots tells exactly which
+# widgets need touching (e.g. 121.2° and 121.4° both read "121°")
+UiState = namedtuple("UiState", [
+    "angle_text", "angle_color",
+    "status", "status_color",
+    "feedback_text",
+    "reps_text",
+    "border",
+])
+
+# Camera border modes; "incorrect" blinks
+BORDER_IDLE = "idle"
+BORDER_CORRECT = "correct"
+BORDER_INCORRECT = "incorrect"
+
+
+def format_angle(angle):
+    """Angle label text"""
+    return "No angle" if angle is None else f"{angle:.0f}°"
+
+
+def build_ui_state(monitor, angle, exercise_name, mock_mode):
+    """
+    Snapshot the monitor for display
+
+    Args:
+        monitor (PostureMonitor): Monitor after processing the frame
+        angle (float): Smoothed angle for this frame, or None
+        exercise_name (str): Exercise shown in the feedback panel
+        mock_mode (bool): True when MediaPipe is unavailable
+
+    Returns:
+        UiState: Immutable snapshot
+    """
+    if angle is None:
+        angle_color = "#FF9800"
+        border = BORDER_IDLE
+    elif monitor.posture_correct:
+        angle_color = "#4CAF50"
+        border = BORDER_CORRECT
+    else:
+        angle_color = "#F44336"
+        border = BORDER_INCORRECT
+
+    if mock_mode:
+        feedback_text = (
+            f"⚠ MOCK MODE\n\n"
+            f"Status: {monitor.status}\n"
+            f"Feedback: {monitor.feedback}\n\n"
+            f"Install MediaPipe for real detection:\n"
+            f"pip install mediapipe"
+        )
+    else:
+        rules = monitor.exercise_config
+        target_low, target_high = rules["target_angle_range"] if rules else (160, 175)
+        feedback_text = (
+            f"Exercise: {exercise_name}\n"
+            f"Target Angle: {target_low}° – {target_high}°\n\n"
+            f"Status: {monitor.status}\n"
+            f"Feedback: {monitor.feedback}\n\n"
+            f"Reps: {monitor.rep_count}"
+        )
+
+    return UiState(
+        angle_text=format_angle(angle),
+        angle_color=angle_color,
+        status=monitor.status,
+        status_color=monitor.status_color,
+        feedback_text=feedback_text,
+        reps_text=str(monitor.rep_count),
+        border=border,
+    )
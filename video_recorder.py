@@ -0,0 +1,201 @@
+"""
+Video Recorder
+Saves the annotated camera feed on a background thread
+"""
+import os
+import queue
+import threading
+import time
+
+import cv2
+import numpy as np
+
+
+class AnnotatedVideoRecorder:
+    """Encodes annotated frames with cv2.VideoWriter off the pipeline threads
+
+    submit() never blocks: each frame is copied (or converted, for RGB
+    input) into one of max_queue preallocated buffers and queued; when no
+    buffer is free the encoder has fallen behind and the frame is dropped
+    and counted, so recording cannot slow down capture or inference.
+
+    Output plays back in real time at `fps` whatever rate frames arrive
+    at: each frame is written as many times as its timestamp calls for
+    (repeated when inference runs slower than fps, skipped when faster).
+    Output files rotate when they reach max_bytes or max_seconds of
+    frame time.
+    """
+
+    # Longest gap, in seconds, filled by repeating the frame before it
+    MAX_GAP_SECONDS = 1.0
+
+    def __init__(self, output_dir, fps=30, codec="mp4v", extension=".mp4", max_queue=8,
+                 max_bytes=None, max_seconds=None, prefix="session", rgb_input=False):
+        self.output_dir = output_dir
+        self.fps = fps
+        self.fourcc = cv2.VideoWriter_fourcc(*codec)
+        self.extension = extension
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.prefix = prefix
+        self.rgb_input = rgb_input
+
+        self.queue = queue.Queue()
+        # Buffers are sized on first use, so the pool holds placeholders
+        self.free = queue.Queue()
+        for _ in range(max_queue):
+            self.free.put(None)
+        self.thread = None
+        self.running = False
+
+        self.writer = None
+        self.frame_size = None
+        self.file_index = 0
+        self.file_frames = 0
+        self.file_start = None  # timestamp of the current file's first frame
+        self.next_size_check = 0
+        self.current_path = None
+        self.files = []
+
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.repeated = 0
+        self.skipped = 0
+
+    def start(self):
+        """Start the encoder thread"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="video-recorder", daemon=True)
+        self.thread.start()
+        print(f"✓ Recording annotated video to {self.output_dir}")
+
+    def submit(self, frame, timestamp=None):
+        """
+        Queue an annotated frame for encoding
+
+        The frame is copied, so pooled buffers can be reused right away.
+
+        Args:
+            frame (np.ndarray): Annotated (H, W, 3) frame
+            timestamp (float): Capture time in seconds; None uses the time of submission
+
+        Returns:
+            bool: False if the frame was dropped because no buffer was free
+        """
+        if not self.running:
+            return False
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        self.submitted += 1
+        try:
+            buffer = self.free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return False
+
+        if buffer is None or buffer.shape != frame.shape:
+            buffer = np.empty(frame.shape, dtype=np.uint8)
+        if self.rgb_input:
+            cv2.cvtColor(frame, cv2.COLOR_RGB2BGR, dst=buffer)
+        else:
+            np.copyto(buffer, frame)
+
+        self.queue.put((buffer, timestamp))
+        return True
+
+    def stop(self):
+        """Encode what is queued, then close the current file"""
+        if not self.running:
+            return
+        self.running = False
+        self.queue.put(None)
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=5)
+        print(f"✓ Recording stopped: {self.written} frames written, {self.dropped} dropped")
+
+    def stats(self):
+        """Counters for logging and benchmarking"""
+        return {"submitted": self.submitted, "written": self.written,
+                "dropped": self.dropped, "repeated": self.repeated,
+                "skipped": self.skipped, "files": list(self.files)}
+
+    def _run(self):
+        """Encoder loop"""
+        try:
+            while True:
+                item = self.queue.get()
+                if item is None:
+                    break
+                frame, timestamp = item
+                try:
+                    self._write(frame, timestamp)
+                finally:
+                    self.free.put(frame)
+        except Exception as e:
+            # Later submits must report the frame as not recorded
+            self.running = False
+            print(f"✗ Video recorder error: {e}")
+        finally:
+            self._close_file()
+
+    def _write(self, frame, timestamp):
+        size = (frame.shape[1], frame.shape[0])
+        if self.writer is None or size != self.frame_size or self._should_rotate(timestamp):
+            self._open_file(size)
+            self.file_start = timestamp
+
+        # Frames the file should hold once this one is written, at fps
+        elapsed = timestamp - self.file_start
+        if elapsed < (self.file_frames - 1) / self.fps:
+            # Time went backwards (e.g. a restarted source): carry on from here
+            self.file_start = timestamp - self.file_frames / self.fps
+            elapsed = self.file_frames / self.fps
+        due = int(elapsed * self.fps) + 1
+        copies = min(due - self.file_frames, int(self.MAX_GAP_SECONDS * self.fps) + 1)
+        if copies <= 0:
+            self.skipped += 1
+            return
+
+        for _ in range(copies):
+            self.writer.write(frame)
+        self.written += 1
+        self.repeated += copies - 1
+        self.file_frames += copies
+
+    def _should_rotate(self, timestamp):
+        if self.max_seconds and timestamp - self.file_start >= self.max_seconds:
+            return True
+        # Checking the size once a second is plenty and keeps stat() calls rare
+        if self.max_bytes and self.file_frames >= self.next_size_check:
+            self.next_size_check = self.file_frames + self.fps
+            try:
+                return os.path.getsize(self.current_path) >= self.max_bytes
+            except OSError:
+                return False
+        return False
+
+    def _open_file(self, size):
+        self._close_file()
+
+        self.file_index += 1
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        name = f"{self.prefix}_{stamp}_{self.file_index:03d}{self.extension}"
+        self.current_path = os.path.join(self.output_dir, name)
+
+        self.writer = cv2.VideoWriter(self.current_path, self.fourcc, self.fps, size)
+        if not self.writer.isOpened():
+            self.writer = None
+            raise RuntimeError(f"Cannot open video writer for {self.current_path}")
+
+        self.frame_size = size
+        self.file_frames = 0
+        self.next_size_check = self.fps
+        self.files.append(self.current_path)
+
+    def _close_file(self):
+        if self.writer is not None:
+            self.writer.release()
+            self.writer = None